@@ -44,6 +44,8 @@ Example:
     ```
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
 # Core query and client
@@ -98,12 +100,9 @@ from .preset import (
     preset_to_options_with_tools,
 )
 
-# Providers
+# Providers (concrete provider classes are loaded lazily, see __getattr__)
 from .providers import (
-    AzureOpenAIProvider,
     BaseProvider,
-    ClaudeProvider,
-    OpenAIProvider,
     ProviderRegistry,
     register_provider,
 )
@@ -314,3 +313,20 @@ __all__ = [
     "OpenAIProvider",
     "AzureOpenAIProvider",
 ]
+
+
+if TYPE_CHECKING:
+    from .providers import AzureOpenAIProvider, ClaudeProvider, OpenAIProvider
+
+_LAZY_PROVIDERS = frozenset({"ClaudeProvider", "OpenAIProvider", "AzureOpenAIProvider"})
+
+
+def __getattr__(name: str) -> Any:
+    # Defer provider SDK imports until a concrete provider class is accessed
+    if name in _LAZY_PROVIDERS:
+        from . import providers
+
+        value = getattr(providers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
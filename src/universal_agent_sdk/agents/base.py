@@ -1,5 +1,6 @@
 """Base Agent class for Universal Agent SDK."""
 
+import json
 import uuid
 from collections.abc import AsyncIterator
 from typing import Any
@@ -12,10 +13,12 @@ from ..types import (
     AnyMessage,
     AssistantMessage,
     Message,
+    PermissionResultDeny,
     ResultMessage,
     SystemMessage,
     TextBlock,
     ToolMessage,
+    ToolPermissionContext,
     ToolUseBlock,
     UserMessage,
 )
@@ -233,8 +236,6 @@ class Agent:
 
         # Check permission
         if options.can_use_tool:
-            from ..types import PermissionResultDeny, ToolPermissionContext
-
             context = ToolPermissionContext(session_id=self._agent_id)
             result = await options.can_use_tool(tool_use.name, tool_use.input, context)
             if isinstance(result, PermissionResultDeny):
@@ -253,8 +254,6 @@ class Agent:
 
             if isinstance(result, str):
                 return result
-            import json
-
             return json.dumps(result)
         except Exception as e:
             return f"Error executing tool: {e!s}"
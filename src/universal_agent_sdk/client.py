@@ -1,7 +1,9 @@
 """Universal Agent Client for multi-turn conversations."""
 
 import asyncio
+import json
 import logging
+import time
 import uuid
 from collections.abc import AsyncIterator
 from typing import Any
@@ -18,6 +20,8 @@ from .types import (
     HookOutput,
     Message,
     OnErrorHookInput,
+    PermissionResult,
+    PermissionResultDeny,
     PostToolUseHookInput,
     PreToolUseHookInput,
     ResultMessage,
@@ -26,6 +30,7 @@ from .types import (
     SystemMessage,
     TextBlock,
     ToolMessage,
+    ToolPermissionContext,
     ToolUseBlock,
     UserMessage,
 )
@@ -412,12 +417,6 @@ class UniversalAgentClient:
 
             # Check permission callback (fallback if no hook decision)
             if self.options.can_use_tool and not permission_decision:
-                from .types import (
-                    PermissionResult,
-                    PermissionResultDeny,
-                    ToolPermissionContext,
-                )
-
                 context = ToolPermissionContext(session_id=self._session_id)
                 perm_result_raw = self.options.can_use_tool(
                     tool_use.name, tool_use.input, context
@@ -464,8 +463,6 @@ class UniversalAgentClient:
                 if isinstance(tool_result, str):
                     content = tool_result
                 else:
-                    import json
-
                     content = json.dumps(tool_result)
 
                 # Execute PostToolUse hooks
@@ -539,9 +536,6 @@ class UniversalAgentClient:
         Yields:
             StreamEvent for tool execution start/complete, or bool for continue status
         """
-        import json as json_module
-        import time
-
         for tool_use in tool_uses:
             start_time = time.time()
 
@@ -616,12 +610,6 @@ class UniversalAgentClient:
 
             # Check permission callback (fallback if no hook decision)
             if self.options.can_use_tool and not permission_decision:
-                from .types import (
-                    PermissionResult,
-                    PermissionResultDeny,
-                    ToolPermissionContext,
-                )
-
                 context = ToolPermissionContext(session_id=self._session_id)
                 perm_result_raw = self.options.can_use_tool(
                     tool_use.name, tool_use.input, context
@@ -688,7 +676,7 @@ class UniversalAgentClient:
                 if isinstance(tool_result, str):
                     content = tool_result
                 else:
-                    content = json_module.dumps(tool_result)
+                    content = json.dumps(tool_result)
 
                 # Execute PostToolUse hooks
                 post_tool_input: PostToolUseHookInput = {
@@ -3,7 +3,15 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from ..types import MemoryEntry, MemorySearchResult, Message
+from ..types import (
+    AssistantMessage,
+    MemoryEntry,
+    MemorySearchResult,
+    Message,
+    SystemMessage,
+    TextBlock,
+    UserMessage,
+)
 
 
 class BaseMemory(ABC):
@@ -85,8 +93,6 @@ class BaseMemory(ABC):
         Returns:
             ID of the created entry
         """
-        from ..types import AssistantMessage, SystemMessage, TextBlock, UserMessage
-
         # Extract content from message
         if isinstance(message, UserMessage):
             if isinstance(message.content, str):
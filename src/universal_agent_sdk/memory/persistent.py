@@ -1,15 +1,193 @@
 """Persistent memory for Universal Agent SDK."""
 
+import heapq
 import json
+import mmap
+import os
 import time
-import uuid
+from collections import Counter
+from collections.abc import Iterable
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from secrets import token_hex
+from typing import Any, BinaryIO
 
 from ..errors import MemoryError
 from ..types import MemoryEntry, MemorySearchResult
 from .base import BaseMemory
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
+
+
+def _encode_entry(obj: Any) -> dict[str, Any]:
+    """JSON ``default`` hook that serializes MemoryEntry objects on the fly."""
+    if isinstance(obj, MemoryEntry):
+        return {
+            "id": obj.id,
+            "content": obj.content,
+            "metadata": obj.metadata,
+            "embedding": obj.embedding,
+            "timestamp": obj.timestamp,
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(indent=2, default=_encode_entry)
+_LINE_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_encode_entry)
+
+
+def _dump(data: Any, fh: BinaryIO) -> None:
+    """Serialize data as indented JSON into a binary file handle.
+
+    orjson encodes MemoryEntry dataclasses natively; the stdlib fallback
+    streams chunks from ``iterencode`` so the full document is never held
+    in memory as a single string.
+    """
+    if HAS_ORJSON:
+        fh.write(
+            orjson.dumps(
+                data,
+                default=_encode_entry,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        return
+    for chunk in _ENCODER.iterencode(data):
+        fh.write(chunk.encode("utf-8"))
+
+
+def _dumps_line(data: Any) -> bytes:
+    """Serialize data as a single compact JSON line."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data,
+            default=_encode_entry,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (_LINE_ENCODER.encode(data) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_file(path: Path) -> Any:
+    """Deserialize a JSON file.
+
+    With orjson the file is memory-mapped and parsed in place, so the raw
+    bytes are paged in on demand instead of being copied into a Python
+    object first.
+    """
+    if not HAS_ORJSON or path.stat().st_size == 0:
+        return _loads(path.read_bytes())
+    with (
+        path.open("rb") as fh,
+        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        return orjson.loads(view)
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _remove_postings(
+    index: dict[str, set[str]], keys: Iterable[str], entry_id: str
+) -> list[str]:
+    """Remove entry_id from the postings of keys, pruning empty postings.
+
+    Returns:
+        The keys whose postings became empty and were removed
+    """
+    pruned: list[str] = []
+    for key in keys:
+        postings = index.get(key)
+        if postings is None:
+            continue
+        postings.discard(entry_id)
+        if not postings:
+            del index[key]
+            pruned.append(key)
+    return pruned
+
+
+class _VocabTrie:
+    """Character trie over indexed words, used for fuzzy lookups."""
+
+    _END = ""  # Key marking a complete word; never a real character
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: dict[str, Any] = {}
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str) -> None:
+        """Add a word to the trie."""
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[self._END] = word
+
+    def remove(self, word: str) -> None:
+        """Remove a word from the trie, pruning branches left empty."""
+        path = [self._root]
+        for char in word:
+            child = path[-1].get(char)
+            if child is None:
+                return
+            path.append(child)
+        path[-1].pop(self._END, None)
+        for depth in range(len(word), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][word[depth - 1]]
+
+    def fuzzy_get(self, word: str, max_edits: int) -> list[str]:
+        """Return all words within max_edits Levenshtein distance of word.
+
+        Walks the trie carrying one row of the edit-distance matrix per
+        node, so shared prefixes are only computed once and any subtree
+        whose best row value exceeds max_edits is skipped.
+        """
+        matches: list[str] = []
+        columns = range(1, len(word) + 1)
+        stack: list[tuple[dict[str, Any], str, list[int]]] = [
+            (child, char, list(range(len(word) + 1)))
+            for char, child in self._root.items()
+            if char != self._END
+        ]
+        while stack:
+            node, char, prev_row = stack.pop()
+            row = [prev_row[0] + 1]
+            for i in columns:
+                row.append(
+                    min(
+                        row[i - 1] + 1,
+                        prev_row[i] + 1,
+                        prev_row[i - 1] + (word[i - 1] != char),
+                    )
+                )
+            if row[-1] <= max_edits and self._END in node:
+                matches.append(node[self._END])
+            if min(row) <= max_edits:
+                stack.extend(
+                    (child, next_char, row)
+                    for next_char, child in node.items()
+                    if next_char != self._END
+                )
+        return matches
+
 
 class PersistentMemory(BaseMemory):
     """File-based persistent memory storage.
@@ -19,7 +197,7 @@ class PersistentMemory(BaseMemory):
 
     Features:
     - File-based storage (JSON)
-    - Automatic persistence
+    - Automatic persistence via an append-only journal
     - Keyword search
     - Session isolation
 
@@ -34,71 +212,211 @@ class PersistentMemory(BaseMemory):
         memory = PersistentMemory("./memory/session_1.json")
         results = await memory.search("project")
         ```
+
+    With ``auto_save`` enabled, each add or delete appends a single line to
+    a ``<path>.jsonl`` journal instead of rewriting the whole file. The
+    journal is folded into the main file by ``save()``, or automatically
+    once it grows past ``journal_threshold`` records.
     """
 
     def __init__(
         self,
         path: str | Path,
         auto_save: bool = True,
+        journal_threshold: int = 1000,
+        substring_index: bool = False,
     ):
         """Initialize persistent memory.
 
         Args:
             path: Path to the storage file
             auto_save: Whether to automatically save on changes
+            journal_threshold: Number of journaled changes after which the
+                journal is compacted into the storage file
+            substring_index: Whether to maintain a trigram index so the
+                phrase-match bonus in search only scans entries that can
+                contain the query. Worthwhile for large memories.
         """
         self.path = Path(path)
         self.auto_save = auto_save
+        self.journal_threshold = journal_threshold
+        self._journal_path = self.path.with_suffix(self.path.suffix + ".jsonl")
+        self._journal_size = 0
         self._entries: dict[str, MemoryEntry] = {}
         self._modified = False
 
+        # Inverted index: lowercased word -> ids of entries containing it
+        self._inverted: dict[str, set[str]] = {}
+        self._content_words: dict[str, frozenset[str]] = {}
+        self._content_lower: dict[str, str] = {}
+
+        # Optional trigram index: 3-char substring -> ids of entries containing it
+        self.substring_index = substring_index
+        self._trigram_index: dict[str, set[str]] = {}
+
+        # Vocabulary trie for fuzzy search, built on first use
+        self._vocab_trie: _VocabTrie | None = None
+
         # Load existing data
         self._load()
 
     def _load(self) -> None:
-        """Load entries from disk."""
-        if not self.path.exists():
-            return
-
+        """Load entries from disk, replaying any journaled changes."""
         try:
-            data = json.loads(self.path.read_text())
-            for entry_data in data.get("entries", []):
-                entry = MemoryEntry(
-                    id=entry_data["id"],
-                    content=entry_data["content"],
-                    metadata=entry_data.get("metadata", {}),
-                    embedding=entry_data.get("embedding"),
-                    timestamp=entry_data.get("timestamp"),
-                )
-                self._entries[entry.id] = entry
+            if self.path.exists():
+                data = _load_file(self.path)
+                for entry_data in data.get("entries", []):
+                    self._put_entry(self._entry_from_dict(entry_data))
+            if self._journal_path.exists():
+                self._replay_journal()
         except Exception as e:
             raise MemoryError(f"Failed to load memory from {self.path}: {e}") from e
 
+    def _replay_journal(self) -> None:
+        """Apply journaled put/delete records on top of the loaded snapshot."""
+        data = self._journal_path.read_bytes()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            # An unterminated final line means the process died mid-append.
+            # Cut it off (or terminate it, if the record itself is whole) so
+            # that the next append starts on a line of its own.
+            try:
+                _loads(data[complete:])
+            except ValueError:
+                with self._journal_path.open("r+b") as fh:
+                    fh.truncate(complete)
+                data = data[:complete]
+            else:
+                with self._journal_path.open("ab") as fh:
+                    fh.write(b"\n")
+
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            record = _loads(line)
+            if record["op"] == "put":
+                self._put_entry(self._entry_from_dict(record["entry"]))
+            elif record["op"] == "del":
+                self._entries.pop(record["id"], None)
+                self._unindex_entry(record["id"])
+            self._journal_size += 1
+
+    def _append_journal(self, record: dict[str, Any]) -> None:
+        """Append a single change record to the journal."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with self._journal_path.open("ab") as fh:
+                fh.write(_dumps_line(record))
+        except Exception as e:
+            raise MemoryError(
+                f"Failed to write memory journal {self._journal_path}: {e}"
+            ) from e
+        self._journal_size += 1
+
+    def _persist(self, record: dict[str, Any]) -> None:
+        """Persist a single change according to the auto_save policy."""
+        if not self.auto_save:
+            self._modified = True
+            return
+
+        self._append_journal(record)
+        if self._journal_size >= self.journal_threshold:
+            self.save()
+
+    @staticmethod
+    def _entry_from_dict(entry_data: dict[str, Any]) -> MemoryEntry:
+        """Build a MemoryEntry from its serialized form."""
+        return MemoryEntry(
+            id=entry_data["id"],
+            content=entry_data["content"],
+            metadata=entry_data.get("metadata", {}),
+            embedding=entry_data.get("embedding"),
+            timestamp=entry_data.get("timestamp"),
+        )
+
+    def _put_entry(self, entry: MemoryEntry) -> None:
+        """Store an entry and index it, replacing any entry with the same ID."""
+        if entry.id in self._entries:
+            self._unindex_entry(entry.id)
+        self._entries[entry.id] = entry
+        self._index_entry(entry)
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Add an entry's words to the inverted index."""
+        content_lower = entry.content.lower()
+        words = frozenset(content_lower.split())
+        self._content_lower[entry.id] = content_lower
+        self._content_words[entry.id] = words
+        for word in words:
+            postings = self._inverted.get(word)
+            if postings is None:
+                postings = self._inverted[word] = set()
+                if self._vocab_trie is not None:
+                    self._vocab_trie.insert(word)
+            postings.add(entry.id)
+        if self.substring_index:
+            for gram in _trigrams(content_lower):
+                self._trigram_index.setdefault(gram, set()).add(entry.id)
+
+    def _unindex_entry(self, entry_id: str) -> None:
+        """Remove an entry's words from the inverted index."""
+        content_lower = self._content_lower.pop(entry_id, "")
+        words = self._content_words.pop(entry_id, ())
+        for word in _remove_postings(self._inverted, words, entry_id):
+            if self._vocab_trie is not None:
+                self._vocab_trie.remove(word)
+        if self.substring_index:
+            _remove_postings(self._trigram_index, _trigrams(content_lower), entry_id)
+
+    def _fuzzy_postings(self, word: str, max_edits: int) -> set[str]:
+        """Return ids of entries containing a word within max_edits of word."""
+        if self._vocab_trie is None:
+            self._vocab_trie = _VocabTrie(self._inverted)
+        matches = self._vocab_trie.fuzzy_get(word, max_edits)
+        return set().union(*(self._inverted[match] for match in matches))
+
+    def _substring_candidates(self, query_lower: str) -> set[str] | None:
+        """Return ids of entries containing every trigram of the query.
+
+        Returns None when the trigram index is disabled or the query is too
+        short to have trigrams, meaning every entry must be checked directly.
+        """
+        if not self.substring_index or len(query_lower) < 3:
+            return None
+        postings = sorted(
+            (self._trigram_index.get(gram, set()) for gram in _trigrams(query_lower)),
+            key=len,
+        )
+        return set(postings[0]).intersection(*postings[1:])
+
     def _save(self) -> None:
-        """Save entries to disk."""
+        """Save entries to disk and discard the journal."""
         if not self._modified:
             return
 
         # Ensure parent directory exists
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-        entries_data = [
-            {
-                "id": entry.id,
-                "content": entry.content,
-                "metadata": entry.metadata,
-                "embedding": entry.embedding,
-                "timestamp": entry.timestamp,
-            }
-            for entry in self._entries.values()
-        ]
+        # Entries are encoded one at a time by the serializer's default hook
+        data = {"entries": list(self._entries.values()), "updated_at": time.time()}
 
-        data = {"entries": entries_data, "updated_at": time.time()}
+        # Write a temporary file and atomically swap it in, so a crash
+        # mid-write leaves the previous snapshot intact
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
 
         try:
-            self.path.write_text(json.dumps(data, indent=2))
+            with tmp_path.open("wb") as fh:
+                _dump(data, fh)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self.path)
+            # Replaying a stale journal over the new snapshot is idempotent,
+            # so a crash before this unlink cannot lose or resurrect entries.
+            self._journal_path.unlink(missing_ok=True)
+            self._journal_size = 0
             self._modified = False
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             raise MemoryError(f"Failed to save memory to {self.path}: {e}") from e
 
     async def add(self, content: str, metadata: dict[str, Any] | None = None) -> str:
@@ -111,7 +429,7 @@ class PersistentMemory(BaseMemory):
         Returns:
             ID of the created entry
         """
-        entry_id = str(uuid.uuid4())
+        entry_id = token_hex(16)
         entry = MemoryEntry(
             id=entry_id,
             content=content,
@@ -119,11 +437,8 @@ class PersistentMemory(BaseMemory):
             timestamp=time.time(),
         )
 
-        self._entries[entry_id] = entry
-        self._modified = True
-
-        if self.auto_save:
-            self._save()
+        self._put_entry(entry)
+        self._persist({"op": "put", "entry": entry})
 
         return entry_id
 
@@ -139,13 +454,21 @@ class PersistentMemory(BaseMemory):
         return self._entries.get(entry_id)
 
     async def search(
-        self, query: str, limit: int = 10, **kwargs: Any
+        self,
+        query: str,
+        limit: int = 10,
+        fuzzy: bool = False,
+        max_edits: int = 1,
+        **kwargs: Any,
     ) -> list[MemorySearchResult]:
         """Search memory using keyword matching.
 
         Args:
             query: Search query
             limit: Maximum number of results
+            fuzzy: Whether query words also match indexed words within
+                max_edits edits (insertions, deletions or substitutions)
+            max_edits: Maximum edit distance for fuzzy matches
             **kwargs: Unused
 
         Returns:
@@ -154,25 +477,36 @@ class PersistentMemory(BaseMemory):
         query_lower = query.lower()
         query_words = set(query_lower.split())
 
-        results: list[MemorySearchResult] = []
+        # Sort keys (-score, -timestamp, id), ranked without building results
+        scored: list[tuple[float, float, str]] = []
 
-        for entry in self._entries.values():
-            content_lower = entry.content.lower()
-            content_words = set(content_lower.split())
+        # Count matching query words per entry straight from the postings;
+        # entries sharing no word with the query are never visited.
+        if fuzzy:
+            postings = (self._fuzzy_postings(word, max_edits) for word in query_words)
+        else:
+            postings = (self._inverted.get(word, set()) for word in query_words)
+        match_counts = Counter(chain.from_iterable(postings))
 
-            # Calculate simple keyword overlap score
-            matching_words = query_words & content_words
-            if matching_words:
-                score = len(matching_words) / len(query_words)
+        substring_ids = self._substring_candidates(query_lower)
 
-                if query_lower in content_lower:
-                    score = min(1.0, score + 0.2)
+        for entry_id, matches in match_counts.items():
+            # Calculate simple keyword overlap score
+            score = matches / len(query_words)
 
-                results.append(MemorySearchResult(entry=entry, score=score))
+            if (
+                substring_ids is None or entry_id in substring_ids
+            ) and query_lower in self._content_lower[entry_id]:
+                score = min(1.0, score + 0.2)
 
-        results.sort(key=lambda r: (-r.score, -(r.entry.timestamp or 0)))
+            timestamp = self._entries[entry_id].timestamp or 0
+            scored.append((-score, -timestamp, entry_id))
 
-        return results[:limit]
+        # Only the top `limit` candidates are fully ordered
+        return [
+            MemorySearchResult(entry=self._entries[entry_id], score=-neg_score)
+            for neg_score, _, entry_id in heapq.nsmallest(limit, scored)
+        ]
 
     async def delete(self, entry_id: str) -> bool:
         """Delete an entry by ID.
@@ -185,10 +519,8 @@ class PersistentMemory(BaseMemory):
         """
         if entry_id in self._entries:
             del self._entries[entry_id]
-            self._modified = True
-
-            if self.auto_save:
-                self._save()
+            self._unindex_entry(entry_id)
+            self._persist({"op": "del", "id": entry_id})
 
             return True
         return False
@@ -196,6 +528,11 @@ class PersistentMemory(BaseMemory):
     async def clear(self) -> None:
         """Clear all entries from memory."""
         self._entries.clear()
+        self._inverted.clear()
+        self._content_words.clear()
+        self._content_lower.clear()
+        self._trigram_index.clear()
+        self._vocab_trie = None
         self._modified = True
 
         if self.auto_save:
@@ -207,12 +544,18 @@ class PersistentMemory(BaseMemory):
         return len(self._entries)
 
     def save(self) -> None:
-        """Manually save to disk."""
+        """Manually save to disk, folding journaled changes into the file."""
         self._modified = True
         self._save()
 
     def reload(self) -> None:
         """Reload from disk, discarding unsaved changes."""
         self._entries.clear()
+        self._inverted.clear()
+        self._content_words.clear()
+        self._content_lower.clear()
+        self._trigram_index.clear()
+        self._vocab_trie = None
+        self._journal_size = 0
         self._modified = False
         self._load()
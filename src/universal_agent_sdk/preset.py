@@ -20,11 +20,16 @@ Example usage:
     ```
 """
 
+import copy
 import json
+import logging
 import os
+import re
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, cast, get_args
 
 from .types import (
     AgentDefinition,
@@ -41,6 +46,8 @@ from .types import (
 if TYPE_CHECKING:
     from .client import UniversalAgentClient
 
+logger = logging.getLogger(__name__)
+
 # Try to import yaml, but make it optional
 try:
     import yaml
@@ -50,6 +57,14 @@ except ImportError:
     YAML_AVAILABLE = False
 
 
+# Matches ${VAR} references in preset values
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+# Allowed values for enumerated preset fields, derived once from their types
+_VALID_SETTING_SOURCES: frozenset[str] = frozenset(get_args(SettingSource))
+_VALID_PERMISSION_MODES: frozenset[str] = frozenset(get_args(PermissionMode))
+
+
 class PresetLoadError(Exception):
     """Error loading a preset configuration."""
 
@@ -74,7 +89,22 @@ def load_preset(path: str | Path) -> AgentPreset:
     if not path.exists():
         raise FileNotFoundError(f"Preset file not found: {path}")
 
-    suffix = path.suffix.lower()
+    stat = path.stat()
+    data = _read_preset_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    # Parse from a private copy: the cached document must not be shared with
+    # the returned preset, and env vars are expanded afresh on every load.
+    return parse_preset_data(copy.deepcopy(data), source_path=str(path))
+
+
+@lru_cache(maxsize=256)
+def _read_preset_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Read and decode a preset file.
+
+    Cached on the file's modification time and size so repeated loads of an
+    unchanged file skip YAML/JSON parsing.
+    """
+    suffix = Path(path).suffix.lower()
 
     with open(path, encoding="utf-8") as f:
         if suffix in (".yaml", ".yml"):
@@ -97,7 +127,7 @@ def load_preset(path: str | Path) -> AgentPreset:
                 f"Unsupported file format: {suffix}. Use .yaml, .yml, or .json"
             )
 
-    return parse_preset_data(data, source_path=str(path))
+    return data
 
 
 def load_preset_from_string(
@@ -317,13 +347,13 @@ def _parse_setting_sources(data: list[Any]) -> list[SettingSource]:
             f"setting_sources must be a list, got {type(data).__name__}"
         )
 
-    valid_sources: set[str] = {"user", "project", "local"}
     sources: list[SettingSource] = []
 
     for source in data:
-        if source not in valid_sources:
+        if source not in _VALID_SETTING_SOURCES:
             raise PresetLoadError(
-                f"Invalid setting source: {source}. Must be one of: {valid_sources}"
+                f"Invalid setting source: {source}. "
+                f"Must be one of: {set(get_args(SettingSource))}"
             )
         sources.append(source)  # type: ignore[arg-type]
 
@@ -335,10 +365,10 @@ def _parse_permission_mode(data: str | None) -> PermissionMode | None:
     if data is None:
         return None
 
-    valid_modes: set[str] = {"ask", "auto_allow", "acceptEdits", "deny_all"}
-    if data not in valid_modes:
+    if data not in _VALID_PERMISSION_MODES:
         raise PresetLoadError(
-            f"Invalid permission_mode: {data}. Must be one of: {valid_modes}"
+            f"Invalid permission_mode: {data}. "
+            f"Must be one of: {set(get_args(PermissionMode))}"
         )
 
     return data  # type: ignore[return-value]
@@ -352,20 +382,14 @@ def _expand_env_var(value: str) -> str:
     if "${" not in value:
         return value
 
-    result = value
-    import re
-
-    for match in re.finditer(r"\$\{([^}]+)\}", value):
-        var_name = match.group(1)
-        var_value = os.environ.get(var_name, "")
-        result = result.replace(match.group(0), var_value)
-
-    return result
+    return _ENV_VAR_PATTERN.sub(lambda m: os.environ.get(m.group(1), ""), value)
 
 
 def _expand_env_vars(data: dict[str, str]) -> dict[str, str]:
     """Expand environment variables in a dictionary of values."""
-    return {k: _expand_env_var(str(v)) for k, v in data.items()}
+    return {
+        k: _expand_env_var(v if isinstance(v, str) else str(v)) for k, v in data.items()
+    }
 
 
 def discover_presets(
@@ -387,27 +411,43 @@ def discover_presets(
             Path.cwd() / ".claude" / "presets",
         ]
 
-    presets: dict[str, AgentPreset] = {}
-
+    candidates: list[Path] = []
     for search_path in search_paths:
         path = Path(search_path)
         if not path.exists() or not path.is_dir():
             continue
 
-        for file_path in path.iterdir():
-            if file_path.suffix.lower() in (".yaml", ".yml", ".json"):
-                try:
-                    preset = load_preset(file_path)
-                    presets[preset.id] = preset
-                except (PresetLoadError, FileNotFoundError) as e:
-                    # Log warning but continue
-                    import logging
+        candidates.extend(
+            file_path
+            for file_path in path.iterdir()
+            if file_path.suffix.lower() in (".yaml", ".yml", ".json")
+        )
+
+    # Parsing is dominated by file I/O and YAML decoding, so load files
+    # concurrently; map() keeps results in search order, letting later
+    # search paths override earlier ones as before.
+    presets: dict[str, AgentPreset] = {}
+    if not candidates:
+        return presets
 
-                    logging.warning(f"Failed to load preset {file_path}: {e}")
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+        for preset in executor.map(_load_preset_or_warn, candidates):
+            if preset is not None:
+                presets[preset.id] = preset
 
     return presets
 
 
+def _load_preset_or_warn(path: Path) -> AgentPreset | None:
+    """Load a preset, logging a warning instead of raising on failure."""
+    try:
+        return load_preset(path)
+    except (PresetLoadError, FileNotFoundError) as e:
+        # Log warning but continue
+        logger.warning(f"Failed to load preset {path}: {e}")
+        return None
+
+
 def get_preset(
     preset_id: str,
     search_paths: list[str | Path] | None = None,
@@ -468,15 +508,9 @@ def create_client_from_preset(
     return UniversalAgentClient(options)
 
 
-def get_builtin_tool(tool_name: str) -> ToolDefinition | None:
-    """Get a built-in tool by name.
-
-    Args:
-        tool_name: Name of the built-in tool (e.g., "Read", "Write", "Bash", "WebSearch")
-
-    Returns:
-        ToolDefinition for the tool, or None if not found
-    """
+@lru_cache(maxsize=1)
+def _builtin_tool_classes() -> dict[str, type]:
+    """Build the name -> class table for built-in tools on first use."""
     # Import here to avoid circular imports
     from .tools.builtin import (
         BashTool,
@@ -492,7 +526,7 @@ def get_builtin_tool(tool_name: str) -> ToolDefinition | None:
     )
 
     # Map tool names to their classes
-    tool_classes: dict[str, type] = {
+    return {
         "Read": ReadTool,
         "ReadTool": ReadTool,
         "Write": WriteTool,
@@ -515,7 +549,17 @@ def get_builtin_tool(tool_name: str) -> ToolDefinition | None:
         "DateTimeTool": DateTimeTool,
     }
 
-    tool_class = tool_classes.get(tool_name)
+
+def get_builtin_tool(tool_name: str) -> ToolDefinition | None:
+    """Get a built-in tool by name.
+
+    Args:
+        tool_name: Name of the built-in tool (e.g., "Read", "Write", "Bash", "WebSearch")
+
+    Returns:
+        ToolDefinition for the tool, or None if not found
+    """
+    tool_class = _builtin_tool_classes().get(tool_name)
     if tool_class is None:
         return None
 
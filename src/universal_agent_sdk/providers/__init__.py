@@ -1,10 +1,32 @@
 """Provider implementations for Universal Agent SDK."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseProvider, ProviderRegistry, register_provider
 
-# Import providers to trigger registration
-from .claude import ClaudeProvider
-from .openai import AzureOpenAIProvider, OpenAIProvider
+if TYPE_CHECKING:
+    from .claude import ClaudeProvider
+    from .openai import AzureOpenAIProvider, OpenAIProvider
+
+# Provider classes are imported on first access (PEP 562) so that a provider's
+# SDK is only loaded when it is used. ProviderRegistry imports them the same
+# way when a provider is requested by name.
+_LAZY_PROVIDERS: dict[str, str] = {
+    "ClaudeProvider": ".claude",
+    "OpenAIProvider": ".openai",
+    "AzureOpenAIProvider": ".openai",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseProvider",
@@ -1,26 +1,168 @@
 """Base provider interface for Universal Agent SDK."""
 
-from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Callable
+import asyncio
+import importlib
+import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import fields
 from typing import Any
 
+from ..errors import ProviderNotFoundError
 from ..types import (
     AgentOptions,
     AnyMessage,
     AssistantMessage,
     ContentBlock,
+    ImageBlock,
     Message,
     ProviderFeatures,
+    SystemMessage,
+    TextBlock,
+    ThinkingBlock,
     ToolDefinition,
+    ToolMessage,
+    ToolResultBlock,
+    ToolUseBlock,
     Usage,
+    UserMessage,
 )
 
+try:
+    import orjson
 
-class BaseProvider(ABC):
-    """Abstract base class for LLM providers."""
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
+
+# Message type -> name of the BaseProvider method that formats it. Looked up
+# by exact type; subclasses are resolved through their MRO on first use.
+_MESSAGE_FORMATTERS: dict[type, str] = {
+    UserMessage: "_format_user_message",
+    AssistantMessage: "_format_assistant_message",
+    SystemMessage: "_format_system_message",
+    ToolMessage: "_format_tool_message",
+}
+
+
+def _format_text_block(block: TextBlock) -> dict[str, Any]:
+    return {"type": "text", "text": block.text}
+
+
+def _format_image_block(block: ImageBlock) -> dict[str, Any]:
+    return {
+        "type": "image",
+        "source": block.source,
+        "media_type": block.media_type,
+    }
+
+
+def _format_tool_use_block(block: ToolUseBlock) -> dict[str, Any]:
+    return {
+        "type": "tool_use",
+        "id": block.id,
+        "name": block.name,
+        "input": block.input,
+    }
+
+
+def _format_tool_result_block(block: ToolResultBlock) -> dict[str, Any]:
+    return {
+        "type": "tool_result",
+        "tool_use_id": block.tool_use_id,
+        "content": block.content,
+        "is_error": block.is_error,
+    }
+
+
+def _format_thinking_block(block: ThinkingBlock) -> dict[str, Any]:
+    return {
+        "type": "thinking",
+        "thinking": block.thinking,
+    }
+
+
+# Content block type -> default wire formatter
+_BLOCK_FORMATTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    TextBlock: _format_text_block,
+    ImageBlock: _format_image_block,
+    ToolUseBlock: _format_tool_use_block,
+    ToolResultBlock: _format_tool_result_block,
+    ThinkingBlock: _format_thinking_block,
+}
+
+
+def _config_key(config: dict[str, Any]) -> str:
+    """Build an order-independent cache key for a provider config.
+
+    Values that are not JSON-serializable (clients, callables) fall back to
+    ``repr``, so distinct objects produce distinct keys.
+    """
+    try:
+        return json.dumps(config, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        # Keys of mixed types cannot be sorted, and cycles cannot be encoded
+        return repr(sorted(config.items(), key=lambda item: repr(item[0])))
+
+
+def _find_formatter(table: dict[type, Any], obj: object) -> Any:
+    """Slow-path lookup for instances of subclasses of the table's types.
+
+    Walks the MRO so the closest registered base wins, then caches the result
+    under the subclass so later lookups take the exact-type path.
+    """
+    obj_type = type(obj)
+    for cls in obj_type.__mro__[1:]:
+        formatter = table.get(cls)
+        if formatter is not None:
+            table[obj_type] = formatter
+            return formatter
+    return None
+
+
+def _loop_pool(
+    pools: dict[asyncio.AbstractEventLoop, dict[Any, Any]],
+    loop: asyncio.AbstractEventLoop,
+) -> dict[Any, Any]:
+    """Return the pool of objects shared on ``loop``, creating it if needed.
+
+    Pooled clients hold transports that reference their loop, so weak keys
+    would never be released. Pools are held strongly instead, and those of
+    closed loops are dropped whenever a new loop asks for its pool.
+    """
+    pool = pools.get(loop)
+    if pool is None:
+        for closed in [other for other in pools if other.is_closed()]:
+            del pools[closed]
+        pool = pools[loop] = {}
+    return pool
+
+
+# Sentinel for dict lookups where a stored 0 or None is meaningful
+_MISSING: Any = object()
+
+# Field names of ProviderFeatures; anything else is never supported
+_VALID_FEATURES = frozenset(f.name for f in fields(ProviderFeatures))
+
+# Methods every provider must override; checked by register_provider
+_REQUIRED_METHODS = ("get_features", "complete", "stream")
+
+
+class BaseProvider:
+    """Base class for LLM providers.
+
+    Subclasses must implement get_features, complete and stream.
+    """
+
+    # Subclasses that add instance attributes should declare their own
+    # __slots__ to keep instances free of a __dict__.
+    __slots__ = ("config", "_enabled_features")
 
     name: str = "base"
     config: dict[str, Any]
+    # Names of the truthy fields of get_features(), computed on first use
+    _enabled_features: frozenset[str] | None
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the provider with configuration.
@@ -29,22 +171,21 @@ class BaseProvider(ABC):
             config: Provider-specific configuration
         """
         self.config = config or {}
+        self._enabled_features = None
         self._validate_config()
 
-    def _validate_config(self) -> None:  # noqa: B027
+    def _validate_config(self) -> None:
         """Validate provider configuration. Override in subclasses."""
         pass
 
-    @abstractmethod
     def get_features(self) -> ProviderFeatures:
         """Get the features supported by this provider.
 
         Returns:
             ProviderFeatures object describing capabilities
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def complete(
         self,
         messages: list[Message],
@@ -59,9 +200,8 @@ class BaseProvider(ABC):
         Returns:
             AssistantMessage with the completion
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def stream(
         self,
         messages: list[Message],
@@ -76,7 +216,35 @@ class BaseProvider(ABC):
         Yields:
             Stream of messages including StreamEvents, AssistantMessage, and ResultMessage
         """
-        ...
+        raise NotImplementedError
+
+    async def abatch(
+        self,
+        requests: list[tuple[list[Message], AgentOptions]],
+        max_concurrency: int = 10,
+    ) -> list[AssistantMessage | BaseException]:
+        """Run several completions concurrently.
+
+        Args:
+            requests: (messages, options) pairs, one per completion
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One entry per request, in order: the AssistantMessage, or the
+            exception that request raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(
+            messages: list[Message], options: AgentOptions
+        ) -> AssistantMessage:
+            async with semaphore:
+                return await self.complete(messages, options)
+
+        return await asyncio.gather(
+            *(run(messages, options) for messages, options in requests),
+            return_exceptions=True,
+        )
 
     # ==========================================================================
     # Format Conversion Methods - Override for provider-specific formats
@@ -86,34 +254,50 @@ class BaseProvider(ABC):
         """Convert SDK messages to provider-specific format.
 
         Args:
-            messages: List of SDK Message objects
+            messages: List of SDK Message objects. Messages that are already
+                provider-formatted dicts are passed through unchanged.
 
         Returns:
             List of provider-formatted message dictionaries
         """
-        return [self.format_message(msg) for msg in messages]
+        return list(map(self.format_message, messages))
+
+    def format_messages_bytes(self, messages: list[Message]) -> bytes:
+        """Serialize the output of format_messages to a UTF-8 JSON body.
+
+        For callers that send requests over their own transport. Uses orjson
+        when it is installed, which encodes straight to bytes without an
+        intermediate str.
+
+        Args:
+            messages: List of SDK Message objects
+
+        Returns:
+            Compact JSON bytes
+        """
+        formatted = self.format_messages(messages)
+        if HAS_ORJSON:
+            return orjson.dumps(formatted)
+        return json.dumps(formatted, ensure_ascii=False, separators=(",", ":")).encode()
 
     def format_message(self, message: Message) -> dict[str, Any]:
         """Convert a single SDK message to provider format.
 
         Args:
-            message: SDK Message object
+            message: SDK Message object, or an already formatted dict
 
         Returns:
             Provider-formatted message dictionary
         """
-        from ..types import AssistantMessage, SystemMessage, ToolMessage, UserMessage
-
-        if isinstance(message, UserMessage):
-            return self._format_user_message(message)
-        elif isinstance(message, AssistantMessage):
-            return self._format_assistant_message(message)
-        elif isinstance(message, SystemMessage):
-            return self._format_system_message(message)
-        elif isinstance(message, ToolMessage):
-            return self._format_tool_message(message)
-        else:
-            raise ValueError(f"Unknown message type: {type(message)}")
+        # Resolved on the instance so that overrides and patches take effect
+        method_name = _MESSAGE_FORMATTERS.get(type(message))
+        if method_name is None:
+            if type(message) is dict:
+                return message
+            method_name = _find_formatter(_MESSAGE_FORMATTERS, message)
+            if method_name is None:
+                raise ValueError(f"Unknown message type: {type(message)}")
+        return getattr(self, method_name)(message)
 
     def _format_user_message(self, message: Any) -> dict[str, Any]:
         """Format user message. Override for provider-specific format."""
@@ -133,60 +317,42 @@ class BaseProvider(ABC):
 
     def _format_tool_message(self, message: Any) -> dict[str, Any]:
         """Format tool message. Override for provider-specific format."""
-        return {
-            "role": "tool",
-            "content": message.content,
-            "tool_call_id": message.tool_call_id,
-        }
+        formatted = {"role": "tool", "content": message.content}
+        # Some APIs reject an explicit null id, so leave the key out instead
+        tool_call_id = message.tool_call_id
+        if tool_call_id is not None:
+            formatted["tool_call_id"] = tool_call_id
+        return formatted
 
     def _format_content_blocks(self, blocks: list[ContentBlock]) -> Any:
         """Format content blocks. Override for provider-specific format."""
-        from ..types import (
-            ImageBlock,
-            TextBlock,
-            ThinkingBlock,
-            ToolResultBlock,
-            ToolUseBlock,
-        )
-
-        result: list[dict[str, Any]] = []
+        # Most turns carry a single text block; skip the generator for those,
+        # unless a subclass customizes block formatting through it
+        if (
+            len(blocks) == 1
+            and type(self)._iter_content_blocks is BaseProvider._iter_content_blocks
+        ):
+            block = blocks[0]
+            formatter = _BLOCK_FORMATTERS.get(type(block))
+            if formatter is not None:
+                return [formatter(block)]
+        return list(self._iter_content_blocks(blocks))
+
+    def _iter_content_blocks(
+        self, blocks: list[ContentBlock]
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily format content blocks, skipping unknown block types.
+
+        Use this instead of _format_content_blocks when the result is consumed
+        once, e.g. when streaming straight into a serializer.
+        """
         for block in blocks:
-            if isinstance(block, TextBlock):
-                result.append({"type": "text", "text": block.text})
-            elif isinstance(block, ImageBlock):
-                result.append(
-                    {
-                        "type": "image",
-                        "source": block.source,
-                        "media_type": block.media_type,
-                    }
-                )
-            elif isinstance(block, ToolUseBlock):
-                result.append(
-                    {
-                        "type": "tool_use",
-                        "id": block.id,
-                        "name": block.name,
-                        "input": block.input,
-                    }
-                )
-            elif isinstance(block, ToolResultBlock):
-                result.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": block.tool_use_id,
-                        "content": block.content,
-                        "is_error": block.is_error,
-                    }
-                )
-            elif isinstance(block, ThinkingBlock):
-                result.append(
-                    {
-                        "type": "thinking",
-                        "thinking": block.thinking,
-                    }
-                )
-        return result
+            formatter = _BLOCK_FORMATTERS.get(type(block))
+            if formatter is None:
+                formatter = _find_formatter(_BLOCK_FORMATTERS, block)
+                if formatter is None:
+                    continue
+            yield formatter(block)
 
     def format_tools(self, tools: list[ToolDefinition]) -> list[dict[str, Any]]:
         """Convert SDK tools to provider-specific format.
@@ -197,7 +363,7 @@ class BaseProvider(ABC):
         Returns:
             List of provider-formatted tool dictionaries
         """
-        return [self.format_tool(tool) for tool in tools]
+        return list(map(self.format_tool, tools))
 
     def format_tool(self, tool: ToolDefinition) -> dict[str, Any]:
         """Convert a single tool to provider format. Override for provider-specific format."""
@@ -242,11 +408,17 @@ class BaseProvider(ABC):
         Returns:
             Usage object
         """
+        # Accept both OpenAI-style (prompt/completion) and Anthropic-style
+        # (input/output) keys; an explicit 0 under the first name is kept.
+        prompt_tokens = usage_data.get("prompt_tokens", _MISSING)
+        if prompt_tokens is _MISSING:
+            prompt_tokens = usage_data.get("input_tokens", 0)
+        completion_tokens = usage_data.get("completion_tokens", _MISSING)
+        if completion_tokens is _MISSING:
+            completion_tokens = usage_data.get("output_tokens", 0)
         return Usage(
-            prompt_tokens=usage_data.get("prompt_tokens", 0)
-            or usage_data.get("input_tokens", 0),
-            completion_tokens=usage_data.get("completion_tokens", 0)
-            or usage_data.get("output_tokens", 0),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
             total_tokens=usage_data.get("total_tokens", 0),
         )
 
@@ -267,61 +439,110 @@ class BaseProvider(ABC):
         Returns:
             True if feature is supported
         """
-        features = self.get_features()
-        return getattr(features, feature, False)
+        if feature not in _VALID_FEATURES:
+            return False
+        enabled = self._enabled_features
+        if enabled is None:
+            features = self.get_features()
+            enabled = self._enabled_features = frozenset(
+                name for name in _VALID_FEATURES if getattr(features, name)
+            )
+        return feature in enabled
+
+
+# Modules defining the built-in providers, imported on first lookup
+_BUILTIN_PROVIDER_MODULES: dict[str, str] = {
+    "claude": ".claude",
+    "anthropic": ".claude",
+    "openai": ".openai",
+    "azure_openai": ".openai",
+}
+
+
+_PROVIDERS: dict[str, type[BaseProvider]] = {}
+# Instances are shared by every caller with the same name and config, also
+# across concurrent queries and event loops. Providers look up loop-bound
+# clients per call, and their per-instance caches only hold results that are
+# checked against their inputs before reuse.
+_INSTANCES: OrderedDict[tuple[str, str | None], BaseProvider] = OrderedDict()
+# Least recently used instances beyond this are dropped, so per-request
+# configs in long-running services don't accumulate clients forever.
+_MAX_INSTANCES = 64
+
+
+def _register(name: str, provider_class: type[BaseProvider]) -> None:
+    """Register a provider class.
+
+    Args:
+        name: Provider name (e.g., 'claude', 'openai')
+        provider_class: Provider class to register
+    """
+    _PROVIDERS[name] = provider_class
 
 
-class ProviderRegistry:
-    """Registry for managing provider instances."""
+def _get(name: str, config: dict[str, Any] | None = None) -> BaseProvider:
+    """Get or create a provider instance.
 
-    _providers: dict[str, type[BaseProvider]] = {}
-    _instances: dict[str, BaseProvider] = {}
+    Args:
+        name: Provider name
+        config: Optional configuration for new instances
 
-    @classmethod
-    def register(cls, name: str, provider_class: type[BaseProvider]) -> None:
-        """Register a provider class.
+    Returns:
+        Provider instance
 
-        Args:
-            name: Provider name (e.g., 'claude', 'openai')
-            provider_class: Provider class to register
-        """
-        cls._providers[name] = provider_class
+    Raises:
+        ProviderNotFoundError: If provider is not registered
+    """
+    cache_key = (name, _config_key(config) if config else None)
+    instance = _INSTANCES.get(cache_key)
+    if instance is not None:
+        _INSTANCES.move_to_end(cache_key)
+        return instance
+
+    provider_class = _PROVIDERS.get(name)
+    if provider_class is None:
+        _import_builtin(name)
+        provider_class = _PROVIDERS.get(name)
+        if provider_class is None:
+            raise ProviderNotFoundError(name)
 
-    @classmethod
-    def get(cls, name: str, config: dict[str, Any] | None = None) -> BaseProvider:
-        """Get or create a provider instance.
+    instance = _INSTANCES[cache_key] = provider_class(config)
+    if len(_INSTANCES) > _MAX_INSTANCES:
+        _INSTANCES.popitem(last=False)
+    return instance
 
-        Args:
-            name: Provider name
-            config: Optional configuration for new instances
 
-        Returns:
-            Provider instance
+def _list_providers() -> list[str]:
+    """List all registered provider names."""
+    return list(dict.fromkeys([*_PROVIDERS, *_BUILTIN_PROVIDER_MODULES]))
 
-        Raises:
-            ProviderNotFoundError: If provider is not registered
-        """
-        from ..errors import ProviderNotFoundError
 
-        if name not in cls._providers:
-            raise ProviderNotFoundError(name)
+def _is_registered(name: str) -> bool:
+    """Check if a provider is registered."""
+    return name in _PROVIDERS or name in _BUILTIN_PROVIDER_MODULES
+
 
-        # Create new instance if config provided or no cached instance
-        cache_key = f"{name}:{hash(str(config))}" if config else name
-        if cache_key not in cls._instances or config:
-            cls._instances[cache_key] = cls._providers[name](config)
+def _import_builtin(name: str) -> None:
+    """Import the module defining a built-in provider, registering it."""
+    module_name = _BUILTIN_PROVIDER_MODULES.get(name)
+    if module_name is not None:
+        importlib.import_module(module_name, __package__)
 
-        return cls._instances[cache_key]
 
-    @classmethod
-    def list_providers(cls) -> list[str]:
-        """List all registered provider names."""
-        return list(cls._providers.keys())
+class ProviderRegistry:
+    """Registry for managing provider instances.
+
+    A namespace over the module-level registry functions; staticmethods avoid
+    binding a classmethod on every lookup.
+    """
+
+    _providers = _PROVIDERS
+    _instances = _INSTANCES
 
-    @classmethod
-    def is_registered(cls, name: str) -> bool:
-        """Check if a provider is registered."""
-        return name in cls._providers
+    register = staticmethod(_register)
+    get = staticmethod(_get)
+    list_providers = staticmethod(_list_providers)
+    is_registered = staticmethod(_is_registered)
 
 
 def register_provider(name: str) -> Callable[[type[BaseProvider]], type[BaseProvider]]:
@@ -334,6 +555,15 @@ def register_provider(name: str) -> Callable[[type[BaseProvider]], type[BaseProv
     """
 
     def decorator(cls: type[BaseProvider]) -> type[BaseProvider]:
+        missing = [
+            method
+            for method in _REQUIRED_METHODS
+            if getattr(cls, method) is getattr(BaseProvider, method)
+        ]
+        if missing:
+            raise TypeError(
+                f"Provider {cls.__name__!r} must implement: {', '.join(missing)}"
+            )
         ProviderRegistry.register(name, cls)
         cls.name = name
         return cls
@@ -1,7 +1,11 @@
 """Claude (Anthropic) provider implementation."""
 
+import asyncio
+import importlib.util
+import json
+import operator
 import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 from ..errors import AuthenticationError, ProviderError, RateLimitError
@@ -16,35 +20,288 @@ from ..types import (
     ProviderFeatures,
     ResultMessage,
     StreamEvent,
+    SystemMessage,
     TextBlock,
     ThinkingBlock,
     ToolDefinition,
-    ToolResultBlock,
+    ToolMessage,
     ToolUseBlock,
     Usage,
+    UserMessage,
 )
-from .base import BaseProvider, ProviderRegistry, register_provider
+from .base import _BLOCK_FORMATTERS as _BASE_BLOCK_FORMATTERS
+from .base import (
+    _MESSAGE_FORMATTERS,
+    BaseProvider,
+    ProviderRegistry,
+    _find_formatter,
+    _loop_pool,
+    register_provider,
+)
+
+# The anthropic SDK (and httpx/pydantic beneath it) is imported on the first
+# request rather than with this module; see _import_anthropic.
+HAS_ANTHROPIC = importlib.util.find_spec("anthropic") is not None
+anthropic: Any = None
+AsyncAnthropic: Any = None
 
 try:
-    import anthropic
-    from anthropic import AsyncAnthropic
+    import orjson
 
-    HAS_ANTHROPIC = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_ANTHROPIC = False
-    anthropic = None  # type: ignore[assignment]
-    AsyncAnthropic = None  # type: ignore[assignment, misc]
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(raw: str) -> Any:
+    """Parse JSON, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib exception either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Prompt caching marker. Anthropic allows four breakpoints per request; we
+# use at most three: system prompt, last tool and last message.
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+_CACHEABLE_BLOCK_TYPES = frozenset({"text", "image", "tool_use", "tool_result"})
+
+
+def _apply_prompt_caching(kwargs: dict[str, Any]) -> None:
+    """Add cache breakpoints to request kwargs, copying anything it marks.
+
+    Content before a breakpoint is cached by the API and re-read on later
+    requests with the same prefix; prefixes below the model's minimum size
+    are simply not cached.
+    """
+    system = kwargs.get("system")
+    if isinstance(system, str):
+        kwargs["system"] = [
+            {"type": "text", "text": system, "cache_control": _EPHEMERAL_CACHE}
+        ]
+
+    tools = kwargs.get("tools")
+    if tools:
+        kwargs["tools"] = [
+            *tools[:-1],
+            {**tools[-1], "cache_control": _EPHEMERAL_CACHE},
+        ]
+
+    messages = kwargs["messages"]
+    if messages:
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            if not content:
+                return
+            blocks = [{"type": "text", "text": content}]
+        elif content and content[-1].get("type") in _CACHEABLE_BLOCK_TYPES:
+            blocks = list(content)
+        else:
+            return
+        blocks[-1] = {**blocks[-1], "cache_control": _EPHEMERAL_CACHE}
+        kwargs["messages"] = [*messages[:-1], {**last, "content": blocks}]
+
+
+def _format_image_block(block: ImageBlock) -> dict[str, Any]:
+    if block.source.startswith("data:"):
+        # Base64 encoded
+        return {
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": block.media_type,
+                "data": block.base64_data,
+            },
+        }
+    return {"type": "image", "source": {"type": "url", "url": block.source}}
+
+
+def _format_thinking_block(block: ThinkingBlock) -> dict[str, Any]:
+    thinking_block: dict[str, Any] = {"type": "thinking", "thinking": block.thinking}
+    # Include signature if present (required for multi-turn conversations)
+    if block.signature:
+        thinking_block["signature"] = block.signature
+    return thinking_block
+
+
+# Content block type -> Anthropic wire formatter
+_BLOCK_FORMATTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    **_BASE_BLOCK_FORMATTERS,
+    ImageBlock: _format_image_block,
+    ThinkingBlock: _format_thinking_block,
+}
+
+
+def _format_block(block: ContentBlock) -> dict[str, Any] | None:
+    """Format one content block, or return None for unknown block types."""
+    # Text is by far the most common block; skip the table for it
+    if type(block) is TextBlock:
+        return {"type": "text", "text": block.text}
+    formatter = _BLOCK_FORMATTERS.get(type(block))
+    if formatter is None:
+        formatter = _find_formatter(_BLOCK_FORMATTERS, block)
+        if formatter is None:
+            return None
+    return formatter(block)
+
+
+# AsyncAnthropic clients shared by providers with the same connection
+# settings, per event loop since the underlying httpx pool is loop-bound
+_CLIENT_POOLS: dict[asyncio.AbstractEventLoop, dict[tuple[Any, ...], Any]] = {}
+
+
+def _import_anthropic() -> Any:
+    """Import the anthropic SDK on first use and bind the module globals."""
+    global anthropic, AsyncAnthropic
+    if anthropic is None:
+        import anthropic as module
+
+        AsyncAnthropic = module.AsyncAnthropic
+        anthropic = module
+    return anthropic
+
+
+def _shared_client(
+    api_key: str, base_url: str | None, timeout: float, max_retries: int
+) -> Any:
+    """Return an AsyncAnthropic client, reusing one with identical settings.
+
+    Sharing the client lets provider instances reuse open connections instead
+    of each paying for its own TLS handshakes.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    key = (api_key, base_url, timeout, max_retries)
+    pool = _loop_pool(_CLIENT_POOLS, loop) if loop is not None else {}
+    client = pool.get(key)
+    if client is None:
+        client = pool[key] = AsyncAnthropic(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+        )
+    return client
+
+
+# Anthropic response block type -> SDK content block; other types
+# (e.g. redacted_thinking) are dropped
+_BLOCK_PARSERS: dict[str, Callable[[Any], ContentBlock]] = {
+    "text": lambda block: TextBlock(text=block.text),
+    "tool_use": lambda block: ToolUseBlock(
+        id=block.id, name=block.name, input=block.input
+    ),
+    "thinking": lambda block: ThinkingBlock(
+        thinking=block.thinking, signature=getattr(block, "signature", None)
+    ),
+}
+
+# SDK tool_choice -> Anthropic tool_choice; any other value names a tool.
+# Shared between requests, so they must never be mutated.
+_TOOL_CHOICES: dict[str, dict[str, str]] = {
+    "required": {"type": "any"},
+    "none": {"type": "none"},
+    "auto": {"type": "auto"},
+}
+
+# Anthropic stop_reason -> SDK FinishReason; unknown reasons map to STOP
+_STOP_REASONS: dict[str, FinishReason] = {
+    "end_turn": FinishReason.STOP,
+    "max_tokens": FinishReason.LENGTH,
+    "tool_use": FinishReason.TOOL_USE,
+    "stop_sequence": FinishReason.STOP,
+}
+
+# Tools last passed to format_tools and their formatted dicts
+_ToolsCache = tuple[tuple[ToolDefinition, ...], list[dict[str, Any]]]
+
+
+class _StreamState:
+    """Accumulates the final message while a response is streamed."""
+
+    __slots__ = (
+        "content_blocks",
+        "text_parts",
+        "tool_use",
+        "tool_input_parts",
+        "thinking_parts",
+        "thinking_signature",
+        "keep_text",
+        "model",
+        "usage",
+        "stop_reason",
+    )
+
+    def __init__(self, keep_text: bool = True) -> None:
+        # Deltas are collected as lists and joined once per block, since
+        # repeated str += copies the growing buffer on every delta
+        self.content_blocks: list[ContentBlock] = []
+        self.text_parts: list[str] = []
+        self.tool_use: dict[str, Any] | None = None
+        self.tool_input_parts: list[str] = []
+        self.thinking_parts: list[str] = []
+        self.thinking_signature = ""
+        # False when the caller aggregates text deltas itself
+        self.keep_text = keep_text
+        self.model = ""
+        self.usage: Usage | None = None
+        self.stop_reason: str | None = None
+
+
+def _on_text_delta(state: _StreamState, delta: Any) -> dict[str, Any]:
+    if state.keep_text:
+        state.text_parts.append(delta.text)
+    return {"type": "text_delta", "text": delta.text}
+
+
+def _on_input_json_delta(state: _StreamState, delta: Any) -> dict[str, Any]:
+    if state.tool_use:
+        state.tool_input_parts.append(delta.partial_json)
+    return {"type": "input_json_delta", "partial_json": delta.partial_json}
+
+
+def _on_thinking_delta(state: _StreamState, delta: Any) -> dict[str, Any]:
+    # Kept even when discarding text: a tool-use turn sent back with thinking
+    # enabled must include its signed thinking block
+    state.thinking_parts.append(delta.thinking)
+    return {"type": "thinking_delta", "thinking": delta.thinking}
+
+
+def _on_signature_delta(state: _StreamState, delta: Any) -> dict[str, Any]:
+    # Capture thinking signature for multi-turn conversations
+    state.thinking_signature = getattr(delta, "signature", "")
+    return {"type": "signature_delta", "signature": state.thinking_signature}
+
+
+# content_block_delta subtype -> handler returning the StreamEvent delta
+_DELTA_HANDLERS: dict[str, Callable[[_StreamState, Any], dict[str, Any]]] = {
+    "text_delta": _on_text_delta,
+    "input_json_delta": _on_input_json_delta,
+    "thinking_delta": _on_thinking_delta,
+    "signature_delta": _on_signature_delta,
+}
 
 
 @register_provider("claude")
 class ClaudeProvider(BaseProvider):
     """Anthropic Claude provider implementation."""
 
+    __slots__ = ("_client", "_tools_cache")
+
     name = "claude"
 
     def __init__(self, config: dict[str, Any] | None = None):
         super().__init__(config)
+        # A client set here is used instead of the shared per-loop clients
         self._client: Any = None
+        self._tools_cache: _ToolsCache | None = None
 
     def _validate_config(self) -> None:
         if not HAS_ANTHROPIC:
@@ -54,22 +311,24 @@ class ClaudeProvider(BaseProvider):
             )
 
     def _get_client(self) -> Any:
-        """Get or create the Anthropic client."""
-        if self._client is None:
-            api_key = self.config.get("api_key") or os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise AuthenticationError(
-                    "claude",
-                    "ANTHROPIC_API_KEY environment variable or api_key config required",
-                )
-
-            self._client = AsyncAnthropic(
-                api_key=api_key,
-                base_url=self.config.get("base_url"),
-                timeout=self.config.get("timeout", 600.0),
-                max_retries=self.config.get("max_retries", 2),
+        """Get the Anthropic client for the running event loop."""
+        # Also makes anthropic's exception types available to the callers
+        _import_anthropic()
+        if self._client is not None:
+            return self._client
+        api_key = self.config.get("api_key") or os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise AuthenticationError(
+                "claude",
+                "ANTHROPIC_API_KEY environment variable or api_key config required",
             )
-        return self._client
+
+        return _shared_client(
+            api_key,
+            self.config.get("base_url"),
+            self.config.get("timeout", 600.0),
+            self.config.get("max_retries", 2),
+        )
 
     def get_features(self) -> ProviderFeatures:
         return ProviderFeatures(
@@ -99,31 +358,20 @@ class ClaudeProvider(BaseProvider):
         """
         system_prompt: str | None = None
         formatted: list[dict[str, Any]] = []
-
-        from ..types import AssistantMessage, SystemMessage, ToolMessage, UserMessage
+        append = formatted.append
+        dispatch = _MESSAGE_FORMATTERS
 
         for msg in messages:
             if isinstance(msg, SystemMessage):
                 # Anthropic uses separate system parameter
                 system_prompt = msg.content
-            elif isinstance(msg, UserMessage):
-                formatted.append(self._format_user_message(msg))
-            elif isinstance(msg, AssistantMessage):
-                formatted.append(self._format_assistant_message(msg))
-            elif isinstance(msg, ToolMessage):
-                # Anthropic expects tool results as user messages with tool_result content
-                formatted.append(
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": msg.tool_call_id,
-                                "content": msg.content,
-                            }
-                        ],
-                    }
-                )
+                continue
+            method_name = dispatch.get(type(msg))
+            if method_name is not None:
+                append(getattr(self, method_name)(msg))
+            elif isinstance(msg, (UserMessage, AssistantMessage, ToolMessage, dict)):
+                # Subclassed message types and already formatted messages
+                append(self.format_message(msg))
 
         return system_prompt, formatted
 
@@ -140,65 +388,27 @@ class ClaudeProvider(BaseProvider):
             "content": self._format_content_blocks(message.content),
         }
 
+    def _format_tool_message(self, message: Any) -> dict[str, Any]:
+        # Anthropic expects tool results as user messages with tool_result content
+        return {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": message.tool_call_id,
+                    "content": message.content,
+                }
+            ],
+        }
+
     def _format_content_blocks(
         self, blocks: list[ContentBlock]
     ) -> list[dict[str, Any]]:
-        result: list[dict[str, Any]] = []
-        for block in blocks:
-            if isinstance(block, TextBlock):
-                result.append({"type": "text", "text": block.text})
-            elif isinstance(block, ImageBlock):
-                # Anthropic image format
-                if block.source.startswith("data:"):
-                    # Base64 encoded
-                    result.append(
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": block.media_type,
-                                "data": block.source.split(",", 1)[1]
-                                if "," in block.source
-                                else block.source,
-                            },
-                        }
-                    )
-                else:
-                    # URL
-                    result.append(
-                        {
-                            "type": "image",
-                            "source": {"type": "url", "url": block.source},
-                        }
-                    )
-            elif isinstance(block, ToolUseBlock):
-                result.append(
-                    {
-                        "type": "tool_use",
-                        "id": block.id,
-                        "name": block.name,
-                        "input": block.input,
-                    }
-                )
-            elif isinstance(block, ToolResultBlock):
-                result.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": block.tool_use_id,
-                        "content": block.content,
-                        "is_error": block.is_error,
-                    }
-                )
-            elif isinstance(block, ThinkingBlock):
-                thinking_block: dict[str, Any] = {
-                    "type": "thinking",
-                    "thinking": block.thinking,
-                }
-                # Include signature if present (required for multi-turn conversations)
-                if block.signature:
-                    thinking_block["signature"] = block.signature
-                result.append(thinking_block)
-        return result
+        return [
+            formatted
+            for block in blocks
+            if (formatted := _format_block(block)) is not None
+        ]
 
     def format_tools(self, tools: list[ToolDefinition]) -> list[dict[str, Any]]:
         """Convert tools to Anthropic format."""
@@ -211,32 +421,35 @@ class ClaudeProvider(BaseProvider):
             for tool in tools
         ]
 
+    def _format_tools_cached(self, tools: list[ToolDefinition]) -> list[dict[str, Any]]:
+        """Format tools, reusing the last result for the same tool objects.
+
+        Agent loops send the same tool list on every turn. The formatted dicts
+        share each tool's input_schema, so in-place schema edits still show up;
+        the returned list must not be mutated.
+        """
+        cached = self._tools_cache
+        if (
+            cached is not None
+            and len(cached[0]) == len(tools)
+            and all(map(operator.is_, cached[0], tools))
+        ):
+            return cached[1]
+        formatted = self.format_tools(tools)
+        self._tools_cache = (tuple(tools), formatted)
+        return formatted
+
     # ==========================================================================
     # Response Parsing (Anthropic -> SDK)
     # ==========================================================================
 
     def parse_response(self, response: Any) -> AssistantMessage:
         """Parse Anthropic response to SDK AssistantMessage."""
-        content_blocks: list[ContentBlock] = []
-
-        for block in response.content:
-            if block.type == "text":
-                content_blocks.append(TextBlock(text=block.text))
-            elif block.type == "tool_use":
-                content_blocks.append(
-                    ToolUseBlock(
-                        id=block.id,
-                        name=block.name,
-                        input=block.input,
-                    )
-                )
-            elif block.type == "thinking":
-                content_blocks.append(
-                    ThinkingBlock(
-                        thinking=block.thinking,
-                        signature=getattr(block, "signature", None),
-                    )
-                )
+        content_blocks: list[ContentBlock] = [
+            parser(block)
+            for block in response.content
+            if (parser := _BLOCK_PARSERS.get(block.type)) is not None
+        ]
 
         # Map stop reason
         finish_reason = self._map_stop_reason(response.stop_reason)
@@ -250,13 +463,7 @@ class ClaudeProvider(BaseProvider):
     def _map_stop_reason(self, stop_reason: str | None) -> FinishReason | None:
         if stop_reason is None:
             return None
-        mapping = {
-            "end_turn": FinishReason.STOP,
-            "max_tokens": FinishReason.LENGTH,
-            "tool_use": FinishReason.TOOL_USE,
-            "stop_sequence": FinishReason.STOP,
-        }
-        return mapping.get(stop_reason, FinishReason.STOP)
+        return _STOP_REASONS.get(stop_reason, FinishReason.STOP)
 
     def parse_usage(self, usage: Any) -> Usage:
         """Parse Anthropic usage to SDK Usage."""
@@ -270,17 +477,103 @@ class ClaudeProvider(BaseProvider):
         )
 
     # ==========================================================================
-    # Core Methods
+    # Stream Event Handlers
     # ==========================================================================
 
-    async def complete(
-        self,
-        messages: list[Message],
-        options: AgentOptions,
-    ) -> AssistantMessage:
-        """Generate a completion using Claude."""
-        client = self._get_client()
+    def _on_message_start(self, state: _StreamState, event: Any) -> None:
+        state.model = event.message.model
+        if hasattr(event.message, "usage"):
+            state.usage = self.parse_usage(event.message.usage)
+
+    def _on_content_block_start(self, state: _StreamState, event: Any) -> StreamEvent:
+        block = event.content_block
+        # Include tool name and id for tool_use blocks
+        delta_info = {"type": block.type}
+        if block.type == "text":
+            state.text_parts.clear()
+        elif block.type == "tool_use":
+            state.tool_use = {"id": block.id, "name": block.name}
+            state.tool_input_parts.clear()
+            delta_info["id"] = block.id
+            delta_info["name"] = block.name
+        elif block.type == "thinking":
+            state.thinking_parts.clear()
+
+        return StreamEvent(
+            event_type="content_block_start",
+            index=event.index,
+            delta=delta_info,
+        )
+
+    def _on_content_block_delta(
+        self, state: _StreamState, event: Any
+    ) -> StreamEvent | None:
+        delta = event.delta
+        handler = _DELTA_HANDLERS.get(delta.type)
+        if handler is None:
+            return None
+        return StreamEvent(
+            event_type="content_block_delta",
+            index=event.index,
+            delta=handler(state, delta),
+        )
+
+    def _on_content_block_stop(self, state: _StreamState, event: Any) -> StreamEvent:
+        # Finalize current block
+        if state.text_parts:
+            state.content_blocks.append(TextBlock(text="".join(state.text_parts)))
+            state.text_parts.clear()
+        elif state.tool_use:
+            try:
+                input_data = _loads("".join(state.tool_input_parts))
+            except json.JSONDecodeError:
+                input_data = {}
+            state.content_blocks.append(
+                ToolUseBlock(
+                    id=state.tool_use["id"],
+                    name=state.tool_use["name"],
+                    input=input_data,
+                )
+            )
+            state.tool_use = None
+            state.tool_input_parts.clear()
+        elif state.thinking_parts:
+            state.content_blocks.append(
+                ThinkingBlock(
+                    thinking="".join(state.thinking_parts),
+                    signature=state.thinking_signature or None,
+                )
+            )
+            state.thinking_parts.clear()
+            state.thinking_signature = ""
+
+        return StreamEvent(event_type="content_block_stop", index=event.index)
+
+    def _on_message_delta(self, state: _StreamState, event: Any) -> None:
+        state.stop_reason = event.delta.stop_reason
+        if hasattr(event, "usage"):
+            state.usage = self.parse_usage(event.usage)
+
+    # Anthropic stream event type -> handler; unlisted types (message_stop,
+    # ping) are ignored
+    _STREAM_EVENT_HANDLERS: dict[
+        str, Callable[[Any, _StreamState, Any], StreamEvent | None]
+    ] = {
+        "message_start": _on_message_start,
+        "content_block_start": _on_content_block_start,
+        "content_block_delta": _on_content_block_delta,
+        "content_block_stop": _on_content_block_stop,
+        "message_delta": _on_message_delta,
+    }
+
+    # ==========================================================================
+    # Core Methods
+    # ==========================================================================
 
+    def _build_request_kwargs(
+        self, messages: list[Message], options: AgentOptions
+    ) -> dict[str, Any]:
+        """Build the Messages API arguments shared by complete and stream."""
         system_prompt, formatted_messages = self.format_messages(messages)
 
         kwargs: dict[str, Any] = {
@@ -299,19 +592,13 @@ class ClaudeProvider(BaseProvider):
             kwargs["top_p"] = options.top_p
 
         if options.tools:
-            kwargs["tools"] = self.format_tools(options.tools)
-            if options.tool_choice:
-                if options.tool_choice == "required":
-                    kwargs["tool_choice"] = {"type": "any"}
-                elif options.tool_choice == "none":
-                    kwargs["tool_choice"] = {"type": "none"}
-                elif options.tool_choice == "auto":
-                    kwargs["tool_choice"] = {"type": "auto"}
-                else:
-                    kwargs["tool_choice"] = {
-                        "type": "tool",
-                        "name": options.tool_choice,
-                    }
+            kwargs["tools"] = self._format_tools_cached(options.tools)
+            tool_choice = options.tool_choice
+            if tool_choice:
+                kwargs["tool_choice"] = _TOOL_CHOICES.get(tool_choice) or {
+                    "type": "tool",
+                    "name": tool_choice,
+                }
 
         if options.enable_thinking and options.max_thinking_tokens:
             kwargs["thinking"] = {
@@ -319,6 +606,21 @@ class ClaudeProvider(BaseProvider):
                 "budget_tokens": options.max_thinking_tokens,
             }
 
+        if options.prompt_caching:
+            _apply_prompt_caching(kwargs)
+
+        return kwargs
+
+    async def complete(
+        self,
+        messages: list[Message],
+        options: AgentOptions,
+    ) -> AssistantMessage:
+        """Generate a completion using Claude."""
+        client = self._get_client()
+
+        kwargs = self._build_request_kwargs(messages, options)
+
         try:
             response = await client.messages.create(**kwargs)
             return self.parse_response(response)
@@ -341,184 +643,34 @@ class ClaudeProvider(BaseProvider):
         """Stream a completion using Claude."""
         client = self._get_client()
 
-        system_prompt, formatted_messages = self.format_messages(messages)
-
-        kwargs: dict[str, Any] = {
-            "model": options.model or self.get_default_model(),
-            "messages": formatted_messages,
-            "max_tokens": options.max_tokens or 4096,
-        }
-
-        if system_prompt or options.system_prompt:
-            kwargs["system"] = options.system_prompt or system_prompt
-
-        if options.temperature is not None:
-            kwargs["temperature"] = options.temperature
-
-        if options.top_p is not None:
-            kwargs["top_p"] = options.top_p
-
-        if options.tools:
-            kwargs["tools"] = self.format_tools(options.tools)
-            if options.tool_choice:
-                if options.tool_choice == "required":
-                    kwargs["tool_choice"] = {"type": "any"}
-                elif options.tool_choice == "none":
-                    kwargs["tool_choice"] = {"type": "none"}
-                elif options.tool_choice == "auto":
-                    kwargs["tool_choice"] = {"type": "auto"}
-                else:
-                    kwargs["tool_choice"] = {
-                        "type": "tool",
-                        "name": options.tool_choice,
-                    }
-
-        if options.enable_thinking and options.max_thinking_tokens:
-            kwargs["thinking"] = {
-                "type": "enabled",
-                "budget_tokens": options.max_thinking_tokens,
-            }
+        kwargs = self._build_request_kwargs(messages, options)
 
         try:
-            # Collect content blocks during streaming
-            content_blocks: list[ContentBlock] = []
-            current_text = ""
-            current_tool_use: dict[str, Any] | None = None
-            current_thinking = ""
-            current_thinking_signature = ""
-            model = ""
-            usage: Usage | None = None
-            stop_reason: str | None = None
+            state = _StreamState(keep_text=not options.stream_discard_final)
+            handlers = self._STREAM_EVENT_HANDLERS
+            emit_events = options.yield_stream_events
 
             async with client.messages.stream(**kwargs) as stream:
                 async for event in stream:
-                    if event.type == "message_start":
-                        model = event.message.model
-                        if hasattr(event.message, "usage"):
-                            usage = self.parse_usage(event.message.usage)
-
-                    elif event.type == "content_block_start":
-                        block = event.content_block
-                        if block.type == "text":
-                            current_text = ""
-                        elif block.type == "tool_use":
-                            current_tool_use = {
-                                "id": block.id,
-                                "name": block.name,
-                                "input": "",
-                            }
-                        elif block.type == "thinking":
-                            current_thinking = ""
-
-                        # Include tool name and id for tool_use blocks
-                        delta_info = {"type": block.type}
-                        if block.type == "tool_use":
-                            delta_info["id"] = block.id
-                            delta_info["name"] = block.name
-
-                        yield StreamEvent(
-                            event_type="content_block_start",
-                            index=event.index,
-                            delta=delta_info,
-                        )
-
-                    elif event.type == "content_block_delta":
-                        delta = event.delta
-                        if delta.type == "text_delta":
-                            current_text += delta.text
-                            yield StreamEvent(
-                                event_type="content_block_delta",
-                                index=event.index,
-                                delta={"type": "text_delta", "text": delta.text},
-                            )
-                        elif delta.type == "input_json_delta":
-                            if current_tool_use:
-                                current_tool_use["input"] += delta.partial_json
-                            yield StreamEvent(
-                                event_type="content_block_delta",
-                                index=event.index,
-                                delta={
-                                    "type": "input_json_delta",
-                                    "partial_json": delta.partial_json,
-                                },
-                            )
-                        elif delta.type == "thinking_delta":
-                            current_thinking += delta.thinking
-                            yield StreamEvent(
-                                event_type="content_block_delta",
-                                index=event.index,
-                                delta={
-                                    "type": "thinking_delta",
-                                    "thinking": delta.thinking,
-                                },
-                            )
-                        elif delta.type == "signature_delta":
-                            # Capture thinking signature for multi-turn conversations
-                            current_thinking_signature = getattr(delta, "signature", "")
-                            yield StreamEvent(
-                                event_type="content_block_delta",
-                                index=event.index,
-                                delta={
-                                    "type": "signature_delta",
-                                    "signature": current_thinking_signature,
-                                },
-                            )
-
-                    elif event.type == "content_block_stop":
-                        # Finalize current block
-                        if current_text:
-                            content_blocks.append(TextBlock(text=current_text))
-                            current_text = ""
-                        elif current_tool_use:
-                            import json
-
-                            try:
-                                input_data = json.loads(current_tool_use["input"])
-                            except json.JSONDecodeError:
-                                input_data = {}
-                            content_blocks.append(
-                                ToolUseBlock(
-                                    id=current_tool_use["id"],
-                                    name=current_tool_use["name"],
-                                    input=input_data,
-                                )
-                            )
-                            current_tool_use = None
-                        elif current_thinking:
-                            content_blocks.append(
-                                ThinkingBlock(
-                                    thinking=current_thinking,
-                                    signature=current_thinking_signature or None,
-                                )
-                            )
-                            current_thinking = ""
-                            current_thinking_signature = ""
-
-                        yield StreamEvent(
-                            event_type="content_block_stop",
-                            index=event.index,
-                        )
-
-                    elif event.type == "message_delta":
-                        stop_reason = event.delta.stop_reason
-                        if hasattr(event, "usage"):
-                            usage = self.parse_usage(event.usage)
-
-                    elif event.type == "message_stop":
-                        pass
+                    handler = handlers.get(event.type)
+                    if handler is not None:
+                        stream_event = handler(self, state, event)
+                        if stream_event is not None and emit_events:
+                            yield stream_event
 
             # Yield final AssistantMessage
+            finish_reason = self._map_stop_reason(state.stop_reason)
             yield AssistantMessage(
-                content=content_blocks,
-                model=model,
-                finish_reason=self._map_stop_reason(stop_reason),
+                content=state.content_blocks,
+                model=state.model,
+                finish_reason=finish_reason,
             )
 
             # Yield ResultMessage
             yield ResultMessage(
                 is_error=False,
-                usage=usage,
-                finish_reason=self._map_stop_reason(stop_reason),
+                usage=state.usage,
+                finish_reason=finish_reason,
             )
 
         except anthropic.AuthenticationError as e:
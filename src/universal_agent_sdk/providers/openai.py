@@ -1,8 +1,12 @@
 """OpenAI provider implementation."""
 
+import asyncio
+import importlib.util
 import json
+import operator
 import os
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 from ..errors import AuthenticationError, ProviderError, RateLimitError
@@ -17,33 +21,201 @@ from ..types import (
     ProviderFeatures,
     ResultMessage,
     StreamEvent,
+    SystemMessage,
     TextBlock,
     ToolDefinition,
+    ToolMessage,
     ToolUseBlock,
     Usage,
+    UserMessage,
 )
-from .base import BaseProvider, register_provider
+from .base import _BLOCK_FORMATTERS as _BASE_BLOCK_FORMATTERS
+from .base import (
+    BaseProvider,
+    _config_key,
+    _find_formatter,
+    _loop_pool,
+    register_provider,
+)
+
+# The openai SDK (and httpx/pydantic beneath it) is imported on the first
+# request rather than with this module; see _import_openai.
+HAS_OPENAI = importlib.util.find_spec("openai") is not None
+openai: Any = None
+AsyncOpenAI: Any = None
 
 try:
-    import openai
-    from openai import AsyncOpenAI
+    import orjson
 
-    HAS_OPENAI = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_OPENAI = False
-    openai = None  # type: ignore[assignment]
-    AsyncOpenAI = None  # type: ignore[assignment, misc]
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available.
+
+    Values orjson rejects (non-string keys, integers wider than 64 bits) fall
+    back to the stdlib, so anything json.dumps accepted still encodes.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+def _loads(raw: str | bytes) -> Any:
+    """Parse JSON, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib exception either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _format_image_block(block: ImageBlock) -> dict[str, Any]:
+    # Data URLs and remote URLs are both sent as image_url
+    return {"type": "image_url", "image_url": {"url": block.source}}
+
+
+# User content block type -> OpenAI formatter; other block types are dropped
+_BLOCK_FORMATTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    TextBlock: _BASE_BLOCK_FORMATTERS[TextBlock],
+    ImageBlock: _format_image_block,
+}
+
+
+def _format_block(block: ContentBlock) -> dict[str, Any] | None:
+    """Format one content block, or return None for unsupported block types."""
+    formatter = _BLOCK_FORMATTERS.get(type(block))
+    if formatter is None:
+        formatter = _find_formatter(_BLOCK_FORMATTERS, block)
+        if formatter is None:
+            return None
+    return formatter(block)
+
+
+def _import_openai() -> Any:
+    """Import the openai SDK on first use and bind the module globals."""
+    global openai, AsyncOpenAI
+    if openai is None:
+        import openai as module
+
+        AsyncOpenAI = module.AsyncOpenAI
+        openai = module
+    return openai
+
+
+# AsyncOpenAI/AsyncAzureOpenAI clients by class and settings, per event loop
+# since the underlying httpx pool is loop-bound
+_CLIENT_POOLS: dict[asyncio.AbstractEventLoop, dict[tuple[Any, str], Any]] = {}
+
+
+def _shared_client(client_class: Any, **kwargs: Any) -> Any:
+    """Return a client for the running loop, reusing one with the same settings.
+
+    Sharing the client lets provider instances with identical settings reuse
+    open connections instead of each paying for its own TLS handshakes. Each
+    pooled client owns its transport, so closing one leaves the others
+    usable. Without a running loop a new client is made.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return client_class(**kwargs)
+    pool = _loop_pool(_CLIENT_POOLS, loop)
+    key = (client_class, _config_key(kwargs))
+    client = pool.get(key)
+    if client is None:
+        client = pool[key] = client_class(**kwargs)
+    return client
+
+
+# Fields of the message types whose formatted dicts format_messages may reuse
+_MESSAGE_FIELDS: dict[type, tuple[str, ...]] = {
+    cls: cls.__slots__ for cls in (UserMessage, SystemMessage, ToolMessage)
+}
+
+
+def _message_state(message: Any) -> tuple[Any, ...] | None:
+    """Snapshot a message's fields, or None if any of them can be mutated."""
+    names = _MESSAGE_FIELDS.get(type(message))
+    if names is None or type(message.content) is not str:
+        return None
+    return tuple(getattr(message, name) for name in names)
+
+
+def _text_event(parts: list[str]) -> StreamEvent:
+    """Merge pending text deltas into one event and empty the list."""
+    text = parts[0] if len(parts) == 1 else "".join(parts)
+    parts.clear()
+    return StreamEvent(
+        event_type="content_block_delta",
+        delta={"type": "text", "text": text},
+    )
+
+
+# SDK tool_choice values OpenAI accepts as-is; any other value names a tool.
+_TOOL_CHOICE_LITERALS = frozenset({"required", "none", "auto"})
+
+# Function tool_choice dicts by tool name, built once and shared read-only
+_FUNCTION_TOOL_CHOICES: dict[str, dict[str, Any]] = {}
+
+
+def _resolve_tool_choice(tool_choice: str) -> str | dict[str, Any]:
+    """Map an SDK tool_choice to the Chat Completions value."""
+    if tool_choice in _TOOL_CHOICE_LITERALS:
+        return tool_choice
+    choice = _FUNCTION_TOOL_CHOICES.get(tool_choice)
+    if choice is None:
+        choice = _FUNCTION_TOOL_CHOICES[tool_choice] = {
+            "type": "function",
+            "function": {"name": tool_choice},
+        }
+    return choice
+
+
+# OpenAI finish_reason -> SDK FinishReason; unknown reasons map to STOP
+_FINISH_REASONS: dict[str, FinishReason] = {
+    "stop": FinishReason.STOP,
+    "length": FinishReason.LENGTH,
+    "tool_calls": FinishReason.TOOL_USE,
+    "content_filter": FinishReason.CONTENT_FILTER,
+}
+
+# Messages last passed to format_messages, each one's field snapshot (None if
+# it cannot be reused) and its formatted dict
+_MessagesCache = tuple[
+    tuple[Message, ...], tuple[tuple[Any, ...] | None, ...], tuple[dict[str, Any], ...]
+]
+
+# Tools last passed to format_tools and their formatted dicts
+_ToolsCache = tuple[tuple[ToolDefinition, ...], list[dict[str, Any]]]
+
+# Terminal states of an OpenAI Batch API job
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
 
 
 @register_provider("openai")
 class OpenAIProvider(BaseProvider):
     """OpenAI provider implementation."""
 
+    __slots__ = ("_client", "_messages_cache", "_streamed_message", "_tools_cache")
+
     name = "openai"
 
     def __init__(self, config: dict[str, Any] | None = None):
         super().__init__(config)
+        # A client set here is used instead of the shared per-loop clients
         self._client: Any = None
+        self._messages_cache: _MessagesCache = ((), (), ())
+        self._streamed_message: tuple[AssistantMessage, dict[str, Any]] | None = None
+        self._tools_cache: _ToolsCache | None = None
 
     def _validate_config(self) -> None:
         if not HAS_OPENAI:
@@ -53,28 +225,30 @@ class OpenAIProvider(BaseProvider):
             )
 
     def _get_client(self) -> Any:
-        """Get or create the OpenAI client."""
-        if self._client is None:
-            api_key = self.config.get("api_key") or os.environ.get("OPENAI_API_KEY")
-            if not api_key:
-                raise AuthenticationError(
-                    "openai",
-                    "OPENAI_API_KEY environment variable or api_key config required",
-                )
+        """Get the OpenAI client for the running event loop."""
+        # Also makes openai's exception types available to the callers
+        _import_openai()
+        if self._client is not None:
+            return self._client
+        api_key = self.config.get("api_key") or os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise AuthenticationError(
+                "openai",
+                "OPENAI_API_KEY environment variable or api_key config required",
+            )
 
-            kwargs: dict[str, Any] = {
-                "api_key": api_key,
-                "timeout": self.config.get("timeout", 600.0),
-                "max_retries": self.config.get("max_retries", 2),
-            }
+        kwargs: dict[str, Any] = {
+            "api_key": api_key,
+            "timeout": self.config.get("timeout", 600.0),
+            "max_retries": self.config.get("max_retries", 2),
+        }
 
-            if self.config.get("base_url"):
-                kwargs["base_url"] = self.config["base_url"]
-            if self.config.get("organization"):
-                kwargs["organization"] = self.config["organization"]
+        if self.config.get("base_url"):
+            kwargs["base_url"] = self.config["base_url"]
+        if self.config.get("organization"):
+            kwargs["organization"] = self.config["organization"]
 
-            self._client = AsyncOpenAI(**kwargs)
-        return self._client
+        return _shared_client(AsyncOpenAI, **kwargs)
 
     def get_features(self) -> ProviderFeatures:
         return ProviderFeatures(
@@ -113,27 +287,38 @@ class OpenAIProvider(BaseProvider):
     # ==========================================================================
 
     def format_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
-        """Convert SDK messages to OpenAI format."""
-        from ..types import AssistantMessage, SystemMessage, ToolMessage, UserMessage
-
+        """Convert SDK messages to OpenAI format.
+
+        Tool loops resend the whole, growing conversation on every turn. The
+        previous call's messages and results are kept, and a message at the
+        same position reuses its result if it is the same object and none of
+        its fields changed since. Only messages whose fields are all
+        immutable (string content) are reused this way, so in-place changes
+        are always picked up. The AssistantMessage last produced by stream()
+        is matched by identity to the OpenAI-format dict built while
+        streaming it.
+        """
+        cached_messages, cached_states, cached_formatted = self._messages_cache
+        cached_count = len(cached_messages)
+        states = list(map(_message_state, messages))
         formatted: list[dict[str, Any]] = []
-
-        for msg in messages:
-            if isinstance(msg, SystemMessage):
-                formatted.append({"role": "system", "content": msg.content})
-            elif isinstance(msg, UserMessage):
-                formatted.append(self._format_user_message(msg))
-            elif isinstance(msg, AssistantMessage):
-                formatted.append(self._format_assistant_message(msg))
-            elif isinstance(msg, ToolMessage):
-                formatted.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content,
-                        "tool_call_id": msg.tool_call_id,
-                    }
-                )
-
+        append = formatted.append
+        streamed = self._streamed_message
+        for i, message in enumerate(messages):
+            state = states[i]
+            if (
+                state is not None
+                and i < cached_count
+                and cached_messages[i] is message
+                and cached_states[i] == state
+            ):
+                append(cached_formatted[i])
+            elif streamed is not None and message is streamed[0]:
+                # Sent back verbatim, without re-serializing tool arguments
+                append(streamed[1])
+            else:
+                append(self.format_message(message))
+        self._messages_cache = (tuple(messages), tuple(states), tuple(formatted))
         return formatted
 
     def _format_user_message(self, message: Any) -> dict[str, Any]:
@@ -158,7 +343,7 @@ class OpenAIProvider(BaseProvider):
                         "type": "function",
                         "function": {
                             "name": block.name,
-                            "arguments": json.dumps(block.input),
+                            "arguments": _dumps(block.input),
                         },
                     }
                 )
@@ -176,27 +361,11 @@ class OpenAIProvider(BaseProvider):
     def _format_content_blocks(
         self, blocks: list[ContentBlock]
     ) -> list[dict[str, Any]]:
-        result: list[dict[str, Any]] = []
-        for block in blocks:
-            if isinstance(block, TextBlock):
-                result.append({"type": "text", "text": block.text})
-            elif isinstance(block, ImageBlock):
-                # OpenAI image format
-                if block.source.startswith("data:"):
-                    result.append(
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": block.source},
-                        }
-                    )
-                else:
-                    result.append(
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": block.source},
-                        }
-                    )
-        return result
+        return [
+            formatted
+            for formatted in map(_format_block, blocks)
+            if formatted is not None
+        ]
 
     def format_tools(self, tools: list[ToolDefinition]) -> list[dict[str, Any]]:
         """Convert tools to OpenAI format."""
@@ -212,6 +381,24 @@ class OpenAIProvider(BaseProvider):
             for tool in tools
         ]
 
+    def _format_tools_cached(self, tools: list[ToolDefinition]) -> list[dict[str, Any]]:
+        """Format tools, reusing the last result for the same tool objects.
+
+        Agent loops send the same tool list on every turn. The formatted dicts
+        share each tool's input_schema, so in-place schema edits still show up;
+        the returned list must not be mutated.
+        """
+        cached = self._tools_cache
+        if (
+            cached is not None
+            and len(cached[0]) == len(tools)
+            and all(map(operator.is_, cached[0], tools))
+        ):
+            return cached[1]
+        formatted = self.format_tools(tools)
+        self._tools_cache = (tuple(tools), formatted)
+        return formatted
+
     # ==========================================================================
     # Response Parsing (OpenAI -> SDK)
     # ==========================================================================
@@ -234,7 +421,7 @@ class OpenAIProvider(BaseProvider):
                     ToolUseBlock(
                         id=tool_call.id,
                         name=tool_call.function.name,
-                        input=json.loads(tool_call.function.arguments),
+                        input=_loads(tool_call.function.arguments),
                     )
                 )
 
@@ -250,45 +437,44 @@ class OpenAIProvider(BaseProvider):
     def _map_finish_reason(self, finish_reason: str | None) -> FinishReason | None:
         if finish_reason is None:
             return None
-        mapping = {
-            "stop": FinishReason.STOP,
-            "length": FinishReason.LENGTH,
-            "tool_calls": FinishReason.TOOL_USE,
-            "content_filter": FinishReason.CONTENT_FILTER,
-        }
-        return mapping.get(finish_reason, FinishReason.STOP)
+        return _FINISH_REASONS.get(finish_reason, FinishReason.STOP)
 
     def parse_usage(self, usage: Any) -> Usage:
         """Parse OpenAI usage to SDK Usage."""
-        return Usage(
-            prompt_tokens=getattr(usage, "prompt_tokens", 0),
-            completion_tokens=getattr(usage, "completion_tokens", 0),
-            total_tokens=getattr(usage, "total_tokens", 0),
-        )
+        try:
+            return Usage(
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                total_tokens=usage.total_tokens,
+            )
+        except AttributeError:
+            # Partial usage objects from OpenAI-compatible servers
+            return Usage(
+                prompt_tokens=getattr(usage, "prompt_tokens", 0),
+                completion_tokens=getattr(usage, "completion_tokens", 0),
+                total_tokens=getattr(usage, "total_tokens", 0),
+            )
 
     # ==========================================================================
     # Core Methods
     # ==========================================================================
 
-    async def complete(
-        self,
-        messages: list[Message],
-        options: AgentOptions,
-    ) -> AssistantMessage:
-        """Generate a completion using OpenAI."""
-        client = self._get_client()
-
-        formatted_messages = self.format_messages(messages)
-
+    def _build_request_kwargs(
+        self, messages: list[Message], options: AgentOptions, *, stream: bool = False
+    ) -> dict[str, Any]:
+        """Build the Chat Completions arguments shared by every request path."""
+        model = options.model or self.get_default_model()
         kwargs: dict[str, Any] = {
-            "model": options.model or self.get_default_model(),
-            "messages": formatted_messages,
+            "model": model,
+            "messages": self.format_messages(messages),
         }
+        if stream:
+            kwargs["stream"] = True
+            kwargs["stream_options"] = {"include_usage": True}
 
         if options.max_tokens:
             # Newer models (gpt-4o, o1, gpt-5+) use max_completion_tokens
             # Older models (gpt-3.5-turbo, gpt-4) use max_tokens
-            model = options.model or self.get_default_model()
             if self._uses_max_completion_tokens(model):
                 kwargs["max_completion_tokens"] = options.max_tokens
             else:
@@ -301,19 +487,21 @@ class OpenAIProvider(BaseProvider):
             kwargs["top_p"] = options.top_p
 
         if options.tools:
-            kwargs["tools"] = self.format_tools(options.tools)
+            kwargs["tools"] = self._format_tools_cached(options.tools)
             if options.tool_choice:
-                if options.tool_choice == "required":
-                    kwargs["tool_choice"] = "required"
-                elif options.tool_choice == "none":
-                    kwargs["tool_choice"] = "none"
-                elif options.tool_choice == "auto":
-                    kwargs["tool_choice"] = "auto"
-                else:
-                    kwargs["tool_choice"] = {
-                        "type": "function",
-                        "function": {"name": options.tool_choice},
-                    }
+                kwargs["tool_choice"] = _resolve_tool_choice(options.tool_choice)
+
+        return kwargs
+
+    async def complete(
+        self,
+        messages: list[Message],
+        options: AgentOptions,
+    ) -> AssistantMessage:
+        """Generate a completion using OpenAI."""
+        client = self._get_client()
+
+        kwargs = self._build_request_kwargs(messages, options)
 
         try:
             response = await client.chat.completions.create(**kwargs)
@@ -329,60 +517,150 @@ class OpenAIProvider(BaseProvider):
                 status_code=getattr(e, "status_code", None),
             ) from e
 
-    async def stream(
+    async def complete_batch(
         self,
-        messages: list[Message],
+        conversations: list[list[Message]],
         options: AgentOptions,
-    ) -> AsyncIterator[AnyMessage]:
-        """Stream a completion using OpenAI."""
+        *,
+        use_batch_api: bool = False,
+        max_concurrency: int = 16,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+    ) -> list[AssistantMessage | BaseException]:
+        """Generate one completion per conversation.
+
+        By default the requests are sent concurrently through the Chat
+        Completions endpoint. With ``use_batch_api=True`` they are submitted
+        as a single job to the OpenAI Batch API, which is billed at a
+        discount but may take up to 24 hours to finish; this call waits for
+        the job to complete.
+
+        Args:
+            conversations: Message lists, one per completion
+            options: AgentOptions shared by every request
+            use_batch_api: Submit the requests as an OpenAI batch job
+            max_concurrency: Maximum requests in flight when not batching
+            poll_interval: Initial delay in seconds between job status checks
+            max_poll_interval: Upper bound for the doubling poll delay
+
+        Returns:
+            One entry per conversation, in order: the AssistantMessage, or
+            the exception raised for that request
+        """
+        if not use_batch_api:
+            return await self.abatch(
+                [(messages, options) for messages in conversations],
+                max_concurrency=max_concurrency,
+            )
+
+        try:
+            return await self._run_batch_job(
+                conversations, options, poll_interval, max_poll_interval
+            )
+        except openai.AuthenticationError as e:
+            raise AuthenticationError("openai", str(e)) from e
+        except openai.RateLimitError as e:
+            raise RateLimitError("openai", message=str(e)) from e
+        except openai.APIError as e:
+            raise ProviderError(
+                str(e),
+                provider="openai",
+                status_code=getattr(e, "status_code", None),
+            ) from e
+
+    async def _run_batch_job(
+        self,
+        conversations: list[list[Message]],
+        options: AgentOptions,
+        poll_interval: float,
+        max_poll_interval: float,
+    ) -> list[AssistantMessage | BaseException]:
+        """Upload, run and collect an OpenAI Batch API job."""
         client = self._get_client()
 
-        formatted_messages = self.format_messages(messages)
+        lines = [
+            _dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_request_kwargs(messages, options),
+                }
+            )
+            for i, messages in enumerate(conversations)
+        ]
+        input_file = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
 
-        kwargs: dict[str, Any] = {
-            "model": options.model or self.get_default_model(),
-            "messages": formatted_messages,
-            "stream": True,
-            "stream_options": {"include_usage": True},
-        }
+        delay = poll_interval
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = await client.batches.retrieve(batch.id)
 
-        if options.max_tokens:
-            # Newer models (gpt-4o, o1, gpt-5+) use max_completion_tokens
-            # Older models (gpt-3.5-turbo, gpt-4) use max_tokens
-            model = options.model or self.get_default_model()
-            if self._uses_max_completion_tokens(model):
-                kwargs["max_completion_tokens"] = options.max_tokens
-            else:
-                kwargs["max_tokens"] = options.max_tokens
+        if batch.status != "completed":
+            raise ProviderError(
+                f"Batch {batch.id} finished with status '{batch.status}'",
+                provider="openai",
+            )
 
-        if options.temperature is not None:
-            kwargs["temperature"] = options.temperature
+        results: list[AssistantMessage | BaseException] = [
+            ProviderError("No result returned for batch request", provider="openai")
+            for _ in conversations
+        ]
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    record = _loads(line)
+                    results[int(record["custom_id"])] = self._parse_batch_record(record)
+        return results
+
+    def _parse_batch_record(
+        self, record: dict[str, Any]
+    ) -> AssistantMessage | ProviderError:
+        """Convert one line of a batch output or error file."""
+        response = record.get("response") or {}
+        status_code = response.get("status_code")
+        if record.get("error") or status_code != 200:
+            error = record.get("error") or response.get("body", {}).get("error")
+            message = (error or {}).get("message", "Batch request failed")
+            return ProviderError(message, provider="openai", status_code=status_code)
+
+        completion = openai.types.chat.ChatCompletion.model_validate(response["body"])
+        return self.parse_response(completion)
 
-        if options.top_p is not None:
-            kwargs["top_p"] = options.top_p
+    async def stream(
+        self,
+        messages: list[Message],
+        options: AgentOptions,
+    ) -> AsyncIterator[AnyMessage]:
+        """Stream a completion using OpenAI."""
+        client = self._get_client()
 
-        if options.tools:
-            kwargs["tools"] = self.format_tools(options.tools)
-            if options.tool_choice:
-                if options.tool_choice == "required":
-                    kwargs["tool_choice"] = "required"
-                elif options.tool_choice == "none":
-                    kwargs["tool_choice"] = "none"
-                elif options.tool_choice == "auto":
-                    kwargs["tool_choice"] = "auto"
-                else:
-                    kwargs["tool_choice"] = {
-                        "type": "function",
-                        "function": {"name": options.tool_choice},
-                    }
+        kwargs = self._build_request_kwargs(messages, options, stream=True)
 
         try:
-            # Track content during streaming
-            content_text = ""
+            # Track content during streaming; parts are joined once at the end
+            content_parts: list[str] = []
             tool_calls: dict[int, dict[str, Any]] = {}
             model = ""
             usage: Usage | None = None
             finish_reason: str | None = None
+            emit_deltas = options.yield_stream_events
+            # Text deltas waiting to be merged into one event
+            pending_text: list[str] = []
+            batch_size = options.stream_batch_size
+            batch_seconds = options.stream_batch_ms / 1000
+            last_flush = time.perf_counter()
 
             async with await client.chat.completions.create(**kwargs) as stream:
                 async for chunk in stream:
@@ -400,61 +678,76 @@ class OpenAIProvider(BaseProvider):
 
                     # Handle text content
                     if delta.content:
-                        content_text += delta.content
-                        yield StreamEvent(
-                            event_type="content_block_delta",
-                            delta={"type": "text", "text": delta.content},
-                        )
+                        content_parts.append(delta.content)
+                        if emit_deltas:
+                            pending_text.append(delta.content)
+                            now = time.perf_counter()
+                            if (
+                                len(pending_text) >= batch_size
+                                or now - last_flush >= batch_seconds
+                            ):
+                                yield _text_event(pending_text)
+                                last_flush = now
 
                     # Handle tool calls
                     if delta.tool_calls:
+                        if pending_text:
+                            yield _text_event(pending_text)
                         for tool_call in delta.tool_calls:
                             idx = tool_call.index
-                            if idx not in tool_calls:
-                                tool_calls[idx] = {
-                                    "id": tool_call.id or "",
+                            call_id = tool_call.id
+                            function = tool_call.function
+                            name = function.name if function else None
+                            arguments = function.arguments if function else None
+
+                            entry = tool_calls.get(idx)
+                            if entry is None:
+                                entry = tool_calls[idx] = {
+                                    "id": "",
                                     "name": "",
-                                    "arguments": "",
+                                    "arguments_parts": [],
                                 }
-
-                            if tool_call.id:
-                                tool_calls[idx]["id"] = tool_call.id
-                            if tool_call.function:
-                                if tool_call.function.name:
-                                    tool_calls[idx]["name"] = tool_call.function.name
-                                if tool_call.function.arguments:
-                                    tool_calls[idx]["arguments"] += (
-                                        tool_call.function.arguments
-                                    )
-
-                            yield StreamEvent(
-                                event_type="tool_call_delta",
-                                index=idx,
-                                delta={
-                                    "type": "tool_call",
-                                    "id": tool_call.id,
-                                    "name": tool_call.function.name
-                                    if tool_call.function
-                                    else None,
-                                    "arguments": tool_call.function.arguments
-                                    if tool_call.function
-                                    else None,
-                                },
-                            )
+                            if call_id:
+                                entry["id"] = call_id
+                            if name:
+                                entry["name"] = name
+                            if arguments:
+                                entry["arguments_parts"].append(arguments)
+
+                            if emit_deltas:
+                                yield StreamEvent(
+                                    event_type="tool_call_delta",
+                                    index=idx,
+                                    delta={
+                                        "type": "tool_call",
+                                        "id": call_id,
+                                        "name": name,
+                                        "arguments": arguments,
+                                    },
+                                )
 
                     if choice.finish_reason:
                         finish_reason = choice.finish_reason
 
-            # Build content blocks
+            if pending_text:
+                yield _text_event(pending_text)
+
+            # Build content blocks, and the OpenAI-format message alongside
             content_blocks: list[ContentBlock] = []
-            if content_text:
-                content_blocks.append(TextBlock(text=content_text))
+            native: dict[str, Any] = {"role": "assistant"}
+            if content_parts:
+                text = "".join(content_parts)
+                content_blocks.append(TextBlock(text=text))
+                native["content"] = text
 
+            native_tool_calls: list[dict[str, Any]] = []
             for _, tc in sorted(tool_calls.items()):
+                arguments = "".join(tc["arguments_parts"])
                 try:
-                    input_data = json.loads(tc["arguments"]) if tc["arguments"] else {}
+                    input_data = _loads(arguments) if arguments else {}
                 except json.JSONDecodeError:
                     input_data = {}
+                    arguments = ""
                 content_blocks.append(
                     ToolUseBlock(
                         id=tc["id"],
@@ -462,13 +755,27 @@ class OpenAIProvider(BaseProvider):
                         input=input_data,
                     )
                 )
+                native_tool_calls.append(
+                    {
+                        "id": tc["id"],
+                        "type": "function",
+                        "function": {
+                            "name": tc["name"],
+                            "arguments": arguments or "{}",
+                        },
+                    }
+                )
+            if native_tool_calls:
+                native["tool_calls"] = native_tool_calls
 
             # Yield final AssistantMessage
-            yield AssistantMessage(
+            assistant_message = AssistantMessage(
                 content=content_blocks,
                 model=model,
                 finish_reason=self._map_finish_reason(finish_reason),
             )
+            self._streamed_message = (assistant_message, native)
+            yield assistant_message
 
             # Yield ResultMessage
             yield ResultMessage(
@@ -493,46 +800,45 @@ class OpenAIProvider(BaseProvider):
 class AzureOpenAIProvider(OpenAIProvider):
     """Azure OpenAI provider implementation."""
 
+    __slots__ = ()
+
     name = "azure_openai"
 
     def _get_client(self) -> Any:
-        """Get or create the Azure OpenAI client."""
-        if self._client is None:
-            from openai import AsyncAzureOpenAI
+        """Get the Azure OpenAI client for the running event loop."""
+        _import_openai()
+        if self._client is not None:
+            return self._client
+        api_key = self.config.get("api_key") or os.environ.get("AZURE_OPENAI_API_KEY")
+        endpoint = self.config.get("base_url") or os.environ.get(
+            "AZURE_OPENAI_ENDPOINT"
+        )
+        api_version = self.config.get("api_version", "2024-02-15-preview")
 
-            api_key = self.config.get("api_key") or os.environ.get(
-                "AZURE_OPENAI_API_KEY"
+        if not api_key:
+            raise AuthenticationError(
+                "azure_openai",
+                "AZURE_OPENAI_API_KEY environment variable or api_key config required",
             )
-            endpoint = self.config.get("base_url") or os.environ.get(
-                "AZURE_OPENAI_ENDPOINT"
+        if not endpoint:
+            raise AuthenticationError(
+                "azure_openai",
+                "AZURE_OPENAI_ENDPOINT environment variable or base_url config required",
             )
-            api_version = self.config.get("api_version", "2024-02-15-preview")
-
-            if not api_key:
-                raise AuthenticationError(
-                    "azure_openai",
-                    "AZURE_OPENAI_API_KEY environment variable or api_key config required",
-                )
-            if not endpoint:
-                raise AuthenticationError(
-                    "azure_openai",
-                    "AZURE_OPENAI_ENDPOINT environment variable or base_url config required",
-                )
 
-            kwargs: dict[str, Any] = {
-                "api_key": api_key,
-                "azure_endpoint": endpoint,
-                "api_version": api_version,
-                "timeout": self.config.get("timeout", 600.0),
-                "max_retries": self.config.get("max_retries", 2),
-            }
+        kwargs: dict[str, Any] = {
+            "api_key": api_key,
+            "azure_endpoint": endpoint,
+            "api_version": api_version,
+            "timeout": self.config.get("timeout", 600.0),
+            "max_retries": self.config.get("max_retries", 2),
+        }
 
-            # Support Azure AD token authentication
-            if self.config.get("azure_ad_token"):
-                kwargs["azure_ad_token"] = self.config["azure_ad_token"]
+        # Support Azure AD token authentication
+        if self.config.get("azure_ad_token"):
+            kwargs["azure_ad_token"] = self.config["azure_ad_token"]
 
-            self._client = AsyncAzureOpenAI(**kwargs)
-        return self._client
+        return _shared_client(openai.AsyncAzureOpenAI, **kwargs)
 
     def get_default_model(self) -> str:
         # Azure uses deployment names, not model names
@@ -1,6 +1,10 @@
 """One-shot query function for Universal Agent SDK."""
 
+import asyncio
+import inspect
+import json
 from collections.abc import AsyncIterator
+from dataclasses import replace
 from typing import Any
 
 from .config import get_config
@@ -10,14 +14,41 @@ from .types import (
     AnyMessage,
     AssistantMessage,
     Message,
+    PermissionResult,
+    PermissionResultDeny,
     ResultMessage,
     SystemMessage,
+    ToolDefinition,
     ToolMessage,
+    ToolPermissionContext,
     ToolResultBlock,
     ToolUseBlock,
     UserMessage,
 )
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available.
+
+    Values orjson rejects (non-string keys, integers wider than 64 bits) fall
+    back to the stdlib, whose TypeError for unserializable results is then
+    reported as a tool error as before.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
 
 async def query(
     prompt: str | list[Message],
@@ -125,6 +156,8 @@ async def _query_with_tools(
     """Execute query with automatic tool execution loop."""
     turns = 0
     max_turns = options.max_turns or 10
+    # Name -> tool; built reversed so the first tool with a name wins
+    tool_index = {t.name: t for t in reversed(options.tools)}
 
     while turns < max_turns:
         turns += 1
@@ -154,81 +187,27 @@ async def _query_with_tools(
                 yield ResultMessage(is_error=False, num_turns=turns)
             break
 
-        # Execute tools
+        # Execute tools concurrently; gather keeps results in call order and
+        # waits for every call even if one raises
         messages.append(response)
-        tool_results: list[ToolResultBlock] = []
-
-        for tool_use in tool_uses:
-            # Check permission callback
-            if options.can_use_tool:
-                from .types import (
-                    PermissionResult,
-                    PermissionResultDeny,
-                    ToolPermissionContext,
-                )
-
-                context = ToolPermissionContext(session_id=options.session_id)
-                perm_result_raw = options.can_use_tool(
-                    tool_use.name, tool_use.input, context
-                )
-                perm_result: PermissionResult
-                if hasattr(perm_result_raw, "__await__"):
-                    perm_result = await perm_result_raw
-                else:
-                    perm_result = perm_result_raw  # type: ignore[assignment]
-
-                if isinstance(perm_result, PermissionResultDeny):
-                    tool_results.append(
-                        ToolResultBlock(
-                            tool_use_id=tool_use.id,
-                            content=f"Permission denied: {perm_result.message}",
-                            is_error=True,
-                        )
-                    )
-                    continue
-
-            # Find and execute tool
-            tool_def = next((t for t in options.tools if t.name == tool_use.name), None)
-
-            if tool_def is None or tool_def.handler is None:
-                tool_results.append(
-                    ToolResultBlock(
-                        tool_use_id=tool_use.id,
-                        content=f"Tool '{tool_use.name}' not found or has no handler",
-                        is_error=True,
-                    )
-                )
-                continue
-
-            try:
-                # Execute tool handler
-                tool_result = tool_def.handler(**tool_use.input)
-                if hasattr(tool_result, "__await__"):
-                    tool_result = await tool_result
-
-                # Convert result to string
-                if isinstance(tool_result, str):
-                    content = tool_result
-                else:
-                    import json
-
-                    content = json.dumps(tool_result)
-
-                tool_results.append(
-                    ToolResultBlock(
-                        tool_use_id=tool_use.id,
-                        content=content,
-                        is_error=False,
-                    )
-                )
-            except Exception as e:
-                tool_results.append(
-                    ToolResultBlock(
-                        tool_use_id=tool_use.id,
-                        content=f"Error executing tool: {e!s}",
-                        is_error=True,
-                    )
-                )
+        permission_lock = asyncio.Lock()
+        outcomes = await asyncio.gather(
+            *(
+                _run_tool_call(tool_use, options, tool_index, permission_lock)
+                for tool_use in tool_uses
+            ),
+            return_exceptions=True,
+        )
+        tool_results: list[ToolResultBlock] = [
+            ToolResultBlock(
+                tool_use_id=tool_use.id,
+                content=f"Error executing tool: {outcome!s}",
+                is_error=True,
+            )
+            if isinstance(outcome, BaseException)
+            else outcome
+            for tool_use, outcome in zip(tool_uses, outcomes, strict=True)
+        ]
 
         # Add tool results to messages
         # For providers that expect tool messages (OpenAI style)
@@ -240,9 +219,7 @@ async def _query_with_tools(
             elif isinstance(result.content, str):
                 content_str = result.content
             else:
-                import json
-
-                content_str = json.dumps(result.content)
+                content_str = _dumps(result.content)
 
             messages.append(
                 ToolMessage(
@@ -256,6 +233,75 @@ async def _query_with_tools(
         yield ResultMessage(is_error=False, num_turns=turns)
 
 
+async def _run_tool_call(
+    tool_use: ToolUseBlock,
+    options: AgentOptions,
+    tool_index: dict[str, ToolDefinition],
+    permission_lock: asyncio.Lock,
+) -> ToolResultBlock:
+    """Check permission for and execute a single tool call.
+
+    Errors are reported in the returned ToolResultBlock rather than raised, so
+    one failing call does not cancel the other calls of the same turn.
+    Permission checks hold ``permission_lock`` so that prompts for calls of
+    the same turn are not interleaved.
+    """
+    # Check permission callback
+    if options.can_use_tool:
+        context = ToolPermissionContext(session_id=options.session_id)
+        perm_result: PermissionResult
+        async with permission_lock:
+            perm_result_raw = options.can_use_tool(
+                tool_use.name, tool_use.input, context
+            )
+            if hasattr(perm_result_raw, "__await__"):
+                perm_result = await perm_result_raw
+            else:
+                perm_result = perm_result_raw  # type: ignore[assignment]
+
+        if isinstance(perm_result, PermissionResultDeny):
+            return ToolResultBlock(
+                tool_use_id=tool_use.id,
+                content=f"Permission denied: {perm_result.message}",
+                is_error=True,
+            )
+
+    # Find and execute tool
+    tool_def = tool_index.get(tool_use.name)
+
+    if tool_def is None or tool_def.handler is None:
+        return ToolResultBlock(
+            tool_use_id=tool_use.id,
+            content=f"Tool '{tool_use.name}' not found or has no handler",
+            is_error=True,
+        )
+
+    try:
+        # Execute tool handler
+        if tool_def.is_async:
+            tool_result = await tool_def.handler(**tool_use.input)
+        else:
+            tool_result = tool_def.handler(**tool_use.input)
+            # Sync handlers may still return a coroutine or future
+            if inspect.isawaitable(tool_result):
+                tool_result = await tool_result
+
+        # Convert result to string
+        content = tool_result if isinstance(tool_result, str) else _dumps(tool_result)
+
+        return ToolResultBlock(
+            tool_use_id=tool_use.id,
+            content=content,
+            is_error=False,
+        )
+    except Exception as e:
+        return ToolResultBlock(
+            tool_use_id=tool_use.id,
+            content=f"Error executing tool: {e!s}",
+            is_error=True,
+        )
+
+
 async def complete(
     prompt: str | list[Message],
     options: AgentOptions | None = None,
@@ -280,6 +326,10 @@ async def complete(
         print(response.content[0].text)
         ```
     """
+    # Only the final message is returned, so skip the partial StreamEvents.
+    # A copy keeps the caller's options (and the kwargs merge) unchanged.
+    options = replace(options or AgentOptions(), yield_stream_events=False)
+
     response: AssistantMessage | None = None
     async for msg in query(prompt, options, **kwargs):
         if isinstance(msg, AssistantMessage):
@@ -44,29 +44,13 @@ Example:
     ```
 """
 
-from .base import Skill, combine_skills
+from typing import TYPE_CHECKING, Any
 
-# Import all built-in skills
-from .builtin import (
-    AlgorithmicArtSkill,
-    BrandGuidelinesSkill,
-    CanvasDesignSkill,
-    DocCoauthoringSkill,
-    DocxSkill,
-    FrontendDesignSkill,
-    InternalCommsSkill,
-    MCPBuilderSkill,
-    PDFSkill,
-    PPTXSkill,
-    SkillCreatorSkill,
-    SlackGifCreatorSkill,
-    ThemeFactorySkill,
-    WebappTestingSkill,
-    WebArtifactsBuilderSkill,
-    XLSXSkill,
-)
+from . import builtin
+from .base import Skill, combine_skills
 from .loader import (
     SkillMetadata,
+    clear_skill_cache,
     discover_skills,
     get_bundled_skill,
     get_bundled_skills,
@@ -88,6 +72,7 @@ __all__ = [
     "get_skill",
     "list_skills",
     # Loader
+    "clear_skill_cache",
     "discover_skills",
     "get_bundled_skill",
     "get_bundled_skills",
@@ -119,3 +104,33 @@ __all__ = [
     "SkillInvocationResult",
     "create_skill_tool",
 ]
+
+
+if TYPE_CHECKING:
+    from .builtin import (
+        AlgorithmicArtSkill,
+        BrandGuidelinesSkill,
+        CanvasDesignSkill,
+        DocCoauthoringSkill,
+        DocxSkill,
+        FrontendDesignSkill,
+        InternalCommsSkill,
+        MCPBuilderSkill,
+        PDFSkill,
+        PPTXSkill,
+        SkillCreatorSkill,
+        SlackGifCreatorSkill,
+        ThemeFactorySkill,
+        WebappTestingSkill,
+        WebArtifactsBuilderSkill,
+        XLSXSkill,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Built-in skills are only constructed when first accessed
+    if name in builtin.__all__:
+        value = getattr(builtin, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
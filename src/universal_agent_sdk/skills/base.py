@@ -1,16 +1,21 @@
 """Base skill class and utilities."""
 
-from dataclasses import dataclass, field
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import Any
 
 from ..types import AgentOptions, ToolDefinition
 
-if TYPE_CHECKING:
-    pass
+# Shared by every skill created without metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     """A reusable skill that combines prompts, tools, and configuration.
 
@@ -22,10 +27,11 @@ class Skill:
         name: Unique identifier for the skill
         description: Brief description of what the skill does
         system_prompt: The system prompt that defines the skill's behavior
-        tools: List of tools available to the skill
+        tools: Tools available to the skill, stored as a tuple
         temperature: Default temperature for responses
         max_tokens: Default max tokens for responses
-        metadata: Additional metadata about the skill
+        metadata: Additional metadata about the skill. Stored as a read-only
+            mapping that derived skills share; use set_metadata to change it.
 
     Example:
         ```python
@@ -47,10 +53,31 @@ class Skill:
     name: str
     description: str
     system_prompt: str
-    tools: list[ToolDefinition] = field(default_factory=list)
+    tools: tuple[ToolDefinition, ...] = ()
     temperature: float = 0.7
     max_tokens: int = 4096
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = _EMPTY_METADATA
+
+    def __post_init__(self) -> None:
+        # Interned so that registry lookups with literal names compare by identity
+        self.name = sys.intern(self.name)
+        # Tools and metadata are immutable so that derived skills can share them
+        if type(self.tools) is not tuple:
+            self.tools = tuple(self.tools)
+        if type(self.metadata) is not MappingProxyType:
+            self.metadata = MappingProxyType(dict(self.metadata))
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Set a metadata entry on this skill only.
+
+        The metadata mapping may be shared with skills derived from this one,
+        so it is copied before the change.
+
+        Args:
+            key: Metadata key
+            value: Value to store
+        """
+        self.metadata = MappingProxyType({**self.metadata, key: value})
 
     def create_options(self, **kwargs: Any) -> AgentOptions:
         """Create AgentOptions from this skill.
@@ -63,7 +90,7 @@ class Skill:
         """
         return AgentOptions(
             system_prompt=kwargs.pop("system_prompt", self.system_prompt),
-            tools=kwargs.pop("tools", self.tools),
+            tools=kwargs.pop("tools") if "tools" in kwargs else list(self.tools),
             temperature=kwargs.pop("temperature", self.temperature),
             max_tokens=kwargs.pop("max_tokens", self.max_tokens),
             **kwargs,
@@ -82,10 +109,10 @@ class Skill:
             name=self.name,
             description=self.description,
             system_prompt=self.system_prompt,
-            tools=[*self.tools, *tools],
+            tools=(*self.tools, *tools),
             temperature=self.temperature,
             max_tokens=self.max_tokens,
-            metadata=self.metadata.copy(),
+            metadata=self.metadata,
         )
 
     def with_prompt(self, additional_prompt: str) -> "Skill":
@@ -101,10 +128,10 @@ class Skill:
             name=self.name,
             description=self.description,
             system_prompt=f"{self.system_prompt}\n\n{additional_prompt}",
-            tools=self.tools.copy(),
+            tools=self.tools,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
-            metadata=self.metadata.copy(),
+            metadata=self.metadata,
         )
 
     @classmethod
@@ -130,7 +157,12 @@ class Skill:
             skill = Skill.from_file(".claude/skills/my-skill/SKILL.md")
             ```
         """
-        from .loader import parse_skill_md
+        from .loader import (
+            _is_known_missing,
+            _mark_missing,
+            _read_skill_file,
+            _skill_file_metadata,
+        )
 
         skill_path = Path(path)
 
@@ -138,27 +170,31 @@ class Skill:
         if skill_path.is_dir():
             skill_path = skill_path / "SKILL.md"
 
-        if not skill_path.exists():
+        if _is_known_missing(skill_path):
             raise FileNotFoundError(f"Skill file not found: {skill_path}")
 
-        content = skill_path.read_text(encoding="utf-8")
-        default_name = skill_path.parent.name
-        metadata, system_prompt = parse_skill_md(content, default_name=default_name)
+        # Unchanged files are parsed once and served from the loader's cache
+        try:
+            metadata, system_prompt = _read_skill_file(skill_path)
+        except FileNotFoundError:
+            _mark_missing(skill_path)
+            raise FileNotFoundError(f"Skill file not found: {skill_path}") from None
 
         return cls(
             name=metadata.name,
             description=metadata.description,
             system_prompt=system_prompt,
-            metadata={
-                "source": str(skill_path.parent),
-                "version": metadata.version,
-                "author": metadata.author,
-                "tags": metadata.tags,
-                "allowed_tools": metadata.allowed_tools,
-            },
+            metadata=_skill_file_metadata(metadata, skill_path.parent),
         )
 
 
+# Results of combine_skills by their inputs, least recently used evicted first
+_COMBINED_SKILLS: OrderedDict[
+    tuple[Any, ...], tuple[Skill, tuple[ToolDefinition, ...]]
+] = OrderedDict()
+_MAX_COMBINED_SKILLS = 128
+
+
 def combine_skills(*skills: Skill, name: str | None = None) -> Skill:
     """Combine multiple skills into one.
 
@@ -181,23 +217,58 @@ def combine_skills(*skills: Skill, name: str | None = None) -> Skill:
     if not skills:
         raise ValueError("At least one skill is required")
 
+    # Skill fields can be reassigned, so the key holds every field that goes
+    # into the result; tools are compared by identity and kept alive by the
+    # cache entry so that their ids stay valid.
+    key = (
+        name,
+        *(
+            (
+                s.name,
+                s.description,
+                s.system_prompt,
+                s.temperature,
+                s.max_tokens,
+                tuple(map(id, s.tools)),
+            )
+            for s in skills
+        ),
+    )
+    cached = _COMBINED_SKILLS.get(key)
+    if cached is None:
+        all_tools = tuple(t for s in skills for t in s.tools)
+        cached = _COMBINED_SKILLS[key] = (_combine_skills(skills, name), all_tools)
+        if len(_COMBINED_SKILLS) > _MAX_COMBINED_SKILLS:
+            _COMBINED_SKILLS.popitem(last=False)
+    else:
+        _COMBINED_SKILLS.move_to_end(key)
+
+    # The combined_from list is built per call so that callers can modify it
+    return replace(cached[0], metadata={"combined_from": [s.name for s in skills]})
+
+
+@lru_cache(maxsize=256)
+def _section_header(skill_name: str) -> str:
+    """Heading introducing a skill's prompt inside a combined prompt."""
+    return f"## {skill_name.replace('_', ' ').title()} Capabilities\n\n"
+
+
+def _combine_skills(skills: tuple[Skill, ...], name: str | None) -> Skill:
+    """Build the combined skill for combine_skills."""
     if name is None:
         name = "_".join(s.name for s in skills)
 
     # Combine system prompts
     combined_prompt = "\n\n".join(
-        f"## {skill.name.replace('_', ' ').title()} Capabilities\n\n{skill.system_prompt}"
-        for skill in skills
+        [_section_header(skill.name) + skill.system_prompt for skill in skills]
     )
 
-    # Combine tools (deduplicate by name)
-    combined_tools: list[ToolDefinition] = []
-    seen_names: set[str] = set()
+    # Combine tools (deduplicate by name, first definition wins)
+    tools_by_name: dict[str, ToolDefinition] = {}
     for skill in skills:
         for tool_def in skill.tools:
-            if tool_def.name not in seen_names:
-                combined_tools.append(tool_def)
-                seen_names.add(tool_def.name)
+            tools_by_name.setdefault(tool_def.name, tool_def)
+    combined_tools = tuple(tools_by_name.values())
 
     # Combine descriptions
     combined_description = " | ".join(s.description for s in skills)
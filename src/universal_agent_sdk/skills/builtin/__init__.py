@@ -4,25 +4,61 @@ These skills provide specialized capabilities for common tasks like
 document processing, design, and development.
 """
 
-from .communication_skills import (
-    DocCoauthoringSkill,
-    InternalCommsSkill,
-    SlackGifCreatorSkill,
-)
-from .design_skills import (
-    AlgorithmicArtSkill,
-    BrandGuidelinesSkill,
-    CanvasDesignSkill,
-    FrontendDesignSkill,
-    ThemeFactorySkill,
-)
-from .development_skills import (
-    MCPBuilderSkill,
-    SkillCreatorSkill,
-    WebappTestingSkill,
-    WebArtifactsBuilderSkill,
-)
-from .document_skills import DocxSkill, PDFSkill, PPTXSkill, XLSXSkill
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .communication_skills import (
+        DocCoauthoringSkill,
+        InternalCommsSkill,
+        SlackGifCreatorSkill,
+    )
+    from .design_skills import (
+        AlgorithmicArtSkill,
+        BrandGuidelinesSkill,
+        CanvasDesignSkill,
+        FrontendDesignSkill,
+        ThemeFactorySkill,
+    )
+    from .development_skills import (
+        MCPBuilderSkill,
+        SkillCreatorSkill,
+        WebappTestingSkill,
+        WebArtifactsBuilderSkill,
+    )
+    from .document_skills import DocxSkill, PDFSkill, PPTXSkill, XLSXSkill
+
+# Skills are built on first access (PEP 562). SkillRegistry imports the same
+# modules when a built-in skill is looked up by name.
+_LAZY_SKILLS: dict[str, str] = {
+    "PDFSkill": "document_skills",
+    "DocxSkill": "document_skills",
+    "PPTXSkill": "document_skills",
+    "XLSXSkill": "document_skills",
+    "FrontendDesignSkill": "design_skills",
+    "CanvasDesignSkill": "design_skills",
+    "AlgorithmicArtSkill": "design_skills",
+    "BrandGuidelinesSkill": "design_skills",
+    "ThemeFactorySkill": "design_skills",
+    "MCPBuilderSkill": "development_skills",
+    "SkillCreatorSkill": "development_skills",
+    "WebArtifactsBuilderSkill": "development_skills",
+    "WebappTestingSkill": "development_skills",
+    "DocCoauthoringSkill": "communication_skills",
+    "InternalCommsSkill": "communication_skills",
+    "SlackGifCreatorSkill": "communication_skills",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_SKILLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from ..registry import _import_builtin_module
+
+    value = getattr(_import_builtin_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Document Skills
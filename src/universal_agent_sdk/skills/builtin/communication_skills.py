@@ -4,18 +4,16 @@ These skills provide specialized capabilities for document collaboration,
 internal communications, and team workflows.
 """
 
+from types import MappingProxyType
+from typing import Any
+
 from ..base import Skill
-from ..registry import register_skill
 
 # =============================================================================
 # Doc Coauthoring Skill
 # =============================================================================
 
-DocCoauthoringSkill = register_skill(
-    Skill(
-        name="doc_coauthoring",
-        description="Collaborate on documents with tracked changes",
-        system_prompt="""You are an expert at collaborative document editing with tracked changes.
+_DOC_COAUTHORING_PROMPT = """You are an expert at collaborative document editing with tracked changes.
 
 ## Capabilities
 - Suggesting edits with tracked changes
@@ -58,22 +56,13 @@ DocCoauthoringSkill = register_skill(
 - Ask questions when intent is unclear
 - Prioritize changes by importance
 - Summarize major changes at the end
-""",
-        temperature=0.5,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "communication"},
-    )
-)
+"""
 
 # =============================================================================
 # Internal Comms Skill
 # =============================================================================
 
-InternalCommsSkill = register_skill(
-    Skill(
-        name="internal_comms",
-        description="Create effective internal communications",
-        system_prompt="""You are an expert at creating effective internal communications for organizations.
+_INTERNAL_COMMS_PROMPT = """You are an expert at creating effective internal communications for organizations.
 
 ## Capabilities
 - Writing company announcements
@@ -131,22 +120,13 @@ Best,
 - Use plain language
 - Include a clear call to action
 - Proofread for errors
-""",
-        temperature=0.5,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "communication"},
-    )
-)
+"""
 
 # =============================================================================
 # Slack GIF Creator Skill
 # =============================================================================
 
-SlackGifCreatorSkill = register_skill(
-    Skill(
-        name="slack_gif_creator",
-        description="Create engaging GIF responses for Slack",
-        system_prompt="""You are an expert at suggesting and creating engaging GIF responses for Slack communications.
+_SLACK_GIF_CREATOR_PROMPT = """You are an expert at suggesting and creating engaging GIF responses for Slack communications.
 
 ## Capabilities
 - Suggesting appropriate GIFs for reactions
@@ -208,9 +188,41 @@ Create sets for:
 - Code reviews (LGTM, needs work, 🎉)
 - Incident response (investigating, resolved)
 - Team rituals (Friday celebrations, wins)
-""",
-        temperature=0.7,
-        max_tokens=2048,
-        metadata={"source": "anthropic/skills", "category": "communication"},
-    )
+"""
+
+
+# =============================================================================
+# Skill table
+# =============================================================================
+
+_METADATA = MappingProxyType(
+    {"source": "anthropic/skills", "category": "communication"}
 )
+
+_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "doc_coauthoring",
+        "description": "Collaborate on documents with tracked changes",
+        "system_prompt": _DOC_COAUTHORING_PROMPT,
+        "temperature": 0.5,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "internal_comms",
+        "description": "Create effective internal communications",
+        "system_prompt": _INTERNAL_COMMS_PROMPT,
+        "temperature": 0.5,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "slack_gif_creator",
+        "description": "Create engaging GIF responses for Slack",
+        "system_prompt": _SLACK_GIF_CREATOR_PROMPT,
+        "temperature": 0.7,
+        "max_tokens": 2048,
+    },
+)
+
+# Registered together when SkillRegistry loads this module
+_SKILLS = tuple(Skill(**spec, metadata=_METADATA) for spec in _SPECS)
+DocCoauthoringSkill, InternalCommsSkill, SlackGifCreatorSkill = _SKILLS
@@ -4,18 +4,16 @@ These skills provide specialized capabilities for design tasks including
 frontend development, visual design, and creative work.
 """
 
+from types import MappingProxyType
+from typing import Any
+
 from ..base import Skill
-from ..registry import register_skill
 
 # =============================================================================
 # Frontend Design Skill
 # =============================================================================
 
-FrontendDesignSkill = register_skill(
-    Skill(
-        name="frontend_design",
-        description="Create distinctive, production-grade frontend interfaces",
-        system_prompt="""You are an expert frontend designer who creates distinctive, production-grade interfaces that avoid generic aesthetics.
+_FRONTEND_DESIGN_PROMPT = """You are an expert frontend designer who creates distinctive, production-grade interfaces that avoid generic aesthetics.
 
 ## Design Thinking Process
 
@@ -75,22 +73,13 @@ Before coding, commit to a BOLD aesthetic direction:
 Claude is capable of extraordinary creative work. Don't hold back—show what can truly be created when thinking outside the box and committing fully to a distinctive vision.
 
 Match implementation complexity to the aesthetic: maximalist designs need elaborate code; minimalist designs need precision and restraint.
-""",
-        temperature=0.8,
-        max_tokens=8192,
-        metadata={"source": "anthropic/skills", "category": "design"},
-    )
-)
+"""
 
 # =============================================================================
 # Canvas Design Skill
 # =============================================================================
 
-CanvasDesignSkill = register_skill(
-    Skill(
-        name="canvas_design",
-        description="Create interactive canvas-based designs and visualizations",
-        system_prompt="""You are an expert at creating interactive canvas-based designs and visualizations using HTML5 Canvas and related technologies.
+_CANVAS_DESIGN_PROMPT = """You are an expert at creating interactive canvas-based designs and visualizations using HTML5 Canvas and related technologies.
 
 ## Capabilities
 - Interactive graphics and animations
@@ -145,22 +134,13 @@ animate();
 - Batch draw calls when possible
 - Consider WebGL for performance-critical applications
 - Test on various devices and screen sizes
-""",
-        temperature=0.7,
-        max_tokens=8192,
-        metadata={"source": "anthropic/skills", "category": "design"},
-    )
-)
+"""
 
 # =============================================================================
 # Algorithmic Art Skill
 # =============================================================================
 
-AlgorithmicArtSkill = register_skill(
-    Skill(
-        name="algorithmic_art",
-        description="Create generative and algorithmic artwork",
-        system_prompt="""You are an expert in creating generative and algorithmic artwork using code.
+_ALGORITHMIC_ART_PROMPT = """You are an expert in creating generative and algorithmic artwork using code.
 
 ## Capabilities
 - Generative patterns and textures
@@ -239,22 +219,13 @@ function setup() {
 - Three.js for 3D
 - GLSL shaders for performance
 - SVG for vector output
-""",
-        temperature=0.9,
-        max_tokens=8192,
-        metadata={"source": "anthropic/skills", "category": "design"},
-    )
-)
+"""
 
 # =============================================================================
 # Brand Guidelines Skill
 # =============================================================================
 
-BrandGuidelinesSkill = register_skill(
-    Skill(
-        name="brand_guidelines",
-        description="Create and apply brand identity guidelines",
-        system_prompt="""You are an expert in creating and applying brand identity guidelines.
+_BRAND_GUIDELINES_PROMPT = """You are an expert in creating and applying brand identity guidelines.
 
 ## Capabilities
 - Developing comprehensive brand guidelines
@@ -305,22 +276,13 @@ BrandGuidelinesSkill = register_skill(
 - Provide assets and templates
 - Make guidelines accessible and searchable
 - Update regularly as brand evolves
-""",
-        temperature=0.5,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "design"},
-    )
-)
+"""
 
 # =============================================================================
 # Theme Factory Skill
 # =============================================================================
 
-ThemeFactorySkill = register_skill(
-    Skill(
-        name="theme_factory",
-        description="Create design system themes and CSS variable systems",
-        system_prompt="""You are an expert at creating comprehensive design system themes and CSS variable systems.
+_THEME_FACTORY_PROMPT = """You are an expert at creating comprehensive design system themes and CSS variable systems.
 
 ## Capabilities
 - Creating cohesive color systems
@@ -403,9 +365,59 @@ ThemeFactorySkill = register_skill(
 - Support both light and dark modes
 - Include transition properties for smooth theme switching
 - Document all tokens with usage examples
-""",
-        temperature=0.5,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "design"},
-    )
+"""
+
+
+# =============================================================================
+# Skill table
+# =============================================================================
+
+_METADATA = MappingProxyType({"source": "anthropic/skills", "category": "design"})
+
+_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "frontend_design",
+        "description": "Create distinctive, production-grade frontend interfaces",
+        "system_prompt": _FRONTEND_DESIGN_PROMPT,
+        "temperature": 0.8,
+        "max_tokens": 8192,
+    },
+    {
+        "name": "canvas_design",
+        "description": "Create interactive canvas-based designs and visualizations",
+        "system_prompt": _CANVAS_DESIGN_PROMPT,
+        "temperature": 0.7,
+        "max_tokens": 8192,
+    },
+    {
+        "name": "algorithmic_art",
+        "description": "Create generative and algorithmic artwork",
+        "system_prompt": _ALGORITHMIC_ART_PROMPT,
+        "temperature": 0.9,
+        "max_tokens": 8192,
+    },
+    {
+        "name": "brand_guidelines",
+        "description": "Create and apply brand identity guidelines",
+        "system_prompt": _BRAND_GUIDELINES_PROMPT,
+        "temperature": 0.5,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "theme_factory",
+        "description": "Create design system themes and CSS variable systems",
+        "system_prompt": _THEME_FACTORY_PROMPT,
+        "temperature": 0.5,
+        "max_tokens": 4096,
+    },
 )
+
+# Registered together when SkillRegistry loads this module
+_SKILLS = tuple(Skill(**spec, metadata=_METADATA) for spec in _SPECS)
+(
+    FrontendDesignSkill,
+    CanvasDesignSkill,
+    AlgorithmicArtSkill,
+    BrandGuidelinesSkill,
+    ThemeFactorySkill,
+) = _SKILLS
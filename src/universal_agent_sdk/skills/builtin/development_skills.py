@@ -4,18 +4,16 @@ These skills provide specialized capabilities for software development,
 testing, and building tools.
 """
 
+from types import MappingProxyType
+from typing import Any
+
 from ..base import Skill
-from ..registry import register_skill
 
 # =============================================================================
 # MCP Builder Skill
 # =============================================================================
 
-MCPBuilderSkill = register_skill(
-    Skill(
-        name="mcp_builder",
-        description="Build Model Context Protocol (MCP) servers and tools",
-        system_prompt="""You are an expert at building Model Context Protocol (MCP) servers and tools.
+_MCP_BUILDER_PROMPT = """You are an expert at building Model Context Protocol (MCP) servers and tools.
 
 ## What is MCP?
 MCP (Model Context Protocol) is a protocol that allows AI models to interact with external tools and resources. It enables Claude to:
@@ -102,22 +100,13 @@ server.connect(transport);
 - File system operations
 - Web scraping
 - Code execution
-""",
-        temperature=0.3,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "development"},
-    )
-)
+"""
 
 # =============================================================================
 # Skill Creator Skill
 # =============================================================================
 
-SkillCreatorSkill = register_skill(
-    Skill(
-        name="skill_creator",
-        description="Create new skills for Claude",
-        system_prompt="""You are an expert at creating new skills for Claude.
+_SKILL_CREATOR_PROMPT = """You are an expert at creating new skills for Claude.
 
 ## What is a Skill?
 A skill is a specialized capability that combines:
@@ -182,22 +171,13 @@ MySkill = register_skill(
 - **Development** - Coding and engineering
 - **Communication** - Writing and collaboration
 - **Analysis** - Data and research
-""",
-        temperature=0.5,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "development"},
-    )
-)
+"""
 
 # =============================================================================
 # Web Artifacts Builder Skill
 # =============================================================================
 
-WebArtifactsBuilderSkill = register_skill(
-    Skill(
-        name="web_artifacts_builder",
-        description="Build interactive web artifacts and components",
-        system_prompt="""You are an expert at building interactive web artifacts and components.
+_WEB_ARTIFACTS_BUILDER_PROMPT = """You are an expert at building interactive web artifacts and components.
 
 ## Capabilities
 - Creating self-contained HTML/CSS/JS artifacts
@@ -265,22 +245,13 @@ ReactDOM.render(<App />, document.getElementById('root'));
 - Interactive calculators
 - Kanban boards
 - Timeline visualizations
-""",
-        temperature=0.7,
-        max_tokens=8192,
-        metadata={"source": "anthropic/skills", "category": "development"},
-    )
-)
+"""
 
 # =============================================================================
 # Webapp Testing Skill
 # =============================================================================
 
-WebappTestingSkill = register_skill(
-    Skill(
-        name="webapp_testing",
-        description="Test web applications comprehensively",
-        system_prompt="""You are an expert at testing web applications comprehensively.
+_WEBAPP_TESTING_PROMPT = """You are an expert at testing web applications comprehensively.
 
 ## Capabilities
 - Writing unit tests
@@ -361,9 +332,51 @@ test('has no accessibility violations', async () => {
 - Lighthouse for web vitals
 - k6 for load testing
 - WebPageTest for real-world performance
-""",
-        temperature=0.3,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "development"},
-    )
+"""
+
+
+# =============================================================================
+# Skill table
+# =============================================================================
+
+_METADATA = MappingProxyType({"source": "anthropic/skills", "category": "development"})
+
+_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "mcp_builder",
+        "description": "Build Model Context Protocol (MCP) servers and tools",
+        "system_prompt": _MCP_BUILDER_PROMPT,
+        "temperature": 0.3,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "skill_creator",
+        "description": "Create new skills for Claude",
+        "system_prompt": _SKILL_CREATOR_PROMPT,
+        "temperature": 0.5,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "web_artifacts_builder",
+        "description": "Build interactive web artifacts and components",
+        "system_prompt": _WEB_ARTIFACTS_BUILDER_PROMPT,
+        "temperature": 0.7,
+        "max_tokens": 8192,
+    },
+    {
+        "name": "webapp_testing",
+        "description": "Test web applications comprehensively",
+        "system_prompt": _WEBAPP_TESTING_PROMPT,
+        "temperature": 0.3,
+        "max_tokens": 4096,
+    },
 )
+
+# Registered together when SkillRegistry loads this module
+_SKILLS = tuple(Skill(**spec, metadata=_METADATA) for spec in _SPECS)
+(
+    MCPBuilderSkill,
+    SkillCreatorSkill,
+    WebArtifactsBuilderSkill,
+    WebappTestingSkill,
+) = _SKILLS
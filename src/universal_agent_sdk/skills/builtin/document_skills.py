@@ -4,18 +4,16 @@ These skills provide specialized capabilities for working with
 various document formats.
 """
 
+from types import MappingProxyType
+from typing import Any
+
 from ..base import Skill
-from ..registry import register_skill
 
 # =============================================================================
 # PDF Skill
 # =============================================================================
 
-PDFSkill = register_skill(
-    Skill(
-        name="pdf",
-        description="PDF processing and manipulation",
-        system_prompt="""You are an expert at working with PDF documents. You can help with:
+_PDF_PROMPT = """You are an expert at working with PDF documents. You can help with:
 
 ## Capabilities
 - Reading and extracting text from PDFs
@@ -80,22 +78,13 @@ c.save()
 - Use pdfplumber for complex table extraction
 - For scanned PDFs, use OCR (pytesseract + pdf2image)
 - Preserve metadata when merging documents
-""",
-        temperature=0.3,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "document"},
-    )
-)
+"""
 
 # =============================================================================
 # DOCX Skill
 # =============================================================================
 
-DocxSkill = register_skill(
-    Skill(
-        name="docx",
-        description="Word document processing and creation",
-        system_prompt="""You are an expert at working with Microsoft Word (.docx) documents.
+_DOCX_PROMPT = """You are an expert at working with Microsoft Word (.docx) documents.
 
 ## Capabilities
 - Reading and analyzing Word documents
@@ -149,22 +138,13 @@ When editing documents with tracked changes:
 - Use minimal, precise edits for professional results
 - Preserve original formatting and styles
 - Test changes incrementally
-""",
-        temperature=0.3,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "document"},
-    )
-)
+"""
 
 # =============================================================================
 # PPTX Skill
 # =============================================================================
 
-PPTXSkill = register_skill(
-    Skill(
-        name="pptx",
-        description="PowerPoint presentation processing",
-        system_prompt="""You are an expert at working with PowerPoint (.pptx) presentations.
+_PPTX_PROMPT = """You are an expert at working with PowerPoint (.pptx) presentations.
 
 ## Capabilities
 - Creating new presentations from scratch
@@ -233,22 +213,13 @@ table.cell(0, 0).text = "Header"
 - Use high-quality images (PNG or SVG)
 - Maintain consistent color schemes and fonts
 - Test presentation on target display resolution
-""",
-        temperature=0.5,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "document"},
-    )
-)
+"""
 
 # =============================================================================
 # XLSX Skill
 # =============================================================================
 
-XLSXSkill = register_skill(
-    Skill(
-        name="xlsx",
-        description="Excel spreadsheet processing",
-        system_prompt="""You are an expert at working with Excel (.xlsx) spreadsheets.
+_XLSX_PROMPT = """You are an expert at working with Excel (.xlsx) spreadsheets.
 
 ## Capabilities
 - Reading and writing Excel files
@@ -327,9 +298,46 @@ ws.add_chart(chart, "E2")
 - Use named ranges for complex formulas
 - Preserve formatting when modifying existing files
 - Handle large files with read_only/write_only modes
-""",
-        temperature=0.3,
-        max_tokens=4096,
-        metadata={"source": "anthropic/skills", "category": "document"},
-    )
+"""
+
+
+# =============================================================================
+# Skill table
+# =============================================================================
+
+_METADATA = MappingProxyType({"source": "anthropic/skills", "category": "document"})
+
+_SPECS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "pdf",
+        "description": "PDF processing and manipulation",
+        "system_prompt": _PDF_PROMPT,
+        "temperature": 0.3,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "docx",
+        "description": "Word document processing and creation",
+        "system_prompt": _DOCX_PROMPT,
+        "temperature": 0.3,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "pptx",
+        "description": "PowerPoint presentation processing",
+        "system_prompt": _PPTX_PROMPT,
+        "temperature": 0.5,
+        "max_tokens": 4096,
+    },
+    {
+        "name": "xlsx",
+        "description": "Excel spreadsheet processing",
+        "system_prompt": _XLSX_PROMPT,
+        "temperature": 0.3,
+        "max_tokens": 4096,
+    },
 )
+
+# Registered together when SkillRegistry loads this module
+_SKILLS = tuple(Skill(**spec, metadata=_METADATA) for spec in _SPECS)
+PDFSkill, DocxSkill, PPTXSkill, XLSXSkill = _SKILLS
@@ -10,7 +10,12 @@ Skills can be loaded from:
 - Project skills: <cwd>/.claude/skills/ (project-specific skills)
 """
 
+import copy
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -45,6 +50,26 @@ class SkillMetadata:
     tags: list[str] = field(default_factory=list)
 
 
+# Parsed SKILL.md files by path, with the (mtime_ns, size) they were parsed at
+# so that edited files are read again. Least recently used entries are evicted.
+_SKILL_FILE_CACHE: OrderedDict[str, tuple[tuple[int, int], SkillMetadata, str]] = (
+    OrderedDict()
+)
+_MAX_SKILL_FILE_CACHE = 512
+_SKILL_FILE_CACHE_LOCK = threading.Lock()
+
+# Paths found missing, with the time.monotonic() deadline until which they are
+# assumed to still be missing. Discovery probes the same absent directories on
+# every call; the oldest entries are evicted first. Guarded by
+# _SKILL_FILE_CACHE_LOCK, since discovery runs on worker threads.
+_MISSING_PATHS: dict[str, float] = {}
+_MISSING_PATH_TTL = 5.0
+_MAX_MISSING_PATHS = 1024
+
+# YAML frontmatter between --- markers, followed by the Markdown body
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+
 def parse_skill_md(
     content: str, default_name: str = "skill"
 ) -> tuple[SkillMetadata, str]:
@@ -61,8 +86,7 @@ def parse_skill_md(
         ValueError: If the file format is invalid
     """
     # Match YAML frontmatter between --- markers
-    frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if not match:
         # No frontmatter, treat entire content as markdown
@@ -90,6 +114,115 @@ def parse_skill_md(
     return metadata, markdown_content
 
 
+def clear_skill_cache() -> None:
+    """Forget cached SKILL.md files and paths recently found missing.
+
+    Missing paths are remembered for a few seconds, so call this after
+    creating a skill that should be discovered immediately.
+    """
+    with _SKILL_FILE_CACHE_LOCK:
+        _SKILL_FILE_CACHE.clear()
+        _MISSING_PATHS.clear()
+
+
+def _is_known_missing(path: Path) -> bool:
+    """Check whether a path was recently found missing."""
+    key = str(path)
+    with _SKILL_FILE_CACHE_LOCK:
+        deadline = _MISSING_PATHS.get(key)
+        if deadline is None:
+            return False
+        if time.monotonic() < deadline:
+            return True
+        _MISSING_PATHS.pop(key, None)
+    return False
+
+
+def _mark_missing(path: Path) -> None:
+    """Remember that a path does not exist."""
+    key = str(path)
+    deadline = time.monotonic() + _MISSING_PATH_TTL
+    with _SKILL_FILE_CACHE_LOCK:
+        _MISSING_PATHS.pop(key, None)
+        _MISSING_PATHS[key] = deadline
+        if len(_MISSING_PATHS) > _MAX_MISSING_PATHS:
+            _MISSING_PATHS.pop(next(iter(_MISSING_PATHS)), None)
+
+
+def _read_skill_file(skill_file: Path) -> tuple[SkillMetadata, str]:
+    """Parse a SKILL.md file, reusing the result while the file is unchanged.
+
+    The returned metadata is shared with the cache and must not be mutated;
+    use _skill_file_metadata to build a Skill's metadata from it.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file format is invalid
+    """
+    stat = skill_file.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = str(skill_file)
+    with _SKILL_FILE_CACHE_LOCK:
+        cached = _SKILL_FILE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _SKILL_FILE_CACHE.move_to_end(key)
+            return cached[1], cached[2]
+
+    content = skill_file.read_text(encoding="utf-8")
+    metadata, system_prompt = parse_skill_md(
+        content, default_name=skill_file.parent.name
+    )
+    with _SKILL_FILE_CACHE_LOCK:
+        _SKILL_FILE_CACHE[key] = (stamp, metadata, system_prompt)
+        _SKILL_FILE_CACHE.move_to_end(key)
+        if len(_SKILL_FILE_CACHE) > _MAX_SKILL_FILE_CACHE:
+            _SKILL_FILE_CACHE.popitem(last=False)
+    return metadata, system_prompt
+
+
+def _read_skill_metadata(skill_file: Path) -> SkillMetadata:
+    """Parse only the frontmatter of a SKILL.md file.
+
+    Reading stops at the closing --- marker, so the prompt body is neither
+    read nor decoded. Files without frontmatter are parsed in full.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file format is invalid
+    """
+    cached = _SKILL_FILE_CACHE.get(str(skill_file))
+    if cached is not None:
+        stat = skill_file.stat()
+        if cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+
+    with skill_file.open(encoding="utf-8") as fh:
+        lines = [fh.readline()]
+        if lines[0].rstrip() == "---":
+            for line in fh:
+                lines.append(line)
+                if line.rstrip() == "---":
+                    break
+    head = "".join(lines)
+    if not _FRONTMATTER_RE.match(head):
+        return _read_skill_file(skill_file)[0]
+    return parse_skill_md(head, default_name=skill_file.parent.name)[0]
+
+
+def _skill_file_metadata(metadata: SkillMetadata, source: Path) -> dict[str, Any]:
+    """Build the metadata of a Skill loaded from a SKILL.md file.
+
+    Mutable values are copied so that skills never share them with the cache.
+    """
+    return {
+        "source": str(source),
+        "version": metadata.version,
+        "author": metadata.author,
+        "tags": copy.copy(metadata.tags),
+        "allowed_tools": copy.copy(metadata.allowed_tools),
+    }
+
+
 def load_skill_from_path(skill_dir: Path) -> Skill | None:
     """Load a skill from a directory containing SKILL.md.
 
@@ -101,24 +234,20 @@ def load_skill_from_path(skill_dir: Path) -> Skill | None:
     """
     skill_file = skill_dir / "SKILL.md"
 
+    if _is_known_missing(skill_file):
+        return None
     if not skill_file.exists():
+        _mark_missing(skill_file)
         return None
 
     try:
-        content = skill_file.read_text(encoding="utf-8")
-        metadata, system_prompt = parse_skill_md(content, default_name=skill_dir.name)
+        metadata, system_prompt = _read_skill_file(skill_file)
 
         return Skill(
             name=metadata.name,
             description=metadata.description,
             system_prompt=system_prompt,
-            metadata={
-                "source": str(skill_dir),
-                "version": metadata.version,
-                "author": metadata.author,
-                "tags": metadata.tags,
-                "allowed_tools": metadata.allowed_tools,
-            },
+            metadata=_skill_file_metadata(metadata, skill_dir),
         )
     except (ValueError, OSError):
         return None
@@ -135,25 +264,53 @@ def get_bundled_skills() -> list[Skill]:
     """
     skills: list[Skill] = []
 
-    if BUNDLED_SKILLS_DIR.exists() and BUNDLED_SKILLS_DIR.is_dir():
-        for skill_dir in BUNDLED_SKILLS_DIR.iterdir():
-            if skill_dir.is_dir():
-                skill = load_skill_from_path(skill_dir)
-                if skill:
-                    # Mark as bundled
-                    skill.metadata["bundled"] = True
-                    skills.append(skill)
+    for skill in _load_skills(_list_skill_dirs(BUNDLED_SKILLS_DIR)):
+        if skill:
+            # Mark as bundled
+            skill.set_metadata("bundled", True)
+            skills.append(skill)
 
     return skills
 
 
+def _list_skill_dirs(skills_dir: Path) -> list[Path]:
+    """List the skill directories inside a skills directory, if it exists."""
+    if _is_known_missing(skills_dir):
+        return []
+    if not skills_dir.is_dir():
+        _mark_missing(skills_dir)
+        return []
+    return [skill_dir for skill_dir in skills_dir.iterdir() if skill_dir.is_dir()]
+
+
+def _load_skills(skill_dirs: list[Path]) -> list[Skill | None]:
+    """Load skills from directories, in order.
+
+    Loading is dominated by file I/O, which can be slow on network
+    filesystems, so several directories are read concurrently.
+    """
+    if len(skill_dirs) < 2:
+        return [load_skill_from_path(skill_dir) for skill_dir in skill_dirs]
+    with ThreadPoolExecutor(max_workers=min(8, len(skill_dirs))) as executor:
+        return list(executor.map(load_skill_from_path, skill_dirs))
+
+
 def list_bundled_skills() -> list[str]:
     """List names of all bundled skills.
 
     Returns:
         List of bundled skill names
     """
-    return [skill.name for skill in get_bundled_skills()]
+    names: list[str] = []
+    if BUNDLED_SKILLS_DIR.exists() and BUNDLED_SKILLS_DIR.is_dir():
+        for skill_dir in BUNDLED_SKILLS_DIR.iterdir():
+            skill_file = skill_dir / "SKILL.md"
+            if skill_dir.is_dir() and skill_file.exists():
+                try:
+                    names.append(_read_skill_metadata(skill_file).name)
+                except (ValueError, OSError):
+                    continue
+    return names
 
 
 def get_bundled_skill(name: str) -> Skill | None:
@@ -169,7 +326,7 @@ def get_bundled_skill(name: str) -> Skill | None:
     if skill_dir.exists() and skill_dir.is_dir():
         skill = load_skill_from_path(skill_dir)
         if skill:
-            skill.metadata["bundled"] = True
+            skill.set_metadata("bundled", True)
             return skill
     return None
 
@@ -207,28 +364,22 @@ def discover_skills(
                 skills.append(skill)
                 seen_names.add(skill.name)
 
+    skill_dirs: list[Path] = []
+
     # User skills directory (~/.claude/skills/)
     if "user" in setting_sources:
-        user_skills_dir = Path.home() / ".claude" / "skills"
-        if user_skills_dir.exists() and user_skills_dir.is_dir():
-            for skill_dir in user_skills_dir.iterdir():
-                if skill_dir.is_dir():
-                    loaded_skill = load_skill_from_path(skill_dir)
-                    if loaded_skill and loaded_skill.name not in seen_names:
-                        skills.append(loaded_skill)
-                        seen_names.add(loaded_skill.name)
+        skill_dirs.extend(_list_skill_dirs(Path.home() / ".claude" / "skills"))
 
     # Project skills directory (<cwd>/.claude/skills/)
     if "project" in setting_sources:
         project_dir = Path(cwd) if cwd else Path.cwd()
-        project_skills_dir = project_dir / ".claude" / "skills"
-        if project_skills_dir.exists() and project_skills_dir.is_dir():
-            for skill_dir in project_skills_dir.iterdir():
-                if skill_dir.is_dir():
-                    loaded_skill = load_skill_from_path(skill_dir)
-                    if loaded_skill and loaded_skill.name not in seen_names:
-                        skills.append(loaded_skill)
-                        seen_names.add(loaded_skill.name)
+        skill_dirs.extend(_list_skill_dirs(project_dir / ".claude" / "skills"))
+
+    # Results keep directory order, so earlier sources still win on name clashes
+    for loaded_skill in _load_skills(skill_dirs):
+        if loaded_skill and loaded_skill.name not in seen_names:
+            skills.append(loaded_skill)
+            seen_names.add(loaded_skill.name)
 
     return skills
 
@@ -1,10 +1,36 @@
 """Skill registry for managing and discovering skills."""
 
+import importlib
+from types import ModuleType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import Skill
 
+# Modules under .builtin defining the built-in skills, keyed by skill name.
+# They are imported on first lookup so that the prompts are only built when
+# a built-in skill is actually used.
+_BUILTIN_SKILL_MODULES: dict[str, str] = {
+    "pdf": "document_skills",
+    "docx": "document_skills",
+    "pptx": "document_skills",
+    "xlsx": "document_skills",
+    "frontend_design": "design_skills",
+    "canvas_design": "design_skills",
+    "algorithmic_art": "design_skills",
+    "brand_guidelines": "design_skills",
+    "theme_factory": "design_skills",
+    "mcp_builder": "development_skills",
+    "skill_creator": "development_skills",
+    "web_artifacts_builder": "development_skills",
+    "webapp_testing": "development_skills",
+    "doc_coauthoring": "communication_skills",
+    "internal_comms": "communication_skills",
+    "slack_gif_creator": "communication_skills",
+}
+# Built-in modules whose skills still have to be added to the registry
+_PENDING_BUILTINS: set[str] = set(_BUILTIN_SKILL_MODULES.values())
+
 
 class SkillRegistry:
     """Registry for managing skills.
@@ -52,6 +78,10 @@ class SkillRegistry:
         Raises:
             KeyError: If skill is not found
         """
+        if name not in cls._skills:
+            module_name = _BUILTIN_SKILL_MODULES.get(name)
+            if module_name is not None:
+                _import_builtin_module(module_name)
         if name not in cls._skills:
             raise KeyError(
                 f"Skill '{name}' not found. Available: {list(cls._skills.keys())}"
@@ -65,6 +95,7 @@ class SkillRegistry:
         Returns:
             List of skill names
         """
+        _import_pending_builtins()
         return list(cls._skills.keys())
 
     @classmethod
@@ -74,12 +105,38 @@ class SkillRegistry:
         Returns:
             Dictionary of skill name to skill instance
         """
+        _import_pending_builtins()
         return cls._skills.copy()
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered skills."""
         cls._skills.clear()
+        _PENDING_BUILTINS.clear()
+
+
+def _import_builtin_module(module_name: str) -> ModuleType:
+    """Import a built-in skill module, registering its skills once.
+
+    The module's skills are added in one update. Skills registered earlier
+    under the same names take precedence, as they did when the built-ins were
+    loaded eagerly, and a cleared registry stays cleared.
+    """
+    module = importlib.import_module(f".builtin.{module_name}", __package__)
+    if module_name in _PENDING_BUILTINS:
+        _PENDING_BUILTINS.discard(module_name)
+        registered = SkillRegistry._skills
+        builtins = {skill.name: skill for skill in module._SKILLS}
+        registered.update(
+            {name: skill for name, skill in builtins.items() if name not in registered}
+        )
+    return module
+
+
+def _import_pending_builtins() -> None:
+    """Register every built-in skill that has not been loaded yet."""
+    for module_name in sorted(_PENDING_BUILTINS):
+        _import_builtin_module(module_name)
 
 
 # Convenience functions
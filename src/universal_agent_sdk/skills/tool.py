@@ -286,7 +286,7 @@ IMPORTANT: Only invoke skills listed in <available_skills> above.
             allowed_tools=allowed_tools,
             model_override=model_override,
             base_dir=base_dir,
-            metadata=skill_obj.metadata,
+            metadata=dict(skill_obj.metadata),
         )
 
     def add_skill(self, skill: Skill) -> None:
@@ -1,8 +1,10 @@
 """Type definitions for Universal Agent SDK."""
 
+import inspect
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 if TYPE_CHECKING:
@@ -49,7 +51,7 @@ class ContentType(str, Enum):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """Text content block."""
 
@@ -65,8 +67,18 @@ class ImageBlock:
     media_type: str = "image/png"
     type: Literal["image"] = "image"
 
+    @cached_property
+    def base64_data(self) -> str:
+        """Payload of a ``data:`` URL source, without the ``data:...,`` prefix.
 
-@dataclass
+        Computed once per block, so re-sending a large image with the rest of
+        the history does not rescan and copy it on every turn.
+        """
+        comma = self.source.find(",")
+        return self.source[comma + 1 :] if comma != -1 else self.source
+
+
+@dataclass(slots=True)
 class ThinkingBlock:
     """Thinking/reasoning content block."""
 
@@ -75,7 +87,7 @@ class ThinkingBlock:
     type: Literal["thinking"] = "thinking"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUseBlock:
     """Tool use request block."""
 
@@ -85,7 +97,7 @@ class ToolUseBlock:
     type: Literal["tool_use"] = "tool_use"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultBlock:
     """Tool result block."""
 
@@ -103,7 +115,7 @@ ContentBlock = TextBlock | ImageBlock | ThinkingBlock | ToolUseBlock | ToolResul
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMessage:
     """User message."""
 
@@ -113,7 +125,7 @@ class UserMessage:
     uuid: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantMessage:
     """Assistant message with content blocks."""
 
@@ -124,7 +136,7 @@ class AssistantMessage:
     uuid: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMessage:
     """System message."""
 
@@ -133,7 +145,7 @@ class SystemMessage:
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMessage:
     """Tool result message (for OpenAI-style API)."""
 
@@ -151,7 +163,7 @@ Message = UserMessage | AssistantMessage | SystemMessage | ToolMessage
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     """Token usage information."""
 
@@ -163,7 +175,7 @@ class Usage:
     cache_creation_tokens: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultMessage:
     """Result message with cost and usage information."""
 
@@ -177,7 +189,7 @@ class ResultMessage:
     finish_reason: FinishReason | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """Stream event for partial message updates."""
 
@@ -226,6 +238,21 @@ class ToolDefinition:
     input_schema: ToolSchema | dict[str, Any]
     handler: Callable[..., Awaitable[Any] | Any] | None = None
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the handler is declared ``async``.
+
+        True for ``async def`` functions and objects with an
+        ``async def __call__``. Sync handlers may still return awaitables,
+        so callers should check their results as well.
+        """
+        handler = self.handler
+        if not callable(handler):
+            return False
+        return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+            type(handler).__call__
+        )
+
 
 # =============================================================================
 # Tool Permission Types
@@ -421,7 +448,7 @@ class AgentDefinition:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """A single memory entry."""
 
@@ -432,7 +459,7 @@ class MemoryEntry:
     timestamp: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySearchResult:
     """Result from memory search."""
 
@@ -625,6 +652,17 @@ class AgentOptions:
     # Streaming configuration
     stream: bool = True
     include_usage: bool = True
+    # Leave streamed text out of the final AssistantMessage so long
+    # generations are not held in memory twice; it then carries only thinking
+    # and tool_use blocks and the consumer must aggregate text deltas itself
+    stream_discard_final: bool = False
+    # Yield StreamEvents for partial updates; when False a streamed response
+    # produces only the final AssistantMessage and ResultMessage
+    yield_stream_events: bool = True
+    # Merge up to this many text deltas into one StreamEvent, flushing early
+    # once stream_batch_ms has passed since the last one (OpenAI)
+    stream_batch_size: int = 1
+    stream_batch_ms: float = 20.0
 
     # Cost/budget configuration
     max_budget_usd: float | None = None
@@ -632,6 +670,10 @@ class AgentOptions:
     # Extended features
     enable_thinking: bool = False
     max_thinking_tokens: int | None = None
+    # Mark the system prompt, tools and conversation prefix as cacheable on
+    # providers that support prompt caching (Anthropic). Off by default since
+    # cache writes cost more than plain input for prompts that are not reused
+    prompt_caching: bool = False
 
     # Environment
     cwd: str | None = None
@@ -0,0 +1,448 @@
+"""Tests for the Claude provider."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from universal_agent_sdk.providers import claude as claude_provider
+from universal_agent_sdk.providers.claude import ClaudeProvider
+from universal_agent_sdk.types import (
+    AgentOptions,
+    AssistantMessage,
+    FinishReason,
+    ImageBlock,
+    SystemMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolDefinition,
+    ToolMessage,
+    ToolUseBlock,
+    UserMessage,
+)
+
+
+class FakeMessages:
+    """Stand-in for AsyncAnthropic().messages that records request kwargs."""
+
+    def __init__(self, response=None, events=()):
+        self.response = response
+        self.events = events
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeStream(self.events)
+
+
+class FakeStream:
+    """Async context manager yielding pre-built stream events."""
+
+    def __init__(self, events):
+        self.events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+
+
+def make_provider(messages):
+    """Build a ClaudeProvider whose client is replaced by ``messages``."""
+    provider = ClaudeProvider({"api_key": "test"})
+    provider._client = SimpleNamespace(messages=messages)
+    return provider
+
+
+def text_response(text="ok"):
+    """Build a minimal non-streaming Anthropic response."""
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        model="claude-test",
+        stop_reason="end_turn",
+    )
+
+
+TOOL = ToolDefinition(
+    name="Read",
+    description="Read a file",
+    input_schema={"type": "object", "properties": {}},
+)
+
+
+class TestClaudeFormatting:
+    """Test conversion of SDK messages to the Anthropic format."""
+
+    def test_format_messages(self):
+        """Test that the system prompt is split out and tool results nest."""
+        provider = ClaudeProvider({"api_key": "test"})
+
+        system, formatted = provider.format_messages(
+            [
+                SystemMessage(content="Be brief."),
+                UserMessage(content="Hi"),
+                AssistantMessage(
+                    content=[
+                        ThinkingBlock(thinking="hmm", signature="sig"),
+                        ToolUseBlock(id="t1", name="Read", input={"path": "x"}),
+                    ]
+                ),
+                ToolMessage(content="data", tool_call_id="t1"),
+            ]
+        )
+
+        assert system == "Be brief."
+        assert formatted == [
+            {"role": "user", "content": "Hi"},
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "thinking", "thinking": "hmm", "signature": "sig"},
+                    {
+                        "type": "tool_use",
+                        "id": "t1",
+                        "name": "Read",
+                        "input": {"path": "x"},
+                    },
+                ],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": "t1", "content": "data"}
+                ],
+            },
+        ]
+
+    def test_patched_formatter_is_used(self, monkeypatch):
+        """Test that formatters patched after class creation take effect."""
+        monkeypatch.setattr(
+            ClaudeProvider,
+            "_format_user_message",
+            lambda self, message: {"role": "user", "content": "patched"},
+        )
+        provider = ClaudeProvider({"api_key": "test"})
+
+        _, formatted = provider.format_messages([UserMessage(content="Hi")])
+
+        assert formatted == [{"role": "user", "content": "patched"}]
+
+    def test_format_image_blocks(self):
+        """Test base64 data URLs and plain URLs for images."""
+        provider = ClaudeProvider({"api_key": "test"})
+
+        formatted = provider._format_content_blocks(
+            [
+                ImageBlock(source="data:image/png;base64,AAAA"),
+                ImageBlock(source="https://example.com/x.png"),
+                TextBlock(text="caption"),
+            ]
+        )
+
+        assert formatted == [
+            {
+                "type": "image",
+                "source": {"type": "base64", "media_type": "image/png", "data": "AAAA"},
+            },
+            {
+                "type": "image",
+                "source": {"type": "url", "url": "https://example.com/x.png"},
+            },
+            {"type": "text", "text": "caption"},
+        ]
+
+    def test_parse_response(self):
+        """Test conversion of a non-streaming response to SDK blocks."""
+        provider = ClaudeProvider({"api_key": "test"})
+        ns = SimpleNamespace
+        response = ns(
+            content=[
+                ns(type="thinking", thinking="hm", signature="sig"),
+                ns(type="text", text="Hi"),
+                ns(type="redacted_thinking", data="..."),
+                ns(type="tool_use", id="t1", name="Read", input={"path": "x"}),
+            ],
+            model="claude-test",
+            stop_reason="tool_use",
+        )
+
+        message = provider.parse_response(response)
+
+        assert message.content == [
+            ThinkingBlock(thinking="hm", signature="sig"),
+            TextBlock(text="Hi"),
+            ToolUseBlock(id="t1", name="Read", input={"path": "x"}),
+        ]
+        assert message.finish_reason == FinishReason.TOOL_USE
+
+
+class TestClaudePromptCaching:
+    """Test prompt caching breakpoints in Claude requests."""
+
+    async def test_complete_marks_cache_breakpoints(self):
+        """Test that system, last tool and last message are cacheable."""
+        fake = FakeMessages(response=text_response())
+        provider = make_provider(fake)
+        options = AgentOptions(
+            system_prompt="Be brief.", tools=[TOOL, TOOL], prompt_caching=True
+        )
+
+        await provider.complete([UserMessage(content="Hi")], options)
+
+        kwargs = fake.calls[0]
+        ephemeral = {"type": "ephemeral"}
+        assert kwargs["system"] == [
+            {"type": "text", "text": "Be brief.", "cache_control": ephemeral}
+        ]
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["tools"][1]["cache_control"] == ephemeral
+        assert kwargs["messages"] == [
+            {
+                "role": "user",
+                "content": [{"type": "text", "text": "Hi", "cache_control": ephemeral}],
+            }
+        ]
+
+    async def test_prompt_caching_is_off_by_default(self):
+        """Test that requests carry no cache breakpoints unless enabled."""
+        fake = FakeMessages(response=text_response())
+        provider = make_provider(fake)
+        options = AgentOptions()
+
+        await provider.complete(
+            [SystemMessage(content="Be brief."), UserMessage(content="Hi")], options
+        )
+
+        kwargs = fake.calls[0]
+        assert kwargs["system"] == "Be brief."
+        assert kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+
+
+def stream_events():
+    """Build an Anthropic event sequence with text, a tool call and thinking."""
+    ns = SimpleNamespace
+    return [
+        ns(type="message_start", message=ns(model="claude-test")),
+        ns(type="content_block_start", index=0, content_block=ns(type="thinking")),
+        ns(
+            type="content_block_delta",
+            index=0,
+            delta=ns(type="thinking_delta", thinking="hm"),
+        ),
+        ns(
+            type="content_block_delta",
+            index=0,
+            delta=ns(type="signature_delta", signature="sig"),
+        ),
+        ns(type="content_block_stop", index=0),
+        ns(type="content_block_start", index=1, content_block=ns(type="text")),
+        ns(type="content_block_delta", index=1, delta=ns(type="text_delta", text="He")),
+        ns(type="content_block_delta", index=1, delta=ns(type="text_delta", text="y")),
+        ns(type="content_block_stop", index=1),
+        ns(
+            type="content_block_start",
+            index=2,
+            content_block=ns(type="tool_use", id="t1", name="Read"),
+        ),
+        ns(
+            type="content_block_delta",
+            index=2,
+            delta=ns(type="input_json_delta", partial_json='{"path": '),
+        ),
+        ns(
+            type="content_block_delta",
+            index=2,
+            delta=ns(type="input_json_delta", partial_json='"x"}'),
+        ),
+        ns(type="content_block_stop", index=2),
+        ns(
+            type="message_delta",
+            delta=ns(stop_reason="tool_use"),
+            usage=ns(input_tokens=3, output_tokens=5),
+        ),
+        ns(type="message_stop"),
+    ]
+
+
+class TestClaudeRequest:
+    """Test construction of Messages API arguments."""
+
+    @pytest.mark.parametrize(
+        ("tool_choice", "expected"),
+        [
+            ("auto", {"type": "auto"}),
+            ("required", {"type": "any"}),
+            ("none", {"type": "none"}),
+            ("Read", {"type": "tool", "name": "Read"}),
+        ],
+    )
+    def test_tool_choice(self, tool_choice, expected):
+        """Test mapping of SDK tool_choice values."""
+        provider = ClaudeProvider({"api_key": "test"})
+        options = AgentOptions(tools=[TOOL], tool_choice=tool_choice)
+
+        kwargs = provider._build_request_kwargs([UserMessage(content="Hi")], options)
+
+        assert kwargs["tool_choice"] == expected
+
+
+class TestClaudeStreaming:
+    """Test assembly of streamed Claude responses."""
+
+    async def test_stream_assembles_blocks(self):
+        """Test that deltas are forwarded and folded into the final message."""
+        provider = make_provider(FakeMessages(events=stream_events()))
+
+        output = [
+            message
+            async for message in provider.stream(
+                [UserMessage(content="Hi")], AgentOptions()
+            )
+        ]
+
+        *events, assistant, result = output
+        assert [e.event_type for e in events].count("content_block_delta") == 6
+        assert events[-2].delta == {
+            "type": "input_json_delta",
+            "partial_json": '"x"}',
+        }
+        assert assistant.model == "claude-test"
+        assert assistant.content == [
+            ThinkingBlock(thinking="hm", signature="sig"),
+            TextBlock(text="Hey"),
+            ToolUseBlock(id="t1", name="Read", input={"path": "x"}),
+        ]
+        assert assistant.finish_reason == FinishReason.TOOL_USE
+        assert result.usage.total_tokens == 8
+
+    async def test_stream_discard_final_drops_only_text(self):
+        """Test that text is streamed but not retained when discarding.
+
+        Thinking blocks stay in the final message, since the next turn of a
+        tool call must send them back.
+        """
+        provider = make_provider(FakeMessages(events=stream_events()))
+        options = AgentOptions(stream_discard_final=True)
+
+        output = [
+            message
+            async for message in provider.stream([UserMessage(content="Hi")], options)
+        ]
+
+        text_deltas = [
+            e.delta["text"]
+            for e in output[:-2]
+            if e.delta and e.delta.get("type") == "text_delta"
+        ]
+        assert text_deltas == ["He", "y"]
+        assert output[-2].content == [
+            ThinkingBlock(thinking="hm", signature="sig"),
+            ToolUseBlock(id="t1", name="Read", input={"path": "x"}),
+        ]
+
+    async def test_invalid_tool_input_becomes_empty(self):
+        """Test that unparsable streamed tool input falls back to {}."""
+        ns = SimpleNamespace
+        events = [
+            ns(
+                type="content_block_start",
+                index=0,
+                content_block=ns(type="tool_use", id="t1", name="Read"),
+            ),
+            ns(
+                type="content_block_delta",
+                index=0,
+                delta=ns(type="input_json_delta", partial_json='{"path": '),
+            ),
+            ns(type="content_block_stop", index=0),
+        ]
+        provider = make_provider(FakeMessages(events=events))
+
+        output = [
+            message
+            async for message in provider.stream(
+                [UserMessage(content="Hi")], AgentOptions()
+            )
+        ]
+
+        assert output[-2].content == [ToolUseBlock(id="t1", name="Read", input={})]
+
+
+class TestClaudeToolCache:
+    """Test reuse of formatted tool definitions across requests."""
+
+    async def test_same_tools_are_formatted_once(self, monkeypatch):
+        """Test that an unchanged tool list is not reformatted."""
+        fake = FakeMessages(response=text_response())
+        provider = make_provider(fake)
+        calls = []
+        format_tools = provider.format_tools
+        monkeypatch.setattr(
+            ClaudeProvider,
+            "format_tools",
+            lambda self, tools: calls.append(tools) or format_tools(tools),
+        )
+        options = AgentOptions(tools=[TOOL])
+
+        await provider.complete([UserMessage(content="Hi")], options)
+        await provider.complete([UserMessage(content="Again")], options)
+        other = ToolDefinition(name="Write", description="", input_schema={})
+        options = AgentOptions(tools=[other])
+        await provider.complete([UserMessage(content="New")], options)
+
+        assert len(calls) == 2
+        assert fake.calls[1]["tools"] == fake.calls[0]["tools"]
+        assert fake.calls[2]["tools"][0]["name"] == "Write"
+
+
+class TestClaudeClientSharing:
+    """Test sharing of AsyncAnthropic clients between providers."""
+
+    async def test_same_settings_share_client(self):
+        """Test that providers with equal settings reuse one client."""
+        first = ClaudeProvider({"api_key": "shared"})._get_client()
+        second = ClaudeProvider({"api_key": "shared"})._get_client()
+        other = ClaudeProvider({"api_key": "other"})._get_client()
+
+        assert first is second
+        assert other is not first
+
+    def test_clients_are_not_shared_across_event_loops(self):
+        """Test that each event loop gets its own client."""
+
+        async def get_client():
+            return ClaudeProvider({"api_key": "per-loop"})._get_client()
+
+        assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+    def test_provider_gets_a_client_per_event_loop(self):
+        """Test that a provider reused across loops does not keep a stale client."""
+        provider = ClaudeProvider({"api_key": "reused"})
+
+        async def get_client():
+            return provider._get_client()
+
+        assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+    def test_closed_loop_pool_is_released(self):
+        """Test that the clients of a closed event loop are dropped."""
+        loops = []
+
+        async def get_client():
+            loops.append(asyncio.get_running_loop())
+            return ClaudeProvider({"api_key": "released"})._get_client()
+
+        asyncio.run(get_client())
+        asyncio.run(get_client())
+
+        assert loops[0] not in claude_provider._CLIENT_POOLS
+        assert loops[1] in claude_provider._CLIENT_POOLS
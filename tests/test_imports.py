@@ -1,5 +1,8 @@
 """Test that all main exports are importable."""
 
+import subprocess
+import sys
+
 import pytest
 
 
@@ -55,6 +58,55 @@ def test_error_imports():
     assert RateLimitError is not None
 
 
+def test_provider_imports():
+    """Test that lazily loaded provider classes are available."""
+    from universal_agent_sdk import (
+        AzureOpenAIProvider,
+        ClaudeProvider,
+        OpenAIProvider,
+        ProviderRegistry,
+    )
+
+    assert ClaudeProvider.name == "claude"
+    assert OpenAIProvider.name == "openai"
+    assert AzureOpenAIProvider.name == "azure_openai"
+    assert ProviderRegistry.is_registered("anthropic")
+
+
+def test_provider_modules_defer_sdk_imports():
+    """Test that importing provider modules does not load the vendor SDKs."""
+    code = (
+        "import sys\n"
+        "import universal_agent_sdk.providers.claude\n"
+        "import universal_agent_sdk.providers.openai\n"
+        "print('anthropic' in sys.modules, 'openai' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_builtin_skills_load_on_first_use():
+    """Test that built-in skills are built on access, not at import time."""
+    code = (
+        "import sys\n"
+        "from universal_agent_sdk.skills import Skill, SkillRegistry, get_skill\n"
+        "loaded = lambda: sorted(m for m in sys.modules if '.skills.builtin.' in m)\n"
+        "print(loaded())\n"
+        "custom = Skill(name='pdf', description='', system_prompt='mine')\n"
+        "SkillRegistry.register(custom)\n"
+        "print(get_skill('docx').name, len(loaded()))\n"
+        "print(len(SkillRegistry.list()), get_skill('pdf') is custom)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["[]", "docx", "1", "16", "True"]
+
+
 def test_agent_options_creation():
     """Test creating AgentOptions with different providers."""
     from universal_agent_sdk import AgentOptions
@@ -0,0 +1,192 @@
+"""Tests for memory module."""
+
+import pytest
+
+from universal_agent_sdk.errors import MemoryError
+from universal_agent_sdk.memory import PersistentMemory
+
+
+@pytest.fixture
+def memory(tmp_path):
+    """Provide a PersistentMemory backed by a temporary file."""
+    return PersistentMemory(tmp_path / "memory.json")
+
+
+class TestPersistentMemorySearch:
+    """Test PersistentMemory keyword search."""
+
+    async def test_search_scores_keyword_overlap(self, memory):
+        """Test that entries are scored by the fraction of query words found."""
+        full_id = await memory.add("the quick brown fox")
+        half_id = await memory.add("a brown dog")
+        await memory.add("nothing relevant here")
+
+        results = await memory.search("quick brown")
+
+        assert [r.entry.id for r in results] == [full_id, half_id]
+        assert results[0].score == 1.0
+        assert results[1].score == 0.5
+
+    async def test_search_is_case_insensitive(self, memory):
+        """Test that search ignores case."""
+        entry_id = await memory.add("Project Apollo notes")
+
+        results = await memory.search("APOLLO")
+
+        assert [r.entry.id for r in results] == [entry_id]
+
+    async def test_search_respects_limit(self, memory):
+        """Test that search returns at most `limit` results."""
+        for i in range(5):
+            await memory.add(f"shared word {i}")
+
+        results = await memory.search("shared", limit=3)
+
+        assert len(results) == 3
+
+    async def test_search_skips_deleted_entries(self, memory):
+        """Test that deleted entries are no longer returned."""
+        entry_id = await memory.add("temporary fact")
+        await memory.delete(entry_id)
+
+        assert await memory.search("temporary") == []
+
+    async def test_search_after_clear(self, memory):
+        """Test that clear empties the search index."""
+        await memory.add("cleared fact")
+        await memory.clear()
+
+        assert await memory.search("cleared") == []
+
+    async def test_substring_index_matches_phrase_bonus(self, tmp_path):
+        """Test that the trigram index gives the same scores as a direct scan."""
+        plain = PersistentMemory(tmp_path / "plain.json")
+        indexed = PersistentMemory(tmp_path / "indexed.json", substring_index=True)
+        for memory in (plain, indexed):
+            await memory.add("the quick brown fox")
+            await memory.add("brown quick fox")
+            removed_id = await memory.add("quick brown bear")
+            await memory.delete(removed_id)
+
+        for query in ("quick brown", "qu", "fox"):
+            expected = [(r.entry.content, r.score) for r in await plain.search(query)]
+            actual = [(r.entry.content, r.score) for r in await indexed.search(query)]
+            assert actual == expected
+
+    async def test_fuzzy_search_tolerates_typos(self, memory):
+        """Test that fuzzy search matches words within the edit budget."""
+        entry_id = await memory.add("deployment checklist")
+
+        assert await memory.search("deploymnt") == []
+        results = await memory.search("deploymnt checklst", fuzzy=True)
+        assert [r.entry.id for r in results] == [entry_id]
+        assert results[0].score == 1.0
+
+    async def test_fuzzy_search_tracks_deletions(self, memory):
+        """Test that words of deleted entries stop matching fuzzily."""
+        await memory.search("warmup", fuzzy=True)
+        entry_id = await memory.add("kubernetes")
+        assert len(await memory.search("kubernets", fuzzy=True)) == 1
+
+        await memory.delete(entry_id)
+        assert await memory.search("kubernets", fuzzy=True) == []
+
+
+class TestPersistentMemoryStorage:
+    """Test PersistentMemory persistence."""
+
+    async def test_entries_survive_reload(self, tmp_path):
+        """Test that a new instance loads and indexes saved entries."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path)
+        entry_id = await memory.add("persisted content", {"source": "test"})
+
+        reloaded = PersistentMemory(path)
+        entry = await reloaded.get(entry_id)
+
+        assert entry is not None
+        assert entry.content == "persisted content"
+        assert entry.metadata == {"source": "test"}
+        assert [r.entry.id for r in await reloaded.search("persisted")] == [entry_id]
+
+    async def test_auto_save_appends_to_journal(self, tmp_path):
+        """Test that auto-saved changes go to the journal, not the main file."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path)
+        kept_id = await memory.add("kept entry")
+        dropped_id = await memory.add("dropped entry")
+        await memory.delete(dropped_id)
+
+        assert not path.exists()
+        assert len((tmp_path / "memory.json.jsonl").read_bytes().splitlines()) == 3
+
+        reloaded = PersistentMemory(path)
+        assert reloaded.size == 1
+        assert await reloaded.get(kept_id) is not None
+        assert await reloaded.get(dropped_id) is None
+
+    async def test_save_compacts_journal(self, tmp_path):
+        """Test that save folds the journal into the main file."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path)
+        entry_id = await memory.add("compacted entry")
+        memory.save()
+
+        assert path.exists()
+        assert not (tmp_path / "memory.json.jsonl").exists()
+        assert await PersistentMemory(path).get(entry_id) is not None
+
+    async def test_journal_threshold_triggers_compaction(self, tmp_path):
+        """Test that the journal is compacted once it reaches the threshold."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path, journal_threshold=3)
+        for i in range(3):
+            await memory.add(f"entry {i}")
+
+        assert path.exists()
+        assert not (tmp_path / "memory.json.jsonl").exists()
+        assert PersistentMemory(path).size == 3
+
+    async def test_torn_journal_tail_is_ignored(self, tmp_path):
+        """Test that a partially written final journal line is skipped."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path)
+        entry_id = await memory.add("complete entry")
+        with (tmp_path / "memory.json.jsonl").open("ab") as fh:
+            fh.write(b'{"op":"put","entry":{"id"')
+
+        reloaded = PersistentMemory(path)
+        assert reloaded.size == 1
+        assert await reloaded.get(entry_id) is not None
+
+    async def test_append_after_torn_journal_tail_survives(self, tmp_path):
+        """Test that a record appended after a torn tail is not lost."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path)
+        first_id = await memory.add("first entry")
+        with (tmp_path / "memory.json.jsonl").open("ab") as fh:
+            fh.write(b'{"op":"put","entry":{"id"')
+
+        recovered = PersistentMemory(path)
+        second_id = await recovered.add("second entry")
+
+        reloaded = PersistentMemory(path)
+        assert reloaded.size == 2
+        assert await reloaded.get(first_id) is not None
+        assert await reloaded.get(second_id) is not None
+
+    async def test_failed_save_keeps_previous_file(self, tmp_path):
+        """Test that a save that fails mid-write leaves the old file intact."""
+        path = tmp_path / "memory.json"
+        memory = PersistentMemory(path, auto_save=False)
+        entry_id = await memory.add("safe entry")
+        memory.save()
+        before = path.read_bytes()
+
+        await memory.add("bad entry", {"value": object()})
+        with pytest.raises(MemoryError):
+            memory.save()
+
+        assert path.read_bytes() == before
+        assert not (tmp_path / "memory.json.tmp").exists()
+        assert await PersistentMemory(path).get(entry_id) is not None
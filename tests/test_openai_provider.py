@@ -0,0 +1,619 @@
+"""Tests for the OpenAI provider."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from universal_agent_sdk.errors import ProviderError
+from universal_agent_sdk.providers import openai as openai_provider
+from universal_agent_sdk.providers.openai import OpenAIProvider
+from universal_agent_sdk.types import (
+    AgentOptions,
+    AssistantMessage,
+    FinishReason,
+    ImageBlock,
+    SystemMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolDefinition,
+    ToolMessage,
+    ToolUseBlock,
+    UserMessage,
+)
+
+
+def completion_body(text="ok"):
+    """Build a Chat Completions response body as returned in batch output."""
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-test",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+
+
+def chat_response(text="ok"):
+    """Build a minimal non-streaming Chat Completions response."""
+    ns = SimpleNamespace
+    return ns(
+        choices=[
+            ns(
+                message=ns(content=text, tool_calls=None),
+                finish_reason="stop",
+            )
+        ],
+        model="gpt-test",
+    )
+
+
+class FakeCompletions:
+    """Stand-in for AsyncOpenAI().chat.completions that records kwargs."""
+
+    def __init__(self, response=None):
+        self.response = response
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+class FakeStream:
+    """Async context manager yielding pre-built stream chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def stream_chunks():
+    """Build a Chat Completions chunk sequence with text and a tool call."""
+    ns = SimpleNamespace
+
+    def chunk(content=None, tool_calls=None, finish_reason=None):
+        delta = ns(content=content, tool_calls=tool_calls)
+        return ns(
+            choices=[ns(delta=delta, finish_reason=finish_reason)],
+            model="gpt-test",
+            usage=None,
+        )
+
+    def tool_delta(arguments, id=None, name=None):
+        return [ns(index=0, id=id, function=ns(name=name, arguments=arguments))]
+
+    return [
+        chunk(content="He"),
+        chunk(content="y"),
+        chunk(tool_calls=tool_delta("", id="call_1", name="Read")),
+        chunk(tool_calls=tool_delta('{"path": ')),
+        chunk(tool_calls=tool_delta('"x"}')),
+        chunk(finish_reason="tool_calls"),
+        ns(
+            choices=[],
+            model="gpt-test",
+            usage=ns(prompt_tokens=3, completion_tokens=5, total_tokens=8),
+        ),
+    ]
+
+
+class FakeBatchClient:
+    """Stand-in for the files and batches APIs of AsyncOpenAI."""
+
+    def __init__(self, output_lines, error_lines=(), statuses=("completed",)):
+        self.uploads = []
+        self.files_by_id = {
+            "out": "\n".join(json.dumps(line) for line in output_lines),
+            "err": "\n".join(json.dumps(line) for line in error_lines),
+        }
+        self.statuses = list(statuses)
+        self.error_file_id = "err" if error_lines else None
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    def _batch(self):
+        return SimpleNamespace(
+            id="batch_1",
+            status=self.statuses.pop(0),
+            output_file_id="out",
+            error_file_id=self.error_file_id,
+        )
+
+    async def _upload(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file_1")
+
+    async def _content(self, file_id):
+        return SimpleNamespace(text=self.files_by_id[file_id])
+
+    async def _create(self, **kwargs):
+        self.batch_kwargs = kwargs
+        return self._batch()
+
+    async def _retrieve(self, batch_id):
+        return self._batch()
+
+
+def make_provider(client):
+    """Build an OpenAIProvider whose client is replaced by ``client``."""
+    provider = OpenAIProvider({"api_key": "test"})
+    provider._client = client
+    return provider
+
+
+def chat_client(completions):
+    """Wrap fake completions in an AsyncOpenAI-shaped namespace."""
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+TOOL = ToolDefinition(
+    name="Read",
+    description="Read a file",
+    input_schema={"type": "object", "properties": {}},
+)
+
+
+class TestOpenAIFormatting:
+    """Test conversion of SDK messages to the OpenAI format."""
+
+    def test_format_messages(self):
+        """Test formatting each message type."""
+        provider = OpenAIProvider({"api_key": "test"})
+
+        formatted = provider.format_messages(
+            [
+                SystemMessage(content="Be brief."),
+                UserMessage(
+                    content=[
+                        TextBlock(text="Look"),
+                        ImageBlock(source="https://x/a.png"),
+                        ThinkingBlock(thinking="dropped"),
+                    ]
+                ),
+                AssistantMessage(
+                    content=[
+                        TextBlock(text="Let me look."),
+                        ToolUseBlock(id="t1", name="Read", input={"path": "x"}),
+                    ]
+                ),
+                ToolMessage(content="data", tool_call_id="t1"),
+            ]
+        )
+
+        arguments = formatted[2]["tool_calls"][0]["function"].pop("arguments")
+        assert json.loads(arguments) == {"path": "x"}
+        assert formatted == [
+            {"role": "system", "content": "Be brief."},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Look"},
+                    {"type": "image_url", "image_url": {"url": "https://x/a.png"}},
+                ],
+            },
+            {
+                "role": "assistant",
+                "content": "Let me look.",
+                "tool_calls": [
+                    {
+                        "id": "t1",
+                        "type": "function",
+                        "function": {"name": "Read"},
+                    }
+                ],
+            },
+            {"role": "tool", "content": "data", "tool_call_id": "t1"},
+        ]
+
+    def test_unchanged_messages_are_not_reformatted(self, monkeypatch):
+        """Test that only new or changed messages are formatted again."""
+        provider = OpenAIProvider({"api_key": "test"})
+        formatted_types = []
+        format_one = OpenAIProvider.format_message
+
+        def record_format(self, msg):
+            formatted_types.append(type(msg).__name__)
+            return format_one(self, msg)
+
+        monkeypatch.setattr(OpenAIProvider, "format_message", record_format)
+        messages = [UserMessage(content="Hi")]
+        provider.format_messages(messages)
+
+        messages.append(AssistantMessage(content=[TextBlock(text="Hello")]))
+        messages.append(UserMessage(content="Again"))
+        second = provider.format_messages(messages)
+        messages[1] = AssistantMessage(content=[TextBlock(text="Changed")])
+        third = provider.format_messages(messages)
+
+        assert formatted_types == [
+            "UserMessage",
+            "AssistantMessage",
+            "UserMessage",
+            "AssistantMessage",
+        ]
+        assert second[1] == {"role": "assistant", "content": "Hello"}
+        assert third == [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Changed"},
+            {"role": "user", "content": "Again"},
+        ]
+
+    def test_mutated_messages_are_reformatted(self):
+        """Test that in-place changes to sent messages are picked up."""
+        provider = OpenAIProvider({"api_key": "test"})
+        assistant = AssistantMessage(content=[TextBlock(text="Hello")])
+        tool = ToolMessage(content="data", tool_call_id="t1")
+        messages = [UserMessage(content="Hi"), assistant, tool]
+        provider.format_messages(messages)
+
+        messages[0].content = "Edited"
+        assistant.content.append(TextBlock(text=" again"))
+        tool.tool_call_id = "t2"
+        formatted = provider.format_messages(messages)
+
+        assert formatted == [
+            {"role": "user", "content": "Edited"},
+            {"role": "assistant", "content": "Hello again"},
+            {"role": "tool", "content": "data", "tool_call_id": "t2"},
+        ]
+
+
+class TestOpenAIUsage:
+    """Test conversion of OpenAI token usage."""
+
+    def test_parse_usage(self):
+        """Test full and partial usage objects."""
+        provider = OpenAIProvider({"api_key": "test"})
+
+        full = provider.parse_usage(
+            SimpleNamespace(prompt_tokens=3, completion_tokens=5, total_tokens=8)
+        )
+        partial = provider.parse_usage(SimpleNamespace(prompt_tokens=3))
+
+        assert (full.prompt_tokens, full.completion_tokens, full.total_tokens) == (
+            3,
+            5,
+            8,
+        )
+        assert (partial.prompt_tokens, partial.total_tokens) == (3, 0)
+
+
+class TestOpenAIRequest:
+    """Test construction of Chat Completions arguments."""
+
+    @pytest.mark.parametrize(
+        ("tool_choice", "expected"),
+        [
+            ("auto", "auto"),
+            ("required", "required"),
+            ("none", "none"),
+            ("Read", {"type": "function", "function": {"name": "Read"}}),
+        ],
+    )
+    def test_tool_choice(self, tool_choice, expected):
+        """Test mapping of SDK tool_choice values."""
+        provider = OpenAIProvider({"api_key": "test"})
+        options = AgentOptions(tools=[TOOL], tool_choice=tool_choice)
+
+        kwargs = provider._build_request_kwargs([UserMessage(content="Hi")], options)
+
+        assert kwargs["tool_choice"] == expected
+
+    def test_function_tool_choice_is_reused(self):
+        """Test that forcing the same tool reuses one tool_choice dict."""
+        provider = OpenAIProvider({"api_key": "test"})
+        options = AgentOptions(tools=[TOOL], tool_choice="Read")
+        messages = [UserMessage(content="Hi")]
+
+        first = provider._build_request_kwargs(messages, options)["tool_choice"]
+        second = provider._build_request_kwargs(messages, options)["tool_choice"]
+
+        assert first is second
+
+    @pytest.mark.parametrize(
+        ("model", "key"),
+        [("gpt-4o-mini", "max_completion_tokens"), ("gpt-4", "max_tokens")],
+    )
+    def test_max_tokens_parameter(self, model, key):
+        """Test that newer models get max_completion_tokens."""
+        provider = OpenAIProvider({"api_key": "test"})
+        options = AgentOptions(model=model, max_tokens=100)
+
+        kwargs = provider._build_request_kwargs(
+            [UserMessage(content="Hi")], options, stream=True
+        )
+
+        assert kwargs[key] == 100
+        assert kwargs["stream"] is True
+
+
+class TestOpenAIJson:
+    """Test the JSON helpers used for tool arguments."""
+
+    def test_dumps_falls_back_for_values_orjson_rejects(self):
+        """Test that non-string keys still encode as with json.dumps."""
+        assert json.loads(openai_provider._dumps({1: "a"})) == {"1": "a"}
+
+    def test_dumps_without_orjson(self, monkeypatch):
+        """Test the stdlib path when orjson is not installed."""
+        monkeypatch.setattr(openai_provider, "HAS_ORJSON", False)
+
+        assert openai_provider._dumps({"path": "x"}) == '{"path": "x"}'
+        assert openai_provider._loads('{"path": "x"}') == {"path": "x"}
+
+
+class TestOpenAIStreaming:
+    """Test assembly of streamed OpenAI responses."""
+
+    async def test_stream_assembles_blocks(self):
+        """Test that deltas are forwarded and folded into the final message."""
+        completions = FakeCompletions(response=FakeStream(stream_chunks()))
+        provider = make_provider(chat_client(completions))
+
+        output = [
+            message
+            async for message in provider.stream(
+                [UserMessage(content="Hi")], AgentOptions()
+            )
+        ]
+
+        *events, assistant, result = output
+        assert [e.delta["text"] for e in events if e.delta["type"] == "text"] == [
+            "He",
+            "y",
+        ]
+        tool_deltas = [e.delta for e in events if e.event_type == "tool_call_delta"]
+        assert tool_deltas[0] == {
+            "type": "tool_call",
+            "id": "call_1",
+            "name": "Read",
+            "arguments": "",
+        }
+        assert [d["arguments"] for d in tool_deltas[1:]] == ['{"path": ', '"x"}']
+        assert assistant.model == "gpt-test"
+        assert assistant.content == [
+            TextBlock(text="Hey"),
+            ToolUseBlock(id="call_1", name="Read", input={"path": "x"}),
+        ]
+        assert assistant.finish_reason == FinishReason.TOOL_USE
+        assert result.usage.total_tokens == 8
+        assert completions.calls[0]["stream_options"] == {"include_usage": True}
+
+    async def test_stream_events_can_be_skipped(self):
+        """Test that only the final messages are yielded without events."""
+        completions = FakeCompletions(response=FakeStream(stream_chunks()))
+        provider = make_provider(chat_client(completions))
+        options = AgentOptions(yield_stream_events=False)
+
+        output = [
+            message
+            async for message in provider.stream([UserMessage(content="Hi")], options)
+        ]
+
+        assert [type(m).__name__ for m in output] == [
+            "AssistantMessage",
+            "ResultMessage",
+        ]
+        assert output[0].content[0] == TextBlock(text="Hey")
+
+    async def test_text_deltas_are_coalesced(self):
+        """Test that batched text deltas are flushed before tool call events."""
+        completions = FakeCompletions(response=FakeStream(stream_chunks()))
+        provider = make_provider(chat_client(completions))
+        options = AgentOptions(stream_batch_size=8, stream_batch_ms=60_000)
+
+        output = [
+            message
+            async for message in provider.stream([UserMessage(content="Hi")], options)
+        ]
+
+        assert output[0].delta == {"type": "text", "text": "Hey"}
+        assert output[1].event_type == "tool_call_delta"
+        assert output[-2].content[0] == TextBlock(text="Hey")
+
+    async def test_streamed_message_is_sent_back_verbatim(self, monkeypatch):
+        """Test that the next turn reuses the format built while streaming."""
+        completions = FakeCompletions(response=FakeStream(stream_chunks()))
+        provider = make_provider(chat_client(completions))
+        messages = [UserMessage(content="Hi")]
+        async for message in provider.stream(messages, AgentOptions()):
+            if isinstance(message, AssistantMessage):
+                messages.append(message)
+        monkeypatch.setattr(
+            OpenAIProvider,
+            "format_message",
+            lambda self, message: pytest.fail("message reformatted"),
+        )
+
+        formatted = provider.format_messages(messages)
+
+        assert formatted[1] == {
+            "role": "assistant",
+            "content": "Hey",
+            "tool_calls": [
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "Read", "arguments": '{"path": "x"}'},
+                }
+            ],
+        }
+
+
+class TestOpenAIToolCache:
+    """Test reuse of formatted tool definitions across requests."""
+
+    async def test_same_tools_are_formatted_once(self, monkeypatch):
+        """Test that an unchanged tool list is not reformatted."""
+        completions = FakeCompletions(response=chat_response())
+        provider = make_provider(chat_client(completions))
+        calls = []
+        format_tools = provider.format_tools
+        monkeypatch.setattr(
+            OpenAIProvider,
+            "format_tools",
+            lambda self, tools: calls.append(tools) or format_tools(tools),
+        )
+        options = AgentOptions(tools=[TOOL])
+
+        await provider.complete([UserMessage(content="Hi")], options)
+        await provider.complete([UserMessage(content="Again")], options)
+        other = ToolDefinition(name="Write", description="", input_schema={})
+        options = AgentOptions(tools=[other])
+        await provider.complete([UserMessage(content="New")], options)
+
+        assert len(calls) == 2
+        assert completions.calls[1]["tools"] == completions.calls[0]["tools"]
+        assert completions.calls[2]["tools"][0]["function"]["name"] == "Write"
+
+
+class TestOpenAIBatch:
+    """Test completing several conversations in one call."""
+
+    async def test_concurrent_batch_preserves_order(self):
+        """Test that the default path sends one request per conversation."""
+        completions = FakeCompletions(response=chat_response())
+        provider = make_provider(chat_client(completions))
+
+        results = await provider.complete_batch(
+            [[UserMessage(content="a")], [UserMessage(content="b")]],
+            AgentOptions(model="gpt-4o"),
+        )
+
+        assert [r.content for r in results] == [[TextBlock(text="ok")]] * 2
+        assert [c["messages"][0]["content"] for c in completions.calls] == ["a", "b"]
+
+    async def test_batch_api_job(self):
+        """Test that the Batch API path uploads JSONL and maps results back."""
+        client = FakeBatchClient(
+            output_lines=[
+                {
+                    "custom_id": "1",
+                    "response": {"status_code": 200, "body": completion_body("b")},
+                    "error": None,
+                },
+                {
+                    "custom_id": "0",
+                    "response": {"status_code": 200, "body": completion_body("a")},
+                    "error": None,
+                },
+            ],
+            error_lines=[
+                {
+                    "custom_id": "2",
+                    "response": None,
+                    "error": {"code": "bad", "message": "Invalid request"},
+                }
+            ],
+            statuses=("validating", "in_progress", "completed"),
+        )
+        provider = make_provider(client)
+
+        results = await provider.complete_batch(
+            [[UserMessage(content=text)] for text in "abc"],
+            AgentOptions(model="gpt-4o"),
+            use_batch_api=True,
+            poll_interval=0,
+        )
+
+        (name, data), purpose = client.uploads[0]
+        requests = [json.loads(line) for line in data.decode().splitlines()]
+        assert purpose == "batch"
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        assert requests[2]["body"]["messages"] == [{"role": "user", "content": "c"}]
+        assert client.batch_kwargs["endpoint"] == "/v1/chat/completions"
+        assert isinstance(results[0], AssistantMessage)
+        assert results[0].content == [TextBlock(text="a")]
+        assert results[1].content == [TextBlock(text="b")]
+        assert isinstance(results[2], ProviderError)
+        assert "Invalid request" in str(results[2])
+
+    async def test_failed_batch_job_raises(self):
+        """Test that a job that does not complete raises ProviderError."""
+        provider = make_provider(FakeBatchClient([], statuses=("failed",)))
+
+        with pytest.raises(ProviderError, match="failed"):
+            await provider.complete_batch(
+                [[UserMessage(content="a")]], AgentOptions(), use_batch_api=True
+            )
+
+
+class TestOpenAIClientSharing:
+    """Test sharing of OpenAI clients between providers."""
+
+    async def test_different_settings_own_their_transports(self):
+        """Test that clients with different settings do not share a transport."""
+        first = OpenAIProvider({"api_key": "one"})._get_client()
+        second = OpenAIProvider({"api_key": "two", "timeout": 5.0})._get_client()
+
+        assert first is not second
+        assert first._client is not second._client
+        assert second.timeout == 5.0
+
+    async def test_unhashable_settings_are_pooled(self):
+        """Test that settings such as header dicts still find their client."""
+        openai_provider._import_openai()
+
+        def make():
+            return openai_provider._shared_client(
+                openai_provider.AsyncOpenAI,
+                api_key="headers",
+                default_headers={"X-Team": "sdk"},
+            )
+
+        assert make() is make()
+
+    def test_clients_are_not_shared_across_event_loops(self):
+        """Test that each event loop gets its own clients."""
+
+        async def get_client():
+            return OpenAIProvider({"api_key": "per-loop"})._get_client()
+
+        assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+    def test_closed_loop_pool_is_released(self):
+        """Test that the clients of a closed event loop are dropped."""
+        loops = []
+
+        async def get_client():
+            loops.append(asyncio.get_running_loop())
+            return OpenAIProvider({"api_key": "released"})._get_client()
+
+        asyncio.run(get_client())
+        asyncio.run(get_client())
+
+        assert loops[0] not in openai_provider._CLIENT_POOLS
+        assert loops[1] in openai_provider._CLIENT_POOLS
+
+    def test_provider_gets_a_client_per_event_loop(self):
+        """Test that a provider reused across loops does not keep a stale client."""
+        provider = OpenAIProvider({"api_key": "reused"})
+
+        async def get_client():
+            return provider._get_client()
+
+        assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+    async def test_same_settings_share_client(self):
+        """Test that providers with identical settings share one client."""
+        first = OpenAIProvider({"api_key": "same"})._get_client()
+        second = OpenAIProvider({"api_key": "same"})._get_client()
+
+        assert first is second
@@ -0,0 +1,128 @@
+"""Tests for preset module."""
+
+import os
+
+from universal_agent_sdk.preset import (
+    _expand_env_var,
+    discover_presets,
+    get_builtin_tool,
+    get_builtin_tools,
+    load_preset,
+)
+
+PRESET_YAML = """
+id: test-preset
+name: Test Preset
+allowed_tools:
+  - Read
+env:
+  TOKEN: ${UAS_TEST_TOKEN}
+"""
+
+
+class TestLoadPreset:
+    """Test loading presets from files."""
+
+    def test_load_yaml_preset(self, tmp_path):
+        """Test loading a YAML preset file."""
+        path = tmp_path / "preset.yaml"
+        path.write_text(PRESET_YAML)
+
+        preset = load_preset(path)
+
+        assert preset.id == "test-preset"
+        assert preset.name == "Test Preset"
+        assert preset.allowed_tools == ["Read"]
+
+    def test_repeated_loads_return_independent_presets(self, tmp_path):
+        """Test that cached loads do not share mutable state."""
+        path = tmp_path / "preset.yaml"
+        path.write_text(PRESET_YAML)
+
+        first = load_preset(path)
+        first.allowed_tools.append("Write")
+        second = load_preset(path)
+
+        assert second.allowed_tools == ["Read"]
+
+    def test_reload_after_file_changes(self, tmp_path):
+        """Test that a modified file is parsed again."""
+        path = tmp_path / "preset.yaml"
+        path.write_text(PRESET_YAML)
+        load_preset(path)
+
+        path.write_text(PRESET_YAML.replace("Test Preset", "Renamed Preset!"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_preset(path).name == "Renamed Preset!"
+
+    def test_env_vars_expanded_on_every_load(self, tmp_path, monkeypatch):
+        """Test that env var expansion is not frozen by caching."""
+        path = tmp_path / "preset.yaml"
+        path.write_text(PRESET_YAML)
+
+        monkeypatch.setenv("UAS_TEST_TOKEN", "first")
+        assert load_preset(path).env == {"TOKEN": "first"}
+        monkeypatch.setenv("UAS_TEST_TOKEN", "second")
+        assert load_preset(path).env == {"TOKEN": "second"}
+
+
+class TestEnvVarExpansion:
+    """Test ${VAR} expansion in preset values."""
+
+    def test_expands_multiple_references(self, monkeypatch):
+        """Test expanding several variables in one value."""
+        monkeypatch.setenv("UAS_HOST", "localhost")
+        monkeypatch.setenv("UAS_PORT", "8080")
+        monkeypatch.delenv("UAS_MISSING", raising=False)
+
+        assert (
+            _expand_env_var("http://${UAS_HOST}:${UAS_PORT}/${UAS_MISSING}")
+            == "http://localhost:8080/"
+        )
+
+    def test_leaves_plain_values_untouched(self):
+        """Test that values without references are returned as-is."""
+        assert _expand_env_var("$HOME and {braces}") == "$HOME and {braces}"
+
+
+class TestBuiltinTools:
+    """Test resolving built-in tools by name."""
+
+    def test_short_and_class_names_resolve(self):
+        """Test that both "Read" and "ReadTool" resolve to the Read tool."""
+        tools = get_builtin_tools(["Read", "BashTool", "Unknown"])
+
+        assert [t.name for t in tools] == ["Read", "Bash"]
+        assert get_builtin_tool("Unknown") is None
+
+
+class TestDiscoverPresets:
+    """Test discovering presets in directories."""
+
+    def test_discovers_presets_and_skips_invalid_files(self, tmp_path):
+        """Test that valid presets load and broken files are skipped."""
+        (tmp_path / "good.yaml").write_text(PRESET_YAML)
+        (tmp_path / "other.json").write_text('{"id": "other", "name": "Other"}')
+        (tmp_path / "broken.yaml").write_text("id: [unterminated")
+        (tmp_path / "notes.txt").write_text("not a preset")
+
+        presets = discover_presets([tmp_path])
+
+        assert sorted(presets) == ["other", "test-preset"]
+
+    def test_later_search_paths_take_precedence(self, tmp_path):
+        """Test that a preset in a later path overrides the same ID earlier."""
+        user_dir = tmp_path / "user"
+        project_dir = tmp_path / "project"
+        user_dir.mkdir()
+        project_dir.mkdir()
+        (user_dir / "p.yaml").write_text(PRESET_YAML)
+        (project_dir / "p.yaml").write_text(
+            PRESET_YAML.replace("Test Preset", "Project Preset")
+        )
+
+        presets = discover_presets([user_dir, project_dir])
+
+        assert presets["test-preset"].name == "Project Preset"
@@ -0,0 +1,350 @@
+"""Tests for providers module."""
+
+import asyncio
+import gc
+import json
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pytest
+
+from universal_agent_sdk.providers import (
+    BaseProvider,
+    ProviderRegistry,
+    register_provider,
+)
+from universal_agent_sdk.providers import base as providers_base
+from universal_agent_sdk.types import (
+    AgentOptions,
+    AssistantMessage,
+    ImageBlock,
+    ProviderFeatures,
+    SystemMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolMessage,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+
+class DummyProvider(BaseProvider):
+    """Minimal concrete provider using the default formatting."""
+
+    def get_features(self) -> ProviderFeatures:
+        return ProviderFeatures(streaming=True, vision=False)
+
+    async def complete(self, messages, options):
+        raise NotImplementedError
+
+    def stream(self, messages, options):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def provider():
+    """Provide a DummyProvider instance."""
+    return DummyProvider()
+
+
+@pytest.fixture
+def registry():
+    """Register DummyProvider in an isolated ProviderRegistry."""
+    providers = dict(ProviderRegistry._providers)
+    instances = OrderedDict(ProviderRegistry._instances)
+    ProviderRegistry._providers.clear()
+    ProviderRegistry._instances.clear()
+    ProviderRegistry.register("dummy", DummyProvider)
+    yield ProviderRegistry
+    ProviderRegistry._providers.clear()
+    ProviderRegistry._providers.update(providers)
+    ProviderRegistry._instances.clear()
+    ProviderRegistry._instances.update(instances)
+
+
+class TestBaseProviderFormatting:
+    """Test the default message formatting in BaseProvider."""
+
+    def test_format_messages(self, provider):
+        """Test formatting each message type."""
+        formatted = provider.format_messages(
+            [
+                SystemMessage(content="Be brief."),
+                UserMessage(content="Hi"),
+                AssistantMessage(content=[TextBlock(text="Hello")]),
+                ToolMessage(content="42", tool_call_id="call_1"),
+            ]
+        )
+
+        assert formatted == [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": [{"type": "text", "text": "Hello"}]},
+            {"role": "tool", "content": "42", "tool_call_id": "call_1"},
+        ]
+
+    def test_format_tool_message_without_id(self, provider):
+        """Test that a missing tool_call_id is omitted rather than null."""
+        message = ToolMessage(content="42", tool_call_id=None)
+
+        formatted = provider.format_message(message)
+
+        assert formatted == {"role": "tool", "content": "42"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_format_messages_bytes(self, provider, monkeypatch, use_orjson):
+        """Test that the JSON body matches format_messages."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(providers_base, "HAS_ORJSON", use_orjson)
+        messages = [
+            UserMessage(content="Hi ☃"),
+            ToolMessage(content="1", tool_call_id="c"),
+        ]
+
+        body = provider.format_messages_bytes(messages)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == provider.format_messages(messages)
+
+    def test_format_content_blocks(self, provider):
+        """Test formatting each content block type."""
+        formatted = provider._format_content_blocks(
+            [
+                TextBlock(text="a"),
+                ImageBlock(source="https://example.com/x.png"),
+                ToolUseBlock(id="t1", name="Read", input={"path": "x"}),
+                ToolResultBlock(tool_use_id="t1", content="data"),
+                ThinkingBlock(thinking="hmm"),
+            ]
+        )
+
+        assert [block["type"] for block in formatted] == [
+            "text",
+            "image",
+            "tool_use",
+            "tool_result",
+            "thinking",
+        ]
+        assert formatted[2] == {
+            "type": "tool_use",
+            "id": "t1",
+            "name": "Read",
+            "input": {"path": "x"},
+        }
+
+    def test_iter_content_blocks_override_applies_to_single_block(self):
+        """Test that a single block is formatted through the overridable hook."""
+
+        class UpperProvider(DummyProvider):
+            def _iter_content_blocks(self, blocks):
+                for block in blocks:
+                    yield {"type": "text", "text": block.text.upper()}
+
+        provider = UpperProvider()
+
+        assert provider._format_content_blocks([TextBlock(text="a")]) == [
+            {"type": "text", "text": "A"}
+        ]
+
+    def test_format_message_subclass(self, provider):
+        """Test that subclasses of message and block types still format."""
+
+        @dataclass
+        class TaggedText(TextBlock):
+            tag: str = ""
+
+        @dataclass
+        class TaggedUserMessage(UserMessage):
+            tag: str = ""
+
+        formatted = provider.format_message(
+            TaggedUserMessage(content=[TaggedText(text="hi", tag="x")])
+        )
+
+        assert formatted == {
+            "role": "user",
+            "content": [{"type": "text", "text": "hi"}],
+        }
+
+    def test_registered_provider_uses_overrides(self, registry):
+        """Test that formatters resolved at registration honor overrides."""
+
+        @register_provider("shouting")
+        class ShoutingProvider(DummyProvider):
+            def _format_system_message(self, message):
+                return {"role": "system", "content": message.content.upper()}
+
+        class WhisperingProvider(ShoutingProvider):
+            def _format_system_message(self, message):
+                return {"role": "system", "content": message.content.lower()}
+
+        message = SystemMessage(content="Be Brief.")
+
+        assert ShoutingProvider().format_message(message)["content"] == "BE BRIEF."
+        assert WhisperingProvider().format_message(message)["content"] == "be brief."
+        assert ShoutingProvider().format_message(UserMessage(content="hi")) == {
+            "role": "user",
+            "content": "hi",
+        }
+
+    def test_register_requires_core_methods(self, registry):
+        """Test that registering an incomplete provider is rejected."""
+
+        class IncompleteProvider(BaseProvider):
+            def get_features(self) -> ProviderFeatures:
+                return ProviderFeatures()
+
+        with pytest.raises(TypeError, match="complete, stream"):
+            register_provider("incomplete")(IncompleteProvider)
+        assert not registry.is_registered("incomplete")
+
+    def test_format_messages_passes_through_dicts(self, provider):
+        """Test that already formatted messages are not re-converted."""
+        wire = {"role": "assistant", "content": "cached"}
+
+        formatted = provider.format_messages([wire, UserMessage(content="Hi")])
+
+        assert formatted[0] is wire
+        assert formatted[1] == {"role": "user", "content": "Hi"}
+
+    def test_format_unknown_message_raises(self, provider):
+        """Test that unknown message types are rejected."""
+        with pytest.raises(ValueError, match="Unknown message type"):
+            provider.format_message("not a message")
+
+
+class TestBaseProviderFeatures:
+    """Test feature checks in BaseProvider."""
+
+    def test_supports_feature(self, provider):
+        """Test feature checks against get_features()."""
+        assert provider.supports_feature("streaming")
+        assert not provider.supports_feature("vision")
+        assert not provider.supports_feature("teleportation")
+
+    def test_unknown_feature_skips_get_features(self, provider, monkeypatch):
+        """Test that unknown feature names are rejected without a lookup."""
+
+        def fail(self):
+            raise AssertionError("get_features should not be called")
+
+        monkeypatch.setattr(DummyProvider, "get_features", fail)
+
+        assert not provider.supports_feature("teleportation")
+
+
+class TestBaseProviderUsage:
+    """Test usage parsing in BaseProvider."""
+
+    def test_parse_usage_key_styles(self, provider):
+        """Test that both usage key conventions are accepted."""
+        openai_style = provider.parse_usage(
+            {"prompt_tokens": 3, "completion_tokens": 5, "total_tokens": 8}
+        )
+        anthropic_style = provider.parse_usage({"input_tokens": 3, "output_tokens": 5})
+
+        assert (openai_style.prompt_tokens, openai_style.completion_tokens) == (3, 5)
+        assert (anthropic_style.prompt_tokens, anthropic_style.completion_tokens) == (
+            3,
+            5,
+        )
+
+    def test_parse_usage_keeps_explicit_zero(self, provider):
+        """Test that a reported 0 is not replaced by the alternate key."""
+        usage = provider.parse_usage({"prompt_tokens": 0, "input_tokens": 7})
+
+        assert usage.prompt_tokens == 0
+
+
+class EchoProvider(DummyProvider):
+    """Provider whose completions echo the last user message."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def complete(self, messages, options):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if messages[-1].content == "fail":
+            raise RuntimeError("boom")
+        return AssistantMessage(content=[TextBlock(text=messages[-1].content)])
+
+
+class TestBaseProviderBatch:
+    """Test concurrent completions through abatch."""
+
+    async def test_abatch_preserves_order_and_errors(self):
+        """Test that results line up with requests and errors are returned."""
+        provider = EchoProvider()
+        prompts = ["a", "fail", "c", "d"]
+
+        results = await provider.abatch(
+            [([UserMessage(content=p)], AgentOptions()) for p in prompts],
+            max_concurrency=2,
+        )
+
+        assert results[0].content[0].text == "a"
+        assert isinstance(results[1], RuntimeError)
+        assert [r.content[0].text for r in results[2:]] == ["c", "d"]
+        assert provider.peak == 2
+
+
+class TestProviderRegistry:
+    """Test ProviderRegistry instance caching."""
+
+    def test_get_reuses_instance_for_equal_config(self, registry):
+        """Test that equal configs share one instance regardless of key order."""
+        first = registry.get("dummy", {"api_key": "k", "base_url": "u"})
+        second = registry.get("dummy", {"base_url": "u", "api_key": "k"})
+
+        assert first is second
+        assert first.config == {"api_key": "k", "base_url": "u"}
+
+    def test_get_separates_distinct_configs(self, registry):
+        """Test that different configs get different instances."""
+        default = registry.get("dummy")
+        keyed = registry.get("dummy", {"api_key": "a"})
+
+        assert registry.get("dummy") is default
+        assert keyed is not default
+        assert registry.get("dummy", {"api_key": "b"}) is not keyed
+
+    def test_get_does_not_keep_event_loops_alive(self, registry):
+        """Test that cached instances do not reference the loop they ran on."""
+        loops = []
+
+        async def get():
+            loops.append(weakref.ref(asyncio.get_running_loop()))
+            return registry.get("dummy", {"api_key": "k"})
+
+        first = asyncio.run(get())
+        gc.collect()
+
+        assert asyncio.run(get()) is first
+        assert loops[0]() is None
+
+    def test_config_with_mixed_key_types(self, registry):
+        """Test that configs json cannot sort still get a stable key."""
+        first = registry.get("dummy", {1: "a", "b": 2})
+
+        assert registry.get("dummy", {"b": 2, 1: "a"}) is first
+
+    def test_get_evicts_least_recently_used(self, registry, monkeypatch):
+        """Test that the instance cache is bounded and evicts LRU entries."""
+        monkeypatch.setattr(providers_base, "_MAX_INSTANCES", 2)
+        first = registry.get("dummy", {"api_key": "1"})
+        second = registry.get("dummy", {"api_key": "2"})
+        assert registry.get("dummy", {"api_key": "1"}) is first
+
+        registry.get("dummy", {"api_key": "3"})
+
+        assert len(registry._instances) == 2
+        assert registry.get("dummy", {"api_key": "1"}) is first
+        assert registry.get("dummy", {"api_key": "2"}) is not second
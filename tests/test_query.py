@@ -0,0 +1,222 @@
+"""Tests for the one-shot query tool loop."""
+
+import asyncio
+import importlib
+import json
+
+from universal_agent_sdk.query import _query_with_tools, complete
+from universal_agent_sdk.types import (
+    AgentOptions,
+    AssistantMessage,
+    PermissionResultAllow,
+    PermissionResultDeny,
+    ResultMessage,
+    StreamEvent,
+    TextBlock,
+    ToolDefinition,
+    ToolMessage,
+    ToolUseBlock,
+    UserMessage,
+)
+
+# The package re-exports the query() function under the same name
+query_module = importlib.import_module("universal_agent_sdk.query")
+
+
+class ScriptedProvider:
+    """Provider stand-in that replies with pre-built assistant messages."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.seen = []
+
+    async def complete(self, messages, options):
+        self.seen.append(list(messages))
+        return self.responses.pop(0)
+
+    async def stream(self, messages, options):
+        self.seen.append(options)
+        if options.yield_stream_events:
+            yield StreamEvent(event_type="content_block_delta")
+        yield self.responses.pop(0)
+        yield ResultMessage()
+
+
+def make_tool(name, handler):
+    """Build a ToolDefinition without parameters."""
+    return ToolDefinition(
+        name=name, description="", input_schema={"type": "object"}, handler=handler
+    )
+
+
+def tool_call_turn(*names):
+    """Build an assistant message calling each named tool once."""
+    return AssistantMessage(
+        content=[
+            ToolUseBlock(id=f"call_{i}", name=name, input={})
+            for i, name in enumerate(names)
+        ]
+    )
+
+
+async def run_loop(provider, options):
+    """Collect every message yielded by the tool loop."""
+    return [
+        message
+        async for message in _query_with_tools(
+            provider, [UserMessage(content="go")], options
+        )
+    ]
+
+
+class TestToolLoop:
+    """Test tool execution inside _query_with_tools."""
+
+    async def test_tool_calls_run_concurrently_in_order(self):
+        """Test that calls overlap and results keep the original call order."""
+        started = []
+        release = asyncio.Event()
+
+        async def slow():
+            started.append("slow")
+            await release.wait()
+            return "slow done"
+
+        async def fast():
+            started.append("fast")
+            release.set()
+            return {"value": 1}
+
+        options = AgentOptions(
+            tools=[make_tool("slow", slow), make_tool("fast", fast)],
+            stream=False,
+        )
+        provider = ScriptedProvider(
+            tool_call_turn("slow", "fast"),
+            AssistantMessage(content=[TextBlock(text="done")]),
+        )
+
+        output = await asyncio.wait_for(run_loop(provider, options), timeout=1)
+
+        assert started == ["slow", "fast"]
+        slow_message, fast_message = provider.seen[1][2:]
+        assert slow_message == ToolMessage(content="slow done", tool_call_id="call_0")
+        assert fast_message.tool_call_id == "call_1"
+        assert json.loads(fast_message.content) == {"value": 1}
+        assert isinstance(output[-1], ResultMessage)
+        assert output[-1].num_turns == 2
+
+    async def test_errors_and_denials_become_results(self):
+        """Test that failures are reported per call without stopping the turn."""
+
+        def boom():
+            raise RuntimeError("broken")
+
+        def can_use_tool(name, tool_input, context):
+            if name == "secret":
+                return PermissionResultDeny(message="no")
+            return PermissionResultAllow()
+
+        options = AgentOptions(
+            tools=[make_tool("boom", boom), make_tool("secret", lambda: "x")],
+            can_use_tool=can_use_tool,
+            stream=False,
+        )
+        provider = ScriptedProvider(
+            tool_call_turn("boom", "secret", "missing"),
+            AssistantMessage(content=[TextBlock(text="done")]),
+        )
+
+        await run_loop(provider, options)
+
+        assert [m.content for m in provider.seen[1][2:]] == [
+            "Error executing tool: broken",
+            "Permission denied: no",
+            "Tool 'missing' not found or has no handler",
+        ]
+
+    async def test_failing_call_waits_for_slow_sibling(self):
+        """Test that a call raising outside the handler does not orphan others."""
+        finished = []
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            finished.append("slow")
+            return "slow done"
+
+        def can_use_tool(name, tool_input, context):
+            if name == "bad":
+                raise RuntimeError("prompt failed")
+            return PermissionResultAllow()
+
+        options = AgentOptions(
+            tools=[make_tool("bad", lambda: "x"), make_tool("slow", slow)],
+            can_use_tool=can_use_tool,
+            stream=False,
+        )
+        provider = ScriptedProvider(
+            tool_call_turn("bad", "slow"),
+            AssistantMessage(content=[TextBlock(text="done")]),
+        )
+
+        await run_loop(provider, options)
+
+        assert finished == ["slow"]
+        assert [m.content for m in provider.seen[1][2:]] == [
+            "Error executing tool: prompt failed",
+            "slow done",
+        ]
+
+    async def test_first_tool_with_a_name_is_used(self):
+        """Test that duplicate tool names resolve to the first definition."""
+        options = AgentOptions(
+            tools=[make_tool("dup", lambda: "first"), make_tool("dup", lambda: "2")],
+            stream=False,
+        )
+        provider = ScriptedProvider(
+            tool_call_turn("dup"),
+            AssistantMessage(content=[TextBlock(text="done")]),
+        )
+
+        await run_loop(provider, options)
+
+        assert provider.seen[1][-1].content == "first"
+
+    async def test_awaitable_from_sync_handler_is_awaited(self):
+        """Test that a sync handler returning a coroutine has it awaited."""
+
+        async def fetch():
+            return "fetched"
+
+        options = AgentOptions(
+            tools=[make_tool("fetch", lambda: fetch())],
+            stream=False,
+        )
+        provider = ScriptedProvider(
+            tool_call_turn("fetch"),
+            AssistantMessage(content=[TextBlock(text="done")]),
+        )
+
+        await run_loop(provider, options)
+
+        assert provider.seen[1][-1].content == "fetched"
+
+
+class TestComplete:
+    """Test the complete() convenience wrapper."""
+
+    async def test_complete_skips_stream_events(self, monkeypatch):
+        """Test that complete() asks for no events and leaves options alone."""
+        provider = ScriptedProvider(AssistantMessage(content=[TextBlock(text="hi")]))
+        monkeypatch.setattr(
+            query_module.ProviderRegistry,
+            "get",
+            staticmethod(lambda name, config=None: provider),
+        )
+        options = AgentOptions(provider_config={})
+
+        response = await complete("Hello", options)
+
+        assert response.content == [TextBlock(text="hi")]
+        assert provider.seen[0].yield_stream_events is False
+        assert options.yield_stream_events is True
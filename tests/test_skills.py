@@ -1,5 +1,6 @@
 """Tests for skills module."""
 
+import sys
 from pathlib import Path
 
 import pytest
@@ -9,13 +10,17 @@ from universal_agent_sdk.skills import (
     SkillInvocationResult,
     SkillRegistry,
     SkillTool,
+    clear_skill_cache,
+    combine_skills,
     create_skill_tool,
     discover_skills,
     get_bundled_skill,
     get_bundled_skills,
     list_bundled_skills,
+    loader,
     parse_skill_md,
 )
+from universal_agent_sdk.types import AgentOptions, ToolDefinition
 
 
 class TestSkillMetadata:
@@ -128,6 +133,28 @@ class TestBundledSkills:
         assert any(scripts_dir.iterdir())  # Has files
 
 
+class TestSkillMetadataOnly:
+    """Test reading only the frontmatter of SKILL.md files."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\nname: meta\ndescription: Only this\n---\nBody\n---\nMore",
+            "# No frontmatter\n---\nname: not-meta\n---\n",
+            "---\nname: unterminated\n---",
+        ],
+    )
+    def test_matches_full_parse(self, tmp_path, content):
+        """Test that the frontmatter reader agrees with parse_skill_md."""
+        skill_file = tmp_path / "meta" / "SKILL.md"
+        skill_file.parent.mkdir()
+        skill_file.write_text(content)
+
+        metadata = loader._read_skill_metadata(skill_file)
+
+        assert metadata == parse_skill_md(content, default_name="meta")[0]
+
+
 class TestSkillRegistry:
     """Test skill registry."""
 
@@ -167,6 +194,114 @@ class TestSkillRegistry:
         assert "skill2" in names
 
 
+class TestSkillBase:
+    """Test the Skill dataclass and its helpers."""
+
+    def test_skill_is_slotted(self):
+        """Test that skills carry no per-instance __dict__."""
+        skill = Skill(name="slotted", description="", system_prompt="...")
+
+        assert not hasattr(skill, "__dict__")
+        assert not hasattr(skill.with_prompt("more"), "__dict__")
+
+    def test_skill_names_are_interned(self):
+        """Test that names built at runtime are interned."""
+        skill = Skill(name="".join(["pd", "f2"]), description="", system_prompt="")
+
+        assert skill.name is sys.intern("pdf2")
+
+    def test_tools_are_shared_but_options_get_a_list(self):
+        """Test that tools are stored as a tuple and copied into options."""
+        tool_def = ToolDefinition(name="Read", description="", input_schema={})
+        skill = Skill(name="s", description="", system_prompt="...", tools=[tool_def])
+
+        options = skill.create_options()
+        options.tools.append(tool_def)
+
+        assert skill.tools == (tool_def,)
+        assert skill.with_prompt("more").tools is skill.tools
+        assert skill.with_tools(tool_def).tools == (tool_def, tool_def)
+        assert skill.create_options(tools=[]).tools == []
+
+    def test_default_options_are_independent(self):
+        """Test that create_options() returns fresh, independent options."""
+        tool_def = ToolDefinition(name="Read", description="", input_schema={})
+        skill = Skill(name="s", description="", system_prompt="...", tools=[tool_def])
+
+        first = skill.create_options()
+        first.allowed_tools.append("Read")
+        first.env["KEY"] = "value"
+        second = skill.create_options()
+        skill.system_prompt = "changed"
+
+        assert second is not first
+        assert second == AgentOptions(
+            system_prompt="...", tools=[tool_def], temperature=0.7, max_tokens=4096
+        )
+        assert second.tools is not first.tools
+        assert skill.create_options().system_prompt == "changed"
+
+    def test_derived_skills_share_metadata_until_written(self):
+        """Test that metadata is shared read-only and copied on write."""
+        source = {"source": "x"}
+        skill = Skill(name="s", description="", system_prompt="...", metadata=source)
+        derived = skill.with_prompt("more").with_tools()
+        source["source"] = "changed"
+
+        assert derived.metadata is skill.metadata
+        with pytest.raises(TypeError):
+            derived.metadata["source"] = "y"  # type: ignore[index]
+
+        derived.set_metadata("bundled", True)
+
+        assert derived.metadata == {"source": "x", "bundled": True}
+        assert skill.metadata == {"source": "x"}
+
+    def test_combine_skills_deduplicates_tools(self):
+        """Test that combined tools keep the first definition of each name."""
+        first = ToolDefinition(name="Read", description="first", input_schema={})
+        second = ToolDefinition(name="Read", description="second", input_schema={})
+        other = ToolDefinition(name="Write", description="", input_schema={})
+        a = Skill(name="a", description="A", system_prompt="...", tools=[first])
+        b = Skill(name="b", description="B", system_prompt="...", tools=[second, other])
+
+        combined = combine_skills(a, b)
+
+        assert combined.tools == (first, other)
+        assert combined.metadata == {"combined_from": ["a", "b"]}
+
+    def test_combine_skills_prompt_sections(self):
+        """Test that each skill's prompt gets its own titled section."""
+        a = Skill(name="doc_review", description="A", system_prompt="Review.")
+        b = Skill(name="pdf", description="B", system_prompt="Parse.")
+
+        combined = combine_skills(a, b)
+
+        assert combined.system_prompt == (
+            "You are a versatile assistant with multiple capabilities:\n\n"
+            "## Doc Review Capabilities\n\nReview.\n\n"
+            "## Pdf Capabilities\n\nParse."
+        )
+
+    def test_combine_skills_reuses_previous_result(self):
+        """Test that repeated combinations share work but not containers."""
+        tool_def = ToolDefinition(name="Read", description="", input_schema={})
+        a = Skill(name="a", description="A", system_prompt="...", tools=[tool_def])
+        b = Skill(name="b", description="B", system_prompt="...")
+
+        first = combine_skills(a, b)
+        first.metadata["combined_from"].append("c")
+        second = combine_skills(a, b)
+        b.tools = (ToolDefinition(name="Write", description="", input_schema={}),)
+        third = combine_skills(a, b)
+
+        assert second.system_prompt is first.system_prompt
+        assert second.tools == (tool_def,)
+        assert second.metadata == {"combined_from": ["a", "b"]}
+        assert [t.name for t in third.tools] == ["Read", "Write"]
+        assert combine_skills(a, b, name="custom").name == "custom"
+
+
 class TestSkillTool:
     """Test SkillTool for LLM integration."""
 
@@ -304,6 +439,43 @@ class TestDiscoverSkills:
         for skill in skills:
             assert skill.metadata.get("bundled") is not True
 
+    def test_discover_keeps_source_order(self, tmp_path, monkeypatch):
+        """Test that user skills win over project skills with the same name."""
+
+        def write_skill(skills_dir, dir_name, name, body):
+            skill_dir = skills_dir / dir_name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\n---\n{body}")
+
+        home = tmp_path / "home"
+        user_dir = home / ".claude" / "skills"
+        project_dir = tmp_path / "project" / ".claude" / "skills"
+        write_skill(user_dir, "shared", "shared", "user")
+        for i in range(5):
+            write_skill(project_dir, f"p{i}", f"p{i}", "project")
+        write_skill(project_dir, "shared", "shared", "project")
+        monkeypatch.setattr(Path, "home", lambda: home)
+
+        skills = discover_skills(
+            cwd=tmp_path / "project", setting_sources=["user", "project"]
+        )
+
+        assert skills[0].name == "shared"
+        assert skills[0].system_prompt == "user"
+        assert sorted(s.name for s in skills[1:]) == [f"p{i}" for i in range(5)]
+
+    def test_failed_load_of_skills_dir_keeps_it_discoverable(self, tmp_path):
+        """Test that loading a directory without SKILL.md does not hide it."""
+        skills_dir = tmp_path / ".claude" / "skills"
+        (skills_dir / "demo").mkdir(parents=True)
+        (skills_dir / "demo" / "SKILL.md").write_text("---\nname: demo\n---\nHi")
+
+        with pytest.raises(FileNotFoundError):
+            Skill.from_file(skills_dir)
+        skills = discover_skills(setting_sources=["project"], cwd=tmp_path)
+
+        assert [s.name for s in skills] == ["demo"]
+
 
 class TestSkillFromFile:
     """Test loading skills from file."""
@@ -330,6 +502,45 @@ class TestSkillFromFile:
         with pytest.raises(FileNotFoundError):
             Skill.from_file("/nonexistent/path")
 
+    def test_missing_path_is_remembered_until_cleared(self, tmp_path):
+        """Test that a missing skill is not probed again until the cache clears."""
+        skill_dir = tmp_path / "later"
+        skill_dir.mkdir()
+
+        with pytest.raises(FileNotFoundError):
+            Skill.from_file(skill_dir)
+        (skill_dir / "SKILL.md").write_text("---\nname: later\n---\nHi")
+        with pytest.raises(FileNotFoundError):
+            Skill.from_file(skill_dir)
+
+        clear_skill_cache()
+
+        assert Skill.from_file(skill_dir).name == "later"
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Test that SKILL.md is only re-parsed after it changes."""
+        calls = []
+        parse = loader.parse_skill_md
+        monkeypatch.setattr(
+            loader,
+            "parse_skill_md",
+            lambda content, **kwargs: calls.append(content) or parse(content, **kwargs),
+        )
+        skill_file = tmp_path / "cached" / "SKILL.md"
+        skill_file.parent.mkdir()
+        skill_file.write_text("---\nname: cached\ntags: [a]\n---\nFirst")
+
+        first = Skill.from_file(skill_file.parent)
+        first.metadata["tags"].append("b")
+        second = loader.load_skill_from_path(skill_file.parent)
+        skill_file.write_text("---\nname: cached\ntags: [a]\n---\nSecond!")
+        third = Skill.from_file(skill_file)
+
+        assert len(calls) == 2
+        assert second.system_prompt == "First"
+        assert second.metadata["tags"] == ["a"]
+        assert third.system_prompt == "Second!"
+
 
 class TestSkillBaseDir:
     """Test {baseDir} substitution in skills."""
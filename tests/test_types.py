@@ -8,6 +8,7 @@ from universal_agent_sdk import (
 from universal_agent_sdk.types import (
     FinishReason,
     HookMatcher,
+    ImageBlock,
     MemoryEntry,
     PermissionResultAllow,
     PermissionResultDeny,
@@ -77,6 +78,25 @@ class TestContentBlocks:
         assert block.is_error is False
         assert block.type == "tool_result"
 
+    def test_image_block_base64_data(self):
+        """Test that the data URL prefix is stripped from the payload."""
+        block = ImageBlock(source="data:image/png;base64,AAAA")
+        assert block.base64_data == "AAAA"
+        assert block.base64_data is block.base64_data
+        assert ImageBlock(source="AAAA").base64_data == "AAAA"
+        assert block == ImageBlock(source="data:image/png;base64,AAAA")
+
+    def test_blocks_and_messages_are_slotted(self):
+        """Test that hot-path types carry no per-instance __dict__."""
+        for obj in (
+            TextBlock(text="hi"),
+            ToolUseBlock(id="t1", name="Read", input={}),
+            AssistantMessage(content=[]),
+            UserMessage(content="hi"),
+            Usage(),
+        ):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestMessageTypes:
     """Test message type creation and validation."""
@@ -165,6 +185,40 @@ class TestToolDefinition:
         )
         assert tool.handler is handler
 
+    def test_tool_definition_is_async(self):
+        """Test classification of sync and async handlers."""
+
+        class AsyncCallable:
+            async def __call__(self):
+                return "ok"
+
+        async def async_handler():
+            return "ok"
+
+        def make(handler):
+            return ToolDefinition(
+                name="t", description="", input_schema={}, handler=handler
+            )
+
+        assert make(async_handler).is_async
+        assert make(AsyncCallable()).is_async
+        assert make(AsyncCallable().__call__).is_async
+        assert not make(lambda: "ok").is_async
+        assert not make(None).is_async
+
+    def test_tool_definition_is_async_follows_handler(self):
+        """Test that reassigning the handler updates is_async."""
+
+        async def async_handler():
+            return "ok"
+
+        tool = ToolDefinition(name="t", description="", input_schema={})
+        assert not tool.is_async
+
+        tool.handler = async_handler
+
+        assert tool.is_async
+
 
 class TestAgentOptions:
     """Test AgentOptions configuration."""